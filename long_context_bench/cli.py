@@ -1,844 +1,63 @@
 """CLI entry point for long-context-bench."""
 
+import importlib
+
 import click
-from pathlib import Path
-from typing import Optional
 
 from long_context_bench import __version__
 
 
-@click.group()
+# Subcommand name -> "module:attribute". Modules are only imported when the
+# command is dispatched (or when --help needs its short description).
+_LAZY_COMMANDS = {
+    "sample": "long_context_bench.cli_commands.sample:sample",
+    "edit": "long_context_bench.cli_commands.edit:edit",
+    "judge": "long_context_bench.cli_commands.judge:judge",
+    "analyze-pr": "long_context_bench.cli_commands.analyze_pr:analyze_pr",
+    "head-to-head-pr": "long_context_bench.cli_commands.head_to_head:head_to_head_pr",
+    "pipeline": "long_context_bench.cli_commands.pipeline:pipeline",
+    "pipeline-parallel": "long_context_bench.cli_commands.pipeline:pipeline_parallel",
+    "stats": "long_context_bench.cli_commands.stats:stats",
+    "summary": "long_context_bench.cli_commands.stats:summary",
+    "compare": "long_context_bench.cli_commands.stats:compare",
+    "web": "long_context_bench.cli_commands.web:web",
+    "build-static": "long_context_bench.cli_commands.web:build_static",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on demand."""
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        # Commands are registered on first load, so repeat lookups (e.g. --help
+        # listing followed by dispatch) hit the plain dict in click.Group
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command '{cmd_name}' did not resolve to a click.Command")
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=_LAZY_COMMANDS)
 @click.version_option(version=__version__)
 def main() -> None:
     """Long-Context-Bench: Benchmark for evaluating long-context code editing capabilities."""
     pass
 
 
-@main.command()
-@click.argument("input_path", type=str)
-@click.option("--output-dir", type=click.Path(), default="data/samples", help="Output directory for samples")
-@click.option("--dataset-version", default="v0", help="Dataset version")
-@click.option("--github-token", envvar="GITHUB_GIT_TOKEN", help="GitHub token for API access")
-@click.option("--force", is_flag=True, help="Re-sample even if sample.json already exists")
-@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
-def sample(
-    input_path: str,
-    output_dir: str,
-    dataset_version: str,
-    github_token: Optional[str],
-    force: bool,
-    cache_dir: str,
-) -> None:
-    """Sample stage: Extract PR metadata and create sample.json files.
-
-    INPUT_PATH can be a PR URL, JSON file with PR URLs, or directory of samples.
-
-    By default, skips PRs that have already been sampled. Use --force to re-sample.
-    """
-    from long_context_bench.stages.sample import run_sample_stage
-
-    click.echo(f"Running sample stage on {input_path}")
-    run_sample_stage(
-        input_path=input_path,
-        output_dir=Path(output_dir),
-        dataset_version=dataset_version,
-        github_token=github_token,
-        force=force,
-        cache_dir=Path(cache_dir),
-    )
-    click.echo("Sample stage completed")
-
-
-@main.command()
-@click.argument("sample_path", type=click.Path(exists=True))
-@click.option("--runner", required=True, help="Agent runner name (e.g., auggie, claude-code)")
-@click.option("--model", required=True, help="Model name")
-@click.option("--agent-binary", type=click.Path(), help="Path to agent binary")
-@click.option("--output-dir", type=click.Path(), default="output/edits", help="Output directory for edits")
-@click.option("--timeout", type=int, default=1800, help="Timeout in seconds per task")
-@click.option("--concurrency", type=int, default=1, help="Max concurrent tasks")
-@click.option("--disable-retrieval", is_flag=True, help="Disable retrieval features")
-@click.option("--disable-shell", is_flag=True, help="Disable shell access")
-@click.option("--enable-mcp-codebase-qa", is_flag=True, help="Enable MCP codebase QA")
-@click.option("--mcp-config-path", type=click.Path(exists=True), help="Path to MCP configuration file (JSON)")
-@click.option("--dataset-version", default="v0", help="Dataset version")
-@click.option("--test-label", help="Optional label for grouping runs for comparison")
-@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
-@click.option("--force", is_flag=True, help="Re-run even if edit_summary.json already exists")
-@click.option("--use-synthesized", is_flag=True, help="Use synthesized task instructions instead of template-based")
-@click.option("--stream-output", is_flag=True, help="Stream agent output to console in real-time")
-def edit(
-    sample_path: str,
-    runner: str,
-    model: str,
-    agent_binary: Optional[str],
-    output_dir: str,
-    timeout: int,
-    concurrency: int,
-    disable_retrieval: bool,
-    disable_shell: bool,
-    enable_mcp_codebase_qa: bool,
-    mcp_config_path: Optional[str],
-    dataset_version: str,
-    test_label: Optional[str],
-    cache_dir: str,
-    force: bool,
-    use_synthesized: bool,
-    stream_output: bool,
-) -> None:
-    """Edit stage: Run agent on samples and capture diffs.
-
-    Creates a new edit run with a unique ID. All edits from this run will be
-    saved under output/edits/<runner>/<model>/<edit_run_id>/.
-
-    By default, skips PRs that have already been edited. Use --force to re-run.
-
-    Use --use-synthesized to use LLM-generated task instructions (if available in samples).
-
-    Use --stream-output to see agent output in real-time during execution.
-    """
-    from long_context_bench.stages.edit import run_edit_stage
-
-    click.echo(f"Running edit stage with runner={runner}, model={model}")
-    if test_label:
-        click.echo(f"Test label: {test_label}")
-    if use_synthesized:
-        click.echo("Using synthesized task instructions")
-    if stream_output:
-        click.echo("Streaming agent output enabled")
-    edit_run_id = run_edit_stage(
-        sample_path=Path(sample_path),
-        runner=runner,
-        model=model,
-        agent_binary=agent_binary,
-        output_dir=Path(output_dir),
-        timeout=timeout,
-        concurrency=concurrency,
-        disable_retrieval=disable_retrieval,
-        disable_shell=disable_shell,
-        enable_mcp_codebase_qa=enable_mcp_codebase_qa,
-        dataset_version=dataset_version,
-        test_label=test_label,
-        cache_dir=Path(cache_dir),
-        force=force,
-        use_synthesized=use_synthesized,
-        stream_output=stream_output,
-        mcp_config_path=mcp_config_path,
-    )
-    click.echo(f"Edit stage completed. Edit run ID: {edit_run_id}")
-
-
-@main.command()
-@click.option("--sample-path", type=click.Path(exists=True), help="Path to sample.json (for single file mode)")
-@click.option("--edit-path", type=click.Path(exists=True), help="Path to edit.json (for single file mode)")
-@click.option("--edit-run-ids", help="Comma-separated list of edit run IDs to evaluate (for batch mode)")
-@click.option("--judge-model", required=True, help="Judge model for Claude Code CLI (e.g., claude-sonnet-4-5, sonnet)")
-@click.option("--test-label", help="Optional label for grouping runs for comparison")
-@click.option("--output-dir", type=click.Path(), default="output", help="Base output directory (judges saved to output/judges/, edits read from output/edits/)")
-@click.option("--samples-dir", type=click.Path(exists=True), help="Samples directory (defaults to data/samples, falls back to output/samples)")
-@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
-@click.option("--force", is_flag=True, help="Re-judge even if judge.json already exists")
-@click.option("--concurrency", type=int, default=1, help="Number of concurrent judge tasks (default: 1)")
-@click.option("--resume-judge-run-id", help="Resume an existing judge run by ID (skips already-judged PRs)")
-def judge(
-    sample_path: Optional[str],
-    edit_path: Optional[str],
-    edit_run_ids: Optional[str],
-    judge_model: str,
-    test_label: Optional[str],
-    output_dir: str,
-    samples_dir: Optional[str],
-    cache_dir: str,
-    force: bool,
-    concurrency: int,
-    resume_judge_run_id: Optional[str],
-) -> None:
-    """Judge stage: Score agent edits against ground truth using Claude Code CLI.
-
-    Two modes:
-    1. Single file mode: Provide --sample-path and --edit-path
-    2. Batch mode: Provide --edit-run-ids to evaluate one or more complete edit runs
-
-    Creates a new judge run with a unique ID. All judgments from this run will be
-    saved under output/judges/llm/<judge_model>/<judge_run_id>/.
-
-    By default, skips PRs that have already been judged. Use --force to re-judge.
-    Use --resume-judge-run-id to continue an incomplete judge run.
-    """
-    from long_context_bench.stages.judge import run_judge_stage
-
-    # Parse edit run IDs if provided
-    edit_run_id_list = None
-    if edit_run_ids:
-        edit_run_id_list = [rid.strip() for rid in edit_run_ids.split(",")]
-
-    # Validate inputs
-    if not edit_run_id_list and (not sample_path or not edit_path):
-        click.echo("Error: Must provide either --edit-run-ids or both --sample-path and --edit-path")
-        return
-
-    click.echo(f"Running judge stage with model={judge_model}")
-    if resume_judge_run_id:
-        click.echo(f"Resuming judge run: {resume_judge_run_id}")
-    if edit_run_id_list:
-        click.echo(f"Evaluating edit runs: {', '.join(edit_run_id_list)}")
-    if test_label:
-        click.echo(f"Test label: {test_label}")
-
-    judge_run_id = run_judge_stage(
-        sample_path=Path(sample_path) if sample_path else None,
-        edit_path=Path(edit_path) if edit_path else None,
-        judge_model=judge_model,
-        output_dir=Path(output_dir),
-        edit_run_ids=edit_run_id_list,
-        test_label=test_label,
-        cache_dir=Path(cache_dir) if cache_dir else None,
-        force=force,
-        samples_dir=Path(samples_dir) if samples_dir else None,
-        concurrency=concurrency,
-        resume_judge_run_id=resume_judge_run_id,
-    )
-    click.echo(f"Judge stage completed. Judge run ID: {judge_run_id}")
-
-
-@main.command()
-@click.option("--pr-number", required=True, type=int, help="PR number to analyze")
-@click.option("--judge-model", required=True, help="Judge model for Claude Code CLI (e.g., claude-sonnet-4-5)")
-@click.option("--comparative/--no-comparative", default=True, help="Generate comparative analysis across agents")
-@click.option("--test-label", help="Optional label to filter edits by")
-@click.option("--output-dir", type=click.Path(), default="output", help="Output directory")
-@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
-@click.option("--force", is_flag=True, help="Re-analyze even if output exists")
-def analyze_pr(
-    pr_number: int,
-    judge_model: str,
-    comparative: bool,
-    test_label: Optional[str],
-    output_dir: str,
-    cache_dir: str,
-    force: bool,
-) -> None:
-    """Cross-agent analysis: Compare multiple agents' solutions for a single PR using Claude Code CLI.
-
-    This command finds all agent attempts for the specified PR (optionally filtered
-    by test_label), judges each one using Claude Code CLI, and optionally generates a comparative
-    analysis showing:
-    - Individual scores for each agent
-    - Side-by-side comparison of approaches
-    - Ranking and analysis (with --comparative)
-
-    Example:
-        long-context-bench analyze-pr --pr-number 114869 --test-label v0 \\
-            --judge-model claude-sonnet-4-5 --comparative
-    """
-    from long_context_bench.stages.cross_agent_analysis import run_cross_agent_analysis
-
-    click.echo(f"Running cross-agent analysis for PR {pr_number}")
-    if test_label:
-        click.echo(f"Test label filter: {test_label}")
-    click.echo(f"Judge model: {judge_model}")
-    if comparative:
-        click.echo(f"Comparative analysis: enabled")
-
-    analysis_run_id = run_cross_agent_analysis(
-        pr_number=pr_number,
-        output_dir=Path(output_dir),
-        judge_model=judge_model,
-        comparative=comparative,
-        test_label=test_label,
-        cache_dir=Path(cache_dir),
-        force=force,
-    )
-
-    if analysis_run_id:
-        click.echo(f"Cross-agent analysis completed. Analysis run ID: {analysis_run_id}")
-        click.echo(f"Results saved to: output/cross_agent_analysis/pr{pr_number}_{analysis_run_id}.json")
-    else:
-        click.echo("Cross-agent analysis failed")
-
-
-
-@main.command(name="head-to-head-pr")
-@click.option("--pr-number", required=True, type=int, help="PR number to evaluate")
-@click.option("--test-label", help="Optional label to filter edits by")
-@click.option(
-    "--judge-model",
-    required=True,
-    help="Judge model whose scores should be reused for scalar per-agent metrics (e.g., claude-sonnet-4-5)",
-)
-@click.option(
-    "--include-codebase-context/--no-codebase-context",
-    default=False,
-    help="Include codebase files from the base commit in agent judge prompts",
-)
-@click.option("--output-dir", type=click.Path(), default="output", help="Output root directory")
-@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
-@click.option("--force", is_flag=True, help="Re-run even if head-to-head result already exists")
-@click.option(
-    "--judge-runner",
-    default="claude-code",
-    show_default=True,
-    help="CLI agent runner to use as the pairwise judge (e.g., claude-code)",
-)
-@click.option(
-    "--judge-runner-model",
-    default="claude-sonnet-4-5",
-    show_default=True,
-    help="Model name passed to the pairwise judge runner (e.g., claude-sonnet-4-5)",
-)
-def head_to_head_pr(
-    pr_number: int,
-    test_label: Optional[str],
-    judge_model: str,
-    include_codebase_context: bool,
-    output_dir: str,
-    cache_dir: str,
-    force: bool,
-    judge_runner: str,
-    judge_runner_model: str,
-) -> None:
-    """Run head-to-head evaluation for a single PR across all agents.
-
-    This command finds all agent edits for the specified PR (optionally
-    filtered by test_label), reuses judge scores from the given JUDGE_MODEL
-    for scalar per-agent metrics when available, and runs pairwise comparisons
-    using a single dedicated CLI judge agent (configured via --judge-runner and
-    --judge-runner-model). Results are written as a HeadToHeadPRResult artifact
-    under output/head_to_head/.
-    """
-    from long_context_bench.stages.head_to_head import run_head_to_head_for_pr
-
-    click.echo(f"Running head-to-head evaluation for PR {pr_number}")
-    if test_label:
-        click.echo(f"Test label filter: {test_label}")
-    click.echo(f"Scalar judge model for per-agent scores: {judge_model}")
-    click.echo(f"Pairwise judge runner: {judge_runner} (model={judge_runner_model})")
-    if include_codebase_context:
-        click.echo("Including codebase context in prompts")
-
-    run_id = run_head_to_head_for_pr(
-        pr_number=pr_number,
-        output_dir=Path(output_dir),
-        judge_model=judge_model,
-        include_codebase_context=include_codebase_context,
-        test_label=test_label,
-        cache_dir=Path(cache_dir),
-        force=force,
-        judge_runner=judge_runner,
-        judge_runner_model=judge_runner_model,
-    )
-
-    if run_id:
-        click.echo(f"Head-to-head run completed. Run ID: {run_id}")
-        click.echo(
-            f"Results saved to: {Path(output_dir) / 'head_to_head' / f'pr{pr_number}_{run_id}.json'}"
-        )
-    else:
-        click.echo("Head-to-head evaluation failed or was skipped")
-
-
-@main.command()
-@click.option("--runner", required=True, help="Agent runner name")
-@click.option("--model", required=True, help="Model name")
-@click.option("--model-dir", help="Model directory name (defaults to model name, useful when model has special chars like 'custom:glm-4.6')")
-@click.option("--agent-binary", type=click.Path(), help="Path to agent binary")
-@click.option("--output-dir", type=click.Path(), default="output", help="Output root directory")
-@click.option("--dataset-version", default="v0", help="Dataset version")
-@click.option("--timeout", type=int, default=1800, help="Timeout in seconds per task")
-@click.option("--concurrency", type=int, default=1, help="Max concurrent tasks")
-@click.option("--total-shards", type=int, default=1, help="Total number of shards")
-@click.option("--shard-index", type=int, default=0, help="Current shard index (0-based)")
-@click.option("--judge-model", help="Judge model (optional, skips judge stage if not provided)")
-@click.option("--test-label", help="Optional label for grouping runs for comparison")
-@click.option("--github-token", envvar="GITHUB_GIT_TOKEN", help="GitHub token")
-@click.option("--disable-retrieval", is_flag=True, help="Disable retrieval features")
-@click.option("--disable-shell", is_flag=True, help="Disable shell access")
-@click.option("--enable-mcp-codebase-qa", is_flag=True, help="Enable MCP codebase QA")
-@click.option("--mcp-config-path", type=click.Path(exists=True), help="Path to MCP configuration file (JSON)")
-@click.option("--pr-numbers", help="Comma-separated list of PR numbers to run (e.g., '115001,114998')")
-@click.option("--pr-indices", help="Comma-separated list of PR indices to run (0-based, e.g., '0,1,2')")
-@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
-@click.option("--force", is_flag=True, help="Re-run all stages even if outputs already exist")
-@click.option("--stream-output", is_flag=True, help="Stream agent output to console in real-time")
-def pipeline(
-    runner: str,
-    model: str,
-    model_dir: Optional[str],
-    agent_binary: Optional[str],
-    output_dir: str,
-    dataset_version: str,
-    timeout: int,
-    concurrency: int,
-    total_shards: int,
-    shard_index: int,
-    judge_model: Optional[str],
-    test_label: Optional[str],
-    github_token: Optional[str],
-    disable_retrieval: bool,
-    disable_shell: bool,
-    enable_mcp_codebase_qa: bool,
-    mcp_config_path: Optional[str],
-    pr_numbers: Optional[str],
-    pr_indices: Optional[str],
-    cache_dir: str,
-    force: bool,
-    stream_output: bool,
-) -> None:
-    """Run complete pipeline: sample → edit → judge (optional).
-
-    By default, runs on the full v0 dataset (42 Elasticsearch PRs).
-    Use --pr-numbers or --pr-indices to run on specific PRs only.
-
-    The pipeline automatically resumes interrupted runs by skipping PRs that have
-    already been processed. Use --force to re-run all stages regardless.
-
-    If --judge-model is not provided, the judge stage will be skipped.
-    """
-    from long_context_bench.pipeline import run_pipeline
-
-    click.echo(f"Running complete pipeline on dataset {dataset_version}")
-    if test_label:
-        click.echo(f"Test label: {test_label}")
-    if judge_model:
-        click.echo(f"Judge model: {judge_model}")
-    else:
-        click.echo("Judge stage will be skipped (no judge model provided)")
-    if stream_output:
-        click.echo("Streaming agent output enabled")
-    run_pipeline(
-        runner=runner,
-        model=model,
-        model_dir=model_dir,
-        agent_binary=agent_binary,
-        output_dir=Path(output_dir),
-        dataset_version=dataset_version,
-        timeout=timeout,
-        concurrency=concurrency,
-        total_shards=total_shards,
-        shard_index=shard_index,
-        judge_model=judge_model,
-        test_label=test_label,
-        github_token=github_token,
-        disable_retrieval=disable_retrieval,
-        disable_shell=disable_shell,
-        enable_mcp_codebase_qa=enable_mcp_codebase_qa,
-        mcp_config_path=mcp_config_path,
-        pr_numbers=pr_numbers,
-        pr_indices=pr_indices,
-        cache_dir=Path(cache_dir),
-        force=force,
-        stream_output=stream_output,
-    )
-    click.echo("Pipeline completed")
-
-
-@main.command()
-@click.option("--agents", required=True, help="Agent configurations in format 'runner:model[:binary],runner:model[:binary],...' (e.g., 'auggie:claude-sonnet-4.5,claude-code:claude-sonnet-4.5')")
-@click.option("--output-dir", type=click.Path(), default="output", help="Output root directory")
-@click.option("--dataset-version", default="v0", help="Dataset version")
-@click.option("--timeout", type=int, default=1800, help="Timeout in seconds per task")
-@click.option("--concurrency", type=int, default=1, help="Max concurrent tasks")
-@click.option("--total-shards", type=int, default=1, help="Total number of shards")
-@click.option("--shard-index", type=int, default=0, help="Current shard index (0-based)")
-@click.option("--judge-mode", type=click.Choice(["deterministic", "llm"]), default="deterministic", help="Judge mode (llm uses Claude Code CLI)")
-@click.option("--judge-model", help="Judge model for Claude Code CLI (e.g., claude-sonnet-4-5)")
-@click.option("--test-label", help="Optional label for grouping runs for comparison")
-@click.option("--github-token", envvar="GITHUB_GIT_TOKEN", help="GitHub token")
-@click.option("--disable-retrieval", is_flag=True, help="Disable retrieval features")
-@click.option("--disable-shell", is_flag=True, help="Disable shell access")
-@click.option("--enable-mcp-codebase-qa", is_flag=True, help="Enable MCP codebase QA")
-@click.option("--pr-numbers", help="Comma-separated list of PR numbers to run (e.g., '115001,114998')")
-@click.option("--pr-indices", help="Comma-separated list of PR indices to run (0-based, e.g., '0,1,2')")
-@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
-@click.option("--force", is_flag=True, help="Re-run all stages even if outputs already exist")
-def pipeline_parallel(
-    agents: str,
-    output_dir: str,
-    dataset_version: str,
-    timeout: int,
-    concurrency: int,
-    total_shards: int,
-    shard_index: int,
-    judge_mode: str,
-    judge_model: Optional[str],
-    test_label: Optional[str],
-    github_token: Optional[str],
-    disable_retrieval: bool,
-    disable_shell: bool,
-    enable_mcp_codebase_qa: bool,
-    pr_numbers: Optional[str],
-    pr_indices: Optional[str],
-    cache_dir: str,
-    force: bool,
-) -> None:
-    """Run pipeline with multiple agents in parallel.
-
-    This command allows you to run multiple agents (e.g., Auggie and Claude Code)
-    in parallel on the same dataset for easy comparison.
-
-    Example:
-        long-context-bench pipeline-parallel \\
-            --agents "auggie:claude-sonnet-4.5,claude-code:claude-sonnet-4.5" \\
-            --pr-indices "0,1,2"
-
-    Each agent runs in its own isolated workspace and writes to separate output directories.
-    The sample stage is shared (run once), but edit and judge stages run in parallel per agent.
-    """
-    from long_context_bench.pipeline import run_pipeline
-
-    # Parse agent configurations
-    agent_configs = []
-    for agent_spec in agents.split(","):
-        parts = agent_spec.strip().split(":")
-        if len(parts) < 2:
-            click.echo(f"Error: Invalid agent spec '{agent_spec}'. Expected format: 'runner:model[:binary]'", err=True)
-            return
-
-        config = {
-            "runner": parts[0],
-            "model": parts[1],
-        }
-        if len(parts) >= 3:
-            config["agent_binary"] = parts[2]
-
-        agent_configs.append(config)
-
-    click.echo(f"Running pipeline with {len(agent_configs)} agents in parallel:")
-    for i, cfg in enumerate(agent_configs, 1):
-        binary_info = f" (binary: {cfg['agent_binary']})" if "agent_binary" in cfg else ""
-        click.echo(f"  {i}. {cfg['runner']} / {cfg['model']}{binary_info}")
-
-    if test_label:
-        click.echo(f"Test label: {test_label}")
-
-    run_pipeline(
-        runner=None,  # Not used when agent_configs is provided
-        model=None,   # Not used when agent_configs is provided
-        agent_binary=None,  # Not used when agent_configs is provided
-        output_dir=Path(output_dir),
-        dataset_version=dataset_version,
-        timeout=timeout,
-        concurrency=concurrency,
-        total_shards=total_shards,
-        shard_index=shard_index,
-        judge_mode=judge_mode,
-        judge_model=judge_model,
-        test_label=test_label,
-        github_token=github_token,
-        disable_retrieval=disable_retrieval,
-        disable_shell=disable_shell,
-        enable_mcp_codebase_qa=enable_mcp_codebase_qa,
-        pr_numbers=pr_numbers,
-        pr_indices=pr_indices,
-        cache_dir=Path(cache_dir),
-        force=force,
-        agent_configs=agent_configs,
-    )
-    click.echo("Pipeline completed")
-
-
-@main.command()
-@click.argument("results_dir", type=click.Path(exists=True))
-@click.option("--output-file", type=click.Path(), help="Output file for stats")
-def stats(results_dir: str, output_file: Optional[str]) -> None:
-    """Generate aggregate statistics from results."""
-    from long_context_bench.stats import generate_stats
-
-    click.echo(f"Generating stats from {results_dir}")
-    generate_stats(
-        results_dir=Path(results_dir),
-        output_file=Path(output_file) if output_file else None,
-    )
-    click.echo("Stats generation completed")
-
-
-@main.command()
-@click.argument("results_dir", type=click.Path(exists=True))
-@click.option("--edit-run-id", help="Edit run ID to generate summary for")
-@click.option("--judge-run-id", help="Judge run ID to generate summary for")
-@click.option("--output-dir", type=click.Path(), help="Output directory for summary files")
-def summary(
-    results_dir: str,
-    edit_run_id: Optional[str],
-    judge_run_id: Optional[str],
-    output_dir: Optional[str],
-) -> None:
-    """Generate summary for specific edit/judge runs.
-
-    Use --edit-run-id to filter edits by a specific edit run.
-    Use --judge-run-id to filter judges by a specific judge run.
-    """
-    from long_context_bench.stats import generate_summary_for_runs
-
-    click.echo(f"Generating summary from {results_dir}")
-    generate_summary_for_runs(
-        results_dir=Path(results_dir),
-        edit_run_id=edit_run_id,
-        judge_run_id=judge_run_id,
-        output_dir=Path(output_dir) if output_dir else None,
-    )
-    click.echo("Summary generation completed")
-
-
-@main.command()
-@click.argument("results_dir", type=click.Path(exists=True))
-@click.argument("test_label")
-@click.option("--output-file", type=click.Path(), help="Output file for comparison report (.json or .csv)")
-@click.option("--format", type=click.Choice(["comparison", "leaderboard", "head-to-head"]), default="comparison",
-              help="Output format: comparison (side-by-side), leaderboard (ranked), or head-to-head")
-@click.option("--rank-by", default="mean_aggregate",
-              help="Metric to rank by (mean_aggregate, success_rate, tasks_per_hour, etc.)")
-def compare(results_dir: str, test_label: str, output_file: Optional[str], format: str, rank_by: str) -> None:
-    """Generate comparison or leaderboard for runs with the same test label.
-
-    This command finds all edit and judge runs with the specified test label,
-    groups them by runner/model, and generates either a side-by-side comparison
-    or a ranked leaderboard.
-
-    Examples:
-        # Side-by-side comparison
-        long-context-bench compare output/ "sonnet-4.5-comparison" --output-file comparison.csv
-
-        # Leaderboard ranked by aggregate score
-        long-context-bench compare output/ "v0-leaderboard" --format leaderboard --output-file leaderboard.csv
-
-        # Leaderboard ranked by success rate
-        long-context-bench compare output/ "v0-leaderboard" --format leaderboard --rank-by success_rate
-    """
-    from long_context_bench.stats import generate_comparison, generate_head_to_head_summary
-
-    click.echo(f"Generating {format} for test label: {test_label}")
-
-    if format == "head-to-head":
-        generate_head_to_head_summary(
-            results_dir=Path(results_dir),
-            test_label=test_label,
-            output_file=Path(output_file) if output_file else None,
-        )
-    else:
-        generate_comparison(
-            results_dir=Path(results_dir),
-            test_label=test_label,
-            output_file=Path(output_file) if output_file else None,
-            format=format,
-            rank_by=rank_by,
-        )
-
-    click.echo(f"{format.capitalize()} generation completed")
-
-
-@main.command()
-@click.argument("output_dir", type=click.Path(exists=True), default="output")
-@click.option("--port", type=int, default=3000, help="Port to run the web server on")
-@click.option("--no-server", is_flag=True, help="Only deploy web files, don't start server")
-def web(output_dir: str, port: int, no_server: bool) -> None:
-    """Deploy and optionally start the web UI.
-
-    This command:
-    1. Deploys the web app files to OUTPUT_DIR/web/
-    2. Optionally starts a local web server at http://localhost:PORT
-
-    Examples:
-
-        # Deploy and start server on port 3000 (default)
-        long-context-bench web output
-
-        # Deploy only (no server)
-        long-context-bench web output --no-server
-
-        # Start on a different port
-        long-context-bench web output --port 8080
-    """
-    from long_context_bench.stats import deploy_web_app
-    import subprocess
-    import os
-
-    output_path = Path(output_dir)
-    web_dir = output_path / "web"
-
-    # Deploy web app (deploy_web_app prints its own success message)
-    click.echo(f"Deploying web app to {web_dir}...")
-    deploy_web_app(output_path)
-
-    if no_server:
-        click.echo("\nTo start the server manually:")
-        click.echo(f"  cd {web_dir} && npm install && npm start")
-        return
-
-    # Check if npm is installed
-    try:
-        subprocess.run(["npm", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        click.echo("\n⚠ npm not found. To start the server manually:")
-        click.echo(f"  cd {web_dir} && npm install && npm start")
-        return
-
-    # Install dependencies if needed
-    if not (web_dir / "node_modules").exists():
-        click.echo("Installing dependencies...")
-        subprocess.run(["npm", "install"], cwd=web_dir, check=True)
-
-    # Start the server
-    click.echo(f"\n🚀 Starting web server at http://localhost:{port}")
-    click.echo("   Press Ctrl+C to stop\n")
-
-    env = os.environ.copy()
-    env["PORT"] = str(port)
-
-    try:
-        subprocess.run(["npm", "start"], cwd=web_dir, env=env)
-    except KeyboardInterrupt:
-        click.echo("\n\n✓ Server stopped")
-
-
-@main.command("build-static")
-@click.argument("output_dir", type=click.Path(exists=True), default="output")
-@click.argument("dist_dir", type=click.Path(), default="dist")
-@click.option("-q", "--quiet", is_flag=True, help="Suppress output")
-def build_static(output_dir: str, dist_dir: str, quiet: bool) -> None:
-    """Build static site for Cloudflare Pages deployment.
-
-    Creates a static build of the web UI that can be deployed to
-    Cloudflare Pages or any static hosting service.
-
-    \b
-    Arguments:
-        OUTPUT_DIR  Source output directory (default: output)
-        DIST_DIR    Destination directory (default: dist)
-
-    \b
-    Examples:
-        # Build static site
-        long-context-bench build-static output dist
-
-        # Deploy to Cloudflare Pages with Wrangler
-        npx wrangler pages deploy dist
-    """
-    from pathlib import Path
-    import shutil
-
-    output_path = Path(output_dir)
-    dist_path = Path(dist_dir)
-
-    # Clean and create dist directory
-    if dist_path.exists():
-        shutil.rmtree(dist_path)
-    dist_path.mkdir(parents=True)
-
-    if not quiet:
-        click.echo(f"Building static site from '{output_dir}' to '{dist_dir}'...")
-
-    MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB Cloudflare Pages limit
-
-    def copy_tree_selective(src: Path, dst: Path, patterns: list) -> tuple[int, int]:
-        """Copy directory tree, only including files matching patterns."""
-        copied = 0
-        skipped = 0
-        for src_file in src.rglob("*"):
-            if src_file.is_file() and src_file.name in patterns:
-                if src_file.stat().st_size > MAX_FILE_SIZE:
-                    skipped += 1
-                    continue
-                rel_path = src_file.relative_to(src)
-                dst_file = dst / rel_path
-                dst_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src_file, dst_file)
-                copied += 1
-        return copied, skipped
-
-    # 1. Copy web static files
-    web_src = output_path / "web"
-    if not web_src.exists():
-        web_src = Path(__file__).parent / "web"
-
-    static_files = ["index.html", "app.js", "data-loader.js", "charts.js", "styles.css"]
-    for fname in static_files:
-        src = web_src / fname
-        if src.exists():
-            shutil.copy2(src, dist_path / fname)
-            if not quiet:
-                click.echo(f"  Copied {fname}")
-
-    # 2. Copy index.json
-    index_file = output_path / "index.json"
-    if index_file.exists():
-        shutil.copy2(index_file, dist_path / "index.json")
-        if not quiet:
-            click.echo(f"  Copied index.json")
-
-    # 3. Copy summaries
-    summaries_src = output_path / "summaries"
-    if summaries_src.exists():
-        n, s = copy_tree_selective(summaries_src, dist_path / "summaries",
-                                   ["summary.json", "run_manifest.json"])
-        if not quiet and n > 0:
-            msg = f"  Copied {n} files from summaries/"
-            if s > 0:
-                msg += f" (skipped {s} >25MB)"
-            click.echo(msg)
-
-    # 4. Copy judges
-    judges_src = output_path / "judges"
-    if judges_src.exists():
-        n, s = copy_tree_selective(judges_src, dist_path / "judges",
-                                   ["judge.json", "judge_run_manifest.json"])
-        if not quiet and n > 0:
-            msg = f"  Copied {n} files from judges/"
-            if s > 0:
-                msg += f" (skipped {s} >25MB)"
-            click.echo(msg)
-
-    # 5. Copy edits
-    edits_src = output_path / "edits"
-    if edits_src.exists():
-        n, s = copy_tree_selective(edits_src, dist_path / "edits",
-                                   ["edit_summary.json", "edit.patch", "logs.jsonl", "edit_run_manifest.json"])
-        if not quiet and n > 0:
-            msg = f"  Copied {n} files from edits/"
-            if s > 0:
-                msg += f" (skipped {s} >25MB)"
-            click.echo(msg)
-
-    # 6. Copy samples (from output/samples or data/samples)
-    for samples_src in [output_path / "samples", Path("data/samples")]:
-        if samples_src.exists():
-            n, s = copy_tree_selective(samples_src, dist_path / "samples", ["sample.json"])
-            if not quiet and n > 0:
-                msg = f"  Copied {n} files from {samples_src}/"
-                if s > 0:
-                    msg += f" (skipped {s} >25MB)"
-                click.echo(msg)
-
-    # 7. Create _headers for Cloudflare Pages
-    headers_content = """/*
-  Access-Control-Allow-Origin: *
-  Cache-Control: public, max-age=3600
-  X-Robots-Tag: noindex, nofollow
-
-/*.json
-  Content-Type: application/json
-  Cache-Control: public, max-age=300
-
-/*.jsonl
-  Content-Type: application/x-ndjson
-  Cache-Control: public, max-age=300
-"""
-    (dist_path / "_headers").write_text(headers_content)
-
-    # 8. Create robots.txt to prevent indexing
-    robots_content = """User-agent: *
-Disallow: /
-"""
-    (dist_path / "robots.txt").write_text(robots_content)
-
-    # Count files
-    file_count = sum(1 for _ in dist_path.rglob("*") if _.is_file())
-    if not quiet:
-        click.echo(f"\n✓ Static build complete: {file_count} files in '{dist_dir}'")
-        click.echo(f"\nTo deploy to Cloudflare Pages:")
-        click.echo(f"  npx wrangler pages deploy {dist_dir}")
-
-
 if __name__ == "__main__":
     main()
-
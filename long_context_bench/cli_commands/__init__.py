@@ -0,0 +1,42 @@
+"""Click subcommands for the long-context-bench CLI, loaded lazily by `cli.main`."""
+
+import importlib
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable
+
+import click
+
+
+class CommaList(click.ParamType):
+    """Click parameter type for comma-separated values, e.g. ``--pr-indices 0,1,2``.
+
+    Items are stripped, empty items are dropped and each item is converted
+    with ``item_type``; the option value arrives as a tuple.
+    """
+
+    name = "comma_list"
+
+    def __init__(self, item_type: Callable[[str], Any] = str):
+        self.item_type = item_type
+
+    def convert(self, value: Any, param: click.Parameter | None, ctx: click.Context | None) -> tuple:
+        if isinstance(value, tuple):
+            return value
+        try:
+            return tuple(self.item_type(v.strip()) for v in value.split(",") if v.strip())
+        except ValueError:
+            self.fail(f"{value!r} is not a comma-separated list of {self.item_type.__name__} values", param, ctx)
+
+
+@lru_cache(maxsize=None)
+def load_stage(name: str) -> ModuleType:
+    """Import a stage module once per process.
+
+    Args:
+        name: Stage module name under long_context_bench.stages (e.g., "sample")
+
+    Returns:
+        The imported stage module
+    """
+    return importlib.import_module(f"long_context_bench.stages.{name}")
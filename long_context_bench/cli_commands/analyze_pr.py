@@ -0,0 +1,61 @@
+"""`analyze-pr` command: cross-agent analysis for a single PR."""
+
+import click
+from pathlib import Path
+from typing import Optional
+
+from long_context_bench.cli_commands import load_stage
+
+
+@click.command()
+@click.option("--pr-number", required=True, type=int, help="PR number to analyze")
+@click.option("--judge-model", required=True, help="Judge model for Claude Code CLI (e.g., claude-sonnet-4-5)")
+@click.option("--comparative/--no-comparative", default=True, help="Generate comparative analysis across agents")
+@click.option("--test-label", help="Optional label to filter edits by")
+@click.option("--output-dir", type=click.Path(), default="output", help="Output directory")
+@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
+@click.option("--force", is_flag=True, help="Re-analyze even if output exists")
+def analyze_pr(
+    pr_number: int,
+    judge_model: str,
+    comparative: bool,
+    test_label: Optional[str],
+    output_dir: str,
+    cache_dir: str,
+    force: bool,
+) -> None:
+    """Cross-agent analysis: Compare multiple agents' solutions for a single PR using Claude Code CLI.
+
+    This command finds all agent attempts for the specified PR (optionally filtered
+    by test_label), judges each one using Claude Code CLI, and optionally generates a comparative
+    analysis showing:
+    - Individual scores for each agent
+    - Side-by-side comparison of approaches
+    - Ranking and analysis (with --comparative)
+
+    Example:
+        long-context-bench analyze-pr --pr-number 114869 --test-label v0 \\
+            --judge-model claude-sonnet-4-5 --comparative
+    """
+    click.echo(f"Running cross-agent analysis for PR {pr_number}")
+    if test_label:
+        click.echo(f"Test label filter: {test_label}")
+    click.echo(f"Judge model: {judge_model}")
+    if comparative:
+        click.echo(f"Comparative analysis: enabled")
+
+    analysis_run_id = load_stage("cross_agent_analysis").run_cross_agent_analysis(
+        pr_number=pr_number,
+        output_dir=Path(output_dir),
+        judge_model=judge_model,
+        comparative=comparative,
+        test_label=test_label,
+        cache_dir=Path(cache_dir),
+        force=force,
+    )
+
+    if analysis_run_id:
+        click.echo(f"Cross-agent analysis completed. Analysis run ID: {analysis_run_id}")
+        click.echo(f"Results saved to: output/cross_agent_analysis/pr{pr_number}_{analysis_run_id}.json")
+    else:
+        click.echo("Cross-agent analysis failed")
@@ -0,0 +1,90 @@
+"""`edit` command: run an agent on samples and capture diffs."""
+
+import click
+from pathlib import Path
+from typing import Optional
+
+from long_context_bench.cli_commands import load_stage
+
+
+@click.command()
+@click.argument("sample_path", type=click.Path(exists=True))
+@click.option("--runner", required=True, help="Agent runner name (e.g., auggie, claude-code)")
+@click.option("--model", required=True, help="Model name")
+@click.option("--agent-binary", type=click.Path(), help="Path to agent binary")
+@click.option("--output-dir", type=click.Path(), default="output/edits", help="Output directory for edits")
+@click.option("--timeout", type=int, default=1800, help="Timeout in seconds per task")
+@click.option("--concurrency", type=int, default=1, help="Max concurrent tasks")
+@click.option("--total-shards", type=int, default=1, help="Total number of shards (when SAMPLE_PATH is a directory)")
+@click.option("--shard-index", type=int, default=0, help="Current shard index (0-based)")
+@click.option("--disable-retrieval", is_flag=True, help="Disable retrieval features")
+@click.option("--disable-shell", is_flag=True, help="Disable shell access")
+@click.option("--enable-mcp-codebase-qa", is_flag=True, help="Enable MCP codebase QA")
+@click.option("--mcp-config-path", type=click.Path(exists=True), help="Path to MCP configuration file (JSON)")
+@click.option("--dataset-version", default="v0", help="Dataset version")
+@click.option("--test-label", help="Optional label for grouping runs for comparison")
+@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
+@click.option("--force", is_flag=True, help="Re-run even if edit_summary.json already exists")
+@click.option("--use-synthesized", is_flag=True, help="Use synthesized task instructions instead of template-based")
+@click.option("--stream-output", is_flag=True, help="Stream agent output to console in real-time")
+def edit(
+    sample_path: str,
+    runner: str,
+    model: str,
+    agent_binary: Optional[str],
+    output_dir: str,
+    timeout: int,
+    concurrency: int,
+    total_shards: int,
+    shard_index: int,
+    disable_retrieval: bool,
+    disable_shell: bool,
+    enable_mcp_codebase_qa: bool,
+    mcp_config_path: Optional[str],
+    dataset_version: str,
+    test_label: Optional[str],
+    cache_dir: str,
+    force: bool,
+    use_synthesized: bool,
+    stream_output: bool,
+) -> None:
+    """Edit stage: Run agent on samples and capture diffs.
+
+    Creates a new edit run with a unique ID. All edits from this run will be
+    saved under output/edits/<runner>/<model>/<edit_run_id>/.
+
+    By default, skips PRs that have already been edited. Use --force to re-run.
+
+    Use --use-synthesized to use LLM-generated task instructions (if available in samples).
+
+    Use --stream-output to see agent output in real-time during execution.
+    """
+    click.echo(f"Running edit stage with runner={runner}, model={model}")
+    if test_label:
+        click.echo(f"Test label: {test_label}")
+    if use_synthesized:
+        click.echo("Using synthesized task instructions")
+    if stream_output:
+        click.echo("Streaming agent output enabled")
+    edit_run_id = load_stage("edit").run_edit_stage(
+        sample_path=Path(sample_path),
+        runner=runner,
+        model=model,
+        agent_binary=agent_binary,
+        output_dir=Path(output_dir),
+        timeout=timeout,
+        concurrency=concurrency,
+        total_shards=total_shards,
+        shard_index=shard_index,
+        disable_retrieval=disable_retrieval,
+        disable_shell=disable_shell,
+        enable_mcp_codebase_qa=enable_mcp_codebase_qa,
+        dataset_version=dataset_version,
+        test_label=test_label,
+        cache_dir=Path(cache_dir),
+        force=force,
+        use_synthesized=use_synthesized,
+        stream_output=stream_output,
+        mcp_config_path=mcp_config_path,
+    )
+    click.echo(f"Edit stage completed. Edit run ID: {edit_run_id}")
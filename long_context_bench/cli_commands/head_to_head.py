@@ -0,0 +1,84 @@
+"""`head-to-head-pr` command: pairwise agent evaluation for a single PR."""
+
+import click
+from pathlib import Path
+from typing import Optional
+
+from long_context_bench.cli_commands import load_stage
+
+
+@click.command(name="head-to-head-pr")
+@click.option("--pr-number", required=True, type=int, help="PR number to evaluate")
+@click.option("--test-label", help="Optional label to filter edits by")
+@click.option(
+    "--judge-model",
+    required=True,
+    help="Judge model whose scores should be reused for scalar per-agent metrics (e.g., claude-sonnet-4-5)",
+)
+@click.option(
+    "--include-codebase-context/--no-codebase-context",
+    default=False,
+    help="Include codebase files from the base commit in agent judge prompts",
+)
+@click.option("--output-dir", type=click.Path(), default="output", help="Output root directory")
+@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
+@click.option("--force", is_flag=True, help="Re-run even if head-to-head result already exists")
+@click.option(
+    "--judge-runner",
+    default="claude-code",
+    show_default=True,
+    help="CLI agent runner to use as the pairwise judge (e.g., claude-code)",
+)
+@click.option(
+    "--judge-runner-model",
+    default="claude-sonnet-4-5",
+    show_default=True,
+    help="Model name passed to the pairwise judge runner (e.g., claude-sonnet-4-5)",
+)
+def head_to_head_pr(
+    pr_number: int,
+    test_label: Optional[str],
+    judge_model: str,
+    include_codebase_context: bool,
+    output_dir: str,
+    cache_dir: str,
+    force: bool,
+    judge_runner: str,
+    judge_runner_model: str,
+) -> None:
+    """Run head-to-head evaluation for a single PR across all agents.
+
+    This command finds all agent edits for the specified PR (optionally
+    filtered by test_label), reuses judge scores from the given JUDGE_MODEL
+    for scalar per-agent metrics when available, and runs pairwise comparisons
+    using a single dedicated CLI judge agent (configured via --judge-runner and
+    --judge-runner-model). Results are written as a HeadToHeadPRResult artifact
+    under output/head_to_head/.
+    """
+    click.echo(f"Running head-to-head evaluation for PR {pr_number}")
+    if test_label:
+        click.echo(f"Test label filter: {test_label}")
+    click.echo(f"Scalar judge model for per-agent scores: {judge_model}")
+    click.echo(f"Pairwise judge runner: {judge_runner} (model={judge_runner_model})")
+    if include_codebase_context:
+        click.echo("Including codebase context in prompts")
+
+    run_id = load_stage("head_to_head").run_head_to_head_for_pr(
+        pr_number=pr_number,
+        output_dir=Path(output_dir),
+        judge_model=judge_model,
+        include_codebase_context=include_codebase_context,
+        test_label=test_label,
+        cache_dir=Path(cache_dir),
+        force=force,
+        judge_runner=judge_runner,
+        judge_runner_model=judge_runner_model,
+    )
+
+    if run_id:
+        click.echo(f"Head-to-head run completed. Run ID: {run_id}")
+        click.echo(
+            f"Results saved to: {Path(output_dir) / 'head_to_head' / f'pr{pr_number}_{run_id}.json'}"
+        )
+    else:
+        click.echo("Head-to-head evaluation failed or was skipped")
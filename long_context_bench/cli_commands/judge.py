@@ -0,0 +1,75 @@
+"""`judge` command: score agent edits against ground truth."""
+
+import click
+from pathlib import Path
+from typing import Optional
+
+from long_context_bench.cli_commands import CommaList, load_stage
+
+
+@click.command()
+@click.option("--sample-path", type=click.Path(exists=True), help="Path to sample.json (for single file mode)")
+@click.option("--edit-path", type=click.Path(exists=True), help="Path to edit.json (for single file mode)")
+@click.option("--edit-run-ids", type=CommaList(), help="Comma-separated list of edit run IDs to evaluate (for batch mode)")
+@click.option("--judge-model", required=True, help="Judge model for Claude Code CLI (e.g., claude-sonnet-4-5, sonnet)")
+@click.option("--test-label", help="Optional label for grouping runs for comparison")
+@click.option("--output-dir", type=click.Path(), default="output", help="Base output directory (judges saved to output/judges/, edits read from output/edits/)")
+@click.option("--samples-dir", type=click.Path(exists=True), help="Samples directory (defaults to data/samples, falls back to output/samples)")
+@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
+@click.option("--force", is_flag=True, help="Re-judge even if judge.json already exists")
+@click.option("--concurrency", type=int, default=1, help="Number of concurrent judge tasks (default: 1)")
+@click.option("--resume-judge-run-id", help="Resume an existing judge run by ID (skips already-judged PRs)")
+def judge(
+    sample_path: Optional[str],
+    edit_path: Optional[str],
+    edit_run_ids: Optional[tuple[str, ...]],
+    judge_model: str,
+    test_label: Optional[str],
+    output_dir: str,
+    samples_dir: Optional[str],
+    cache_dir: str,
+    force: bool,
+    concurrency: int,
+    resume_judge_run_id: Optional[str],
+) -> None:
+    """Judge stage: Score agent edits against ground truth using Claude Code CLI.
+
+    Two modes:
+    1. Single file mode: Provide --sample-path and --edit-path
+    2. Batch mode: Provide --edit-run-ids to evaluate one or more complete edit runs
+
+    Creates a new judge run with a unique ID. All judgments from this run will be
+    saved under output/judges/llm/<judge_model>/<judge_run_id>/.
+
+    By default, skips PRs that have already been judged. Use --force to re-judge.
+    Use --resume-judge-run-id to continue an incomplete judge run.
+    """
+    edit_run_id_list = list(edit_run_ids) if edit_run_ids else None
+
+    # Validate inputs
+    if not edit_run_id_list and (not sample_path or not edit_path):
+        click.echo("Error: Must provide either --edit-run-ids or both --sample-path and --edit-path")
+        return
+
+    click.echo(f"Running judge stage with model={judge_model}")
+    if resume_judge_run_id:
+        click.echo(f"Resuming judge run: {resume_judge_run_id}")
+    if edit_run_id_list:
+        click.echo(f"Evaluating edit runs: {', '.join(edit_run_id_list)}")
+    if test_label:
+        click.echo(f"Test label: {test_label}")
+
+    judge_run_id = load_stage("judge").run_judge_stage(
+        sample_path=Path(sample_path) if sample_path else None,
+        edit_path=Path(edit_path) if edit_path else None,
+        judge_model=judge_model,
+        output_dir=Path(output_dir),
+        edit_run_ids=edit_run_id_list,
+        test_label=test_label,
+        cache_dir=Path(cache_dir) if cache_dir else None,
+        force=force,
+        samples_dir=Path(samples_dir) if samples_dir else None,
+        concurrency=concurrency,
+        resume_judge_run_id=resume_judge_run_id,
+    )
+    click.echo(f"Judge stage completed. Judge run ID: {judge_run_id}")
@@ -0,0 +1,40 @@
+"""`sample` command: extract PR metadata into sample.json files."""
+
+import click
+from pathlib import Path
+from typing import Optional
+
+from long_context_bench.cli_commands import load_stage
+
+
+@click.command()
+@click.argument("input_path", type=str)
+@click.option("--output-dir", type=click.Path(), default="data/samples", help="Output directory for samples")
+@click.option("--dataset-version", default="v0", help="Dataset version")
+@click.option("--github-token", envvar="GITHUB_GIT_TOKEN", help="GitHub token for API access")
+@click.option("--force", is_flag=True, help="Re-sample even if sample.json already exists")
+@click.option("--cache-dir", type=click.Path(), default=".repo_cache", help="Directory for caching cloned repositories")
+def sample(
+    input_path: str,
+    output_dir: str,
+    dataset_version: str,
+    github_token: Optional[str],
+    force: bool,
+    cache_dir: str,
+) -> None:
+    """Sample stage: Extract PR metadata and create sample.json files.
+
+    INPUT_PATH can be a PR URL, JSON file with PR URLs, or directory of samples.
+
+    By default, skips PRs that have already been sampled. Use --force to re-sample.
+    """
+    click.echo(f"Running sample stage on {input_path}")
+    load_stage("sample").run_sample_stage(
+        input_path=input_path,
+        output_dir=Path(output_dir),
+        dataset_version=dataset_version,
+        github_token=github_token,
+        force=force,
+        cache_dir=Path(cache_dir),
+    )
+    click.echo("Sample stage completed")
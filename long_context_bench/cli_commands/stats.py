@@ -0,0 +1,95 @@
+"""`stats`, `summary` and `compare` commands: report on completed runs."""
+
+import click
+from pathlib import Path
+from typing import Optional
+
+
+@click.command()
+@click.argument("results_dir", type=click.Path(exists=True))
+@click.option("--output-file", type=click.Path(), help="Output file for stats")
+def stats(results_dir: str, output_file: Optional[str]) -> None:
+    """Generate aggregate statistics from results."""
+    from long_context_bench.stats import generate_stats
+
+    click.echo(f"Generating stats from {results_dir}")
+    generate_stats(
+        results_dir=Path(results_dir),
+        output_file=Path(output_file) if output_file else None,
+    )
+    click.echo("Stats generation completed")
+
+
+@click.command()
+@click.argument("results_dir", type=click.Path(exists=True))
+@click.option("--edit-run-id", help="Edit run ID to generate summary for")
+@click.option("--judge-run-id", help="Judge run ID to generate summary for")
+@click.option("--output-dir", type=click.Path(), help="Output directory for summary files")
+def summary(
+    results_dir: str,
+    edit_run_id: Optional[str],
+    judge_run_id: Optional[str],
+    output_dir: Optional[str],
+) -> None:
+    """Generate summary for specific edit/judge runs.
+
+    Use --edit-run-id to filter edits by a specific edit run.
+    Use --judge-run-id to filter judges by a specific judge run.
+    """
+    from long_context_bench.stats import generate_summary_for_runs
+
+    click.echo(f"Generating summary from {results_dir}")
+    generate_summary_for_runs(
+        results_dir=Path(results_dir),
+        edit_run_id=edit_run_id,
+        judge_run_id=judge_run_id,
+        output_dir=Path(output_dir) if output_dir else None,
+    )
+    click.echo("Summary generation completed")
+
+
+@click.command()
+@click.argument("results_dir", type=click.Path(exists=True))
+@click.argument("test_label")
+@click.option("--output-file", type=click.Path(), help="Output file for comparison report (.json or .csv)")
+@click.option("--format", type=click.Choice(["comparison", "leaderboard", "head-to-head"]), default="comparison",
+              help="Output format: comparison (side-by-side), leaderboard (ranked), or head-to-head")
+@click.option("--rank-by", default="mean_aggregate",
+              help="Metric to rank by (mean_aggregate, success_rate, tasks_per_hour, etc.)")
+def compare(results_dir: str, test_label: str, output_file: Optional[str], format: str, rank_by: str) -> None:
+    """Generate comparison or leaderboard for runs with the same test label.
+
+    This command finds all edit and judge runs with the specified test label,
+    groups them by runner/model, and generates either a side-by-side comparison
+    or a ranked leaderboard.
+
+    Examples:
+        # Side-by-side comparison
+        long-context-bench compare output/ "sonnet-4.5-comparison" --output-file comparison.csv
+
+        # Leaderboard ranked by aggregate score
+        long-context-bench compare output/ "v0-leaderboard" --format leaderboard --output-file leaderboard.csv
+
+        # Leaderboard ranked by success rate
+        long-context-bench compare output/ "v0-leaderboard" --format leaderboard --rank-by success_rate
+    """
+    from long_context_bench.stats import generate_comparison, generate_head_to_head_summary
+
+    click.echo(f"Generating {format} for test label: {test_label}")
+
+    if format == "head-to-head":
+        generate_head_to_head_summary(
+            results_dir=Path(results_dir),
+            test_label=test_label,
+            output_file=Path(output_file) if output_file else None,
+        )
+    else:
+        generate_comparison(
+            results_dir=Path(results_dir),
+            test_label=test_label,
+            output_file=Path(output_file) if output_file else None,
+            format=format,
+            rank_by=rank_by,
+        )
+
+    click.echo(f"{format.capitalize()} generation completed")
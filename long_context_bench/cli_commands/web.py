@@ -0,0 +1,216 @@
+"""`web` and `build-static` commands: deploy and build the web UI."""
+
+import click
+from pathlib import Path
+
+
+@click.command()
+@click.argument("output_dir", type=click.Path(exists=True), default="output")
+@click.option("--port", type=int, default=3000, help="Port to run the web server on")
+@click.option("--no-server", is_flag=True, help="Only deploy web files, don't start server")
+def web(output_dir: str, port: int, no_server: bool) -> None:
+    """Deploy and optionally start the web UI.
+
+    This command:
+    1. Deploys the web app files to OUTPUT_DIR/web/
+    2. Optionally starts a local web server at http://localhost:PORT
+
+    Examples:
+
+        # Deploy and start server on port 3000 (default)
+        long-context-bench web output
+
+        # Deploy only (no server)
+        long-context-bench web output --no-server
+
+        # Start on a different port
+        long-context-bench web output --port 8080
+    """
+    from long_context_bench.stats import deploy_web_app
+    import subprocess
+    import os
+
+    output_path = Path(output_dir)
+    web_dir = output_path / "web"
+
+    # Deploy web app (deploy_web_app prints its own success message)
+    click.echo(f"Deploying web app to {web_dir}...")
+    deploy_web_app(output_path)
+
+    if no_server:
+        click.echo("\nTo start the server manually:")
+        click.echo(f"  cd {web_dir} && npm install && npm start")
+        return
+
+    # Check if npm is installed
+    try:
+        subprocess.run(["npm", "--version"], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        click.echo("\n⚠ npm not found. To start the server manually:")
+        click.echo(f"  cd {web_dir} && npm install && npm start")
+        return
+
+    # Install dependencies if needed
+    if not (web_dir / "node_modules").exists():
+        click.echo("Installing dependencies...")
+        subprocess.run(["npm", "install"], cwd=web_dir, check=True)
+
+    # Start the server
+    click.echo(f"\n🚀 Starting web server at http://localhost:{port}")
+    click.echo("   Press Ctrl+C to stop\n")
+
+    env = os.environ.copy()
+    env["PORT"] = str(port)
+
+    try:
+        subprocess.run(["npm", "start"], cwd=web_dir, env=env)
+    except KeyboardInterrupt:
+        click.echo("\n\n✓ Server stopped")
+
+
+@click.command("build-static")
+@click.argument("output_dir", type=click.Path(exists=True), default="output")
+@click.argument("dist_dir", type=click.Path(), default="dist")
+@click.option("-q", "--quiet", is_flag=True, help="Suppress output")
+def build_static(output_dir: str, dist_dir: str, quiet: bool) -> None:
+    """Build static site for Cloudflare Pages deployment.
+
+    Creates a static build of the web UI that can be deployed to
+    Cloudflare Pages or any static hosting service.
+
+    \b
+    Arguments:
+        OUTPUT_DIR  Source output directory (default: output)
+        DIST_DIR    Destination directory (default: dist)
+
+    \b
+    Examples:
+        # Build static site
+        long-context-bench build-static output dist
+
+        # Deploy to Cloudflare Pages with Wrangler
+        npx wrangler pages deploy dist
+    """
+    from pathlib import Path
+    import shutil
+
+    output_path = Path(output_dir)
+    dist_path = Path(dist_dir)
+
+    # Clean and create dist directory
+    if dist_path.exists():
+        shutil.rmtree(dist_path)
+    dist_path.mkdir(parents=True)
+
+    if not quiet:
+        click.echo(f"Building static site from '{output_dir}' to '{dist_dir}'...")
+
+    MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB Cloudflare Pages limit
+
+    def copy_tree_selective(src: Path, dst: Path, patterns: list) -> tuple[int, int]:
+        """Copy directory tree, only including files matching patterns."""
+        copied = 0
+        skipped = 0
+        for src_file in src.rglob("*"):
+            if src_file.is_file() and src_file.name in patterns:
+                if src_file.stat().st_size > MAX_FILE_SIZE:
+                    skipped += 1
+                    continue
+                rel_path = src_file.relative_to(src)
+                dst_file = dst / rel_path
+                dst_file.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(src_file, dst_file)
+                copied += 1
+        return copied, skipped
+
+    # 1. Copy web static files
+    web_src = output_path / "web"
+    if not web_src.exists():
+        web_src = Path(__file__).parent.parent / "web"
+
+    static_files = ["index.html", "app.js", "data-loader.js", "charts.js", "styles.css"]
+    for fname in static_files:
+        src = web_src / fname
+        if src.exists():
+            shutil.copy2(src, dist_path / fname)
+            if not quiet:
+                click.echo(f"  Copied {fname}")
+
+    # 2. Copy index.json
+    index_file = output_path / "index.json"
+    if index_file.exists():
+        shutil.copy2(index_file, dist_path / "index.json")
+        if not quiet:
+            click.echo(f"  Copied index.json")
+
+    # 3. Copy summaries
+    summaries_src = output_path / "summaries"
+    if summaries_src.exists():
+        n, s = copy_tree_selective(summaries_src, dist_path / "summaries",
+                                   ["summary.json", "run_manifest.json"])
+        if not quiet and n > 0:
+            msg = f"  Copied {n} files from summaries/"
+            if s > 0:
+                msg += f" (skipped {s} >25MB)"
+            click.echo(msg)
+
+    # 4. Copy judges
+    judges_src = output_path / "judges"
+    if judges_src.exists():
+        n, s = copy_tree_selective(judges_src, dist_path / "judges",
+                                   ["judge.json", "judge_run_manifest.json"])
+        if not quiet and n > 0:
+            msg = f"  Copied {n} files from judges/"
+            if s > 0:
+                msg += f" (skipped {s} >25MB)"
+            click.echo(msg)
+
+    # 5. Copy edits
+    edits_src = output_path / "edits"
+    if edits_src.exists():
+        n, s = copy_tree_selective(edits_src, dist_path / "edits",
+                                   ["edit_summary.json", "edit.patch", "logs.jsonl", "edit_run_manifest.json"])
+        if not quiet and n > 0:
+            msg = f"  Copied {n} files from edits/"
+            if s > 0:
+                msg += f" (skipped {s} >25MB)"
+            click.echo(msg)
+
+    # 6. Copy samples (from output/samples or data/samples)
+    for samples_src in [output_path / "samples", Path("data/samples")]:
+        if samples_src.exists():
+            n, s = copy_tree_selective(samples_src, dist_path / "samples", ["sample.json"])
+            if not quiet and n > 0:
+                msg = f"  Copied {n} files from {samples_src}/"
+                if s > 0:
+                    msg += f" (skipped {s} >25MB)"
+                click.echo(msg)
+
+    # 7. Create _headers for Cloudflare Pages
+    headers_content = """/*
+  Access-Control-Allow-Origin: *
+  Cache-Control: public, max-age=3600
+  X-Robots-Tag: noindex, nofollow
+
+/*.json
+  Content-Type: application/json
+  Cache-Control: public, max-age=300
+
+/*.jsonl
+  Content-Type: application/x-ndjson
+  Cache-Control: public, max-age=300
+"""
+    (dist_path / "_headers").write_text(headers_content)
+
+    # 8. Create robots.txt to prevent indexing
+    robots_content = """User-agent: *
+Disallow: /
+"""
+    (dist_path / "robots.txt").write_text(robots_content)
+
+    # Count files
+    file_count = sum(1 for _ in dist_path.rglob("*") if _.is_file())
+    if not quiet:
+        click.echo(f"\n✓ Static build complete: {file_count} files in '{dist_dir}'")
+        click.echo(f"\nTo deploy to Cloudflare Pages:")
+        click.echo(f"  npx wrangler pages deploy {dist_dir}")
@@ -1,11 +1,175 @@
 """Data models for long-context-bench artifacts."""
 
-from typing import Optional, List
-from pydantic import BaseModel, Field
+import os
+import sys
+import types
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cache, lru_cache
+from typing import Any, Iterable, Optional, List, Union, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from pydantic_core import from_json
+
+# Set LCB_TRUST_ARTIFACTS=1 to reload artifacts written by this harness without
+# validation (see FastLoad). CI and ingest paths leave it unset and validate.
+TRUST_ARTIFACTS = os.environ.get("LCB_TRUST_ARTIFACTS") == "1"
+
+# Shared by every model below. Artifacts are never modified after loading, and
+# each model's validator is only built the first time it is used, so commands
+# that touch a few models do not pay for building all of them at import.
+_ARTIFACT_CONFIG = ConfigDict(frozen=True, defer_build=True)
+
+# Identifier fields whose values repeat across thousands of loaded artifacts
+_INTERN_FIELDS = frozenset({
+    "runner", "model", "edit_run_id", "repo_url", "base_commit", "head_commit",
+    "test_label", "status", "agent_id", "submission_a_id", "submission_b_id",
+})
+
+
+@cache
+def _intern_fields_of(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(sorted(_INTERN_FIELDS.intersection(model_cls.model_fields)))
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Build nested models inside a trusted value; model_construct does not recurse."""
+    if value is None:
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct_model(annotation, value) if isinstance(value, dict) else value
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        models = [a for a in get_args(annotation) if isinstance(a, type) and issubclass(a, BaseModel)]
+        return _construct_value(models[0], value) if models else value
+    if origin is list and isinstance(value, list):
+        (item_type,) = get_args(annotation) or (Any,)
+        return [_construct_value(item_type, item) for item in value]
+    return value
+
+
+def _construct_model(model_cls: type[BaseModel], data: dict) -> BaseModel:
+    """model_construct ``model_cls`` from a dict, recursing into nested models."""
+    fields = model_cls.model_fields
+    values = {
+        name: _construct_value(fields[name].annotation, value)
+        for name, value in data.items()
+        if name in fields
+    }
+    instance = model_cls.model_construct(**values)
+    if isinstance(instance, InternStrings):
+        instance._intern_strings()
+    return instance
+
+
+class InternStrings:
+    """Mixin that interns repeated identifier strings (runner, model, ...).
+
+    A loaded results tree holds the same few runner/model/run ID strings on
+    every artifact; interning keeps one copy of each and makes dict lookups
+    on them pointer comparisons.
+    """
+
+    @model_validator(mode="after")
+    def _intern_strings(self):
+        values = self.__dict__
+        for name in _intern_fields_of(type(self)):
+            value = values[name]
+            if type(value) is str:
+                values[name] = sys.intern(value)
+        return self
+
+
+@lru_cache(maxsize=4096)
+def parse_agent_id(agent_id: str) -> tuple[str, str, str]:
+    """Split a ``runner:model[:edit_run_id]`` agent ID into its three parts.
+
+    Missing parts are empty strings; the parts are interned and results are
+    memoized, since the same few agent IDs recur on every PR.
+    """
+    runner, model, edit_run_id = (agent_id.split(":", 2) + ["", ""])[:3]
+    return sys.intern(runner), sys.intern(model), sys.intern(edit_run_id)
+
+
+@lru_cache(maxsize=8192)
+def aggregate_score(
+    correctness: float,
+    completeness: float,
+    code_reuse: float,
+    best_practices: float,
+    unsolicited_docs: float,
+) -> float:
+    """Aggregate score: the unweighted mean of the five main metrics.
+
+    Judges emit a small set of distinct score vectors (two-decimal values), so
+    results are memoized across artifacts.
+    """
+    return (correctness + completeness + code_reuse + best_practices + unsolicited_docs) / 5.0
+
+
+class FastLoad:
+    """Mixin for artifacts that are reloaded from files this harness wrote."""
+
+    @classmethod
+    def from_trusted(cls, data: dict):
+        """Build an instance from a dict without running validators.
+
+        Nested models (e.g. Scores, List[AgentResult]) are constructed too.
+        Unknown keys are dropped, as validation would.
+        """
+        return _construct_model(cls, data)
+
+    @classmethod
+    def load_json(cls, data: bytes):
+        """Load an artifact from JSON bytes.
+
+        Validates with the class's core validator unless
+        LCB_TRUST_ARTIFACTS=1, in which case the JSON is parsed and the model
+        built with from_trusted.
+        """
+        if TRUST_ARTIFACTS:
+            return cls.from_trusted(from_json(data))
+        # Same as model_validate_json, minus its Python-side argument handling
+        return cls.__pydantic_validator__.validate_json(data)
+
+    def dump_json(self) -> bytes:
+        """Serialize to indented JSON bytes for writing to disk.
+
+        Same output as model_dump_json(indent=2), without decoding it to str
+        and encoding it back to UTF-8.
+        """
+        return self.__pydantic_serializer__.to_json(self, indent=2)
+
+    @classmethod
+    def load_many(
+        cls, paths: Iterable[Union[str, os.PathLike]], executor: Optional[Executor] = None
+    ) -> list:
+        """Load artifact files concurrently with load_json.
+
+        File reads release the GIL, so results trees on slow or network
+        storage load in parallel. Results keep the order of ``paths``, and the
+        first file that fails to load raises.
+
+        Args:
+            paths: Files to load
+            executor: Thread pool to read on; a temporary one is used if omitted
+
+        Returns:
+            List of loaded models
+        """
+        def _load(path):
+            with open(path, "rb") as f:
+                return cls.load_json(f.read())
+
+        if executor is not None:
+            return list(executor.map(_load, paths))
+        with ThreadPoolExecutor() as pool:
+            return list(pool.map(_load, paths))
 
 
 class SampleStats(BaseModel):
     """Statistics about a PR sample."""
+    model_config = _ARTIFACT_CONFIG
+
     files_changed: int
     lines_added: int
     lines_deleted: int
@@ -14,8 +178,10 @@ class SampleStats(BaseModel):
     truncated: bool
 
 
-class Sample(BaseModel):
+class Sample(FastLoad, InternStrings, BaseModel):
     """Sample artifact representing a PR task."""
+    model_config = _ARTIFACT_CONFIG
+
     dataset_version: str
     repo_url: str
     pr_number: int
@@ -30,8 +196,10 @@ class Sample(BaseModel):
     synthesis_timestamp: Optional[str] = None  # ISO timestamp of synthesis
 
 
-class Edit(BaseModel):
+class Edit(FastLoad, InternStrings, BaseModel):
     """Edit artifact representing agent output."""
+    model_config = _ARTIFACT_CONFIG
+
     repo_url: str
     pr_number: int
     base_commit: str
@@ -48,16 +216,35 @@ class Edit(BaseModel):
 
 
 class Scores(BaseModel):
-    """Evaluation scores for a single sample."""
+    """Evaluation scores for a single sample.
+
+    Immutable and hashable, so equal score vectors can be shared and used as
+    cache keys.
+    """
+    model_config = _ARTIFACT_CONFIG
+
     correctness: float = Field(ge=-1.0, le=1.0)
     completeness: float = Field(ge=-1.0, le=1.0)
     code_reuse: float = Field(ge=-1.0, le=1.0)
     best_practices: float = Field(ge=-1.0, le=1.0)
     unsolicited_docs: float = Field(ge=-1.0, le=1.0)
 
+    @property
+    def mean(self) -> float:
+        """Unweighted mean of the five scores (see aggregate_score)."""
+        return aggregate_score(
+            self.correctness,
+            self.completeness,
+            self.code_reuse,
+            self.best_practices,
+            self.unsolicited_docs,
+        )
 
-class Judge(BaseModel):
+
+class Judge(FastLoad, InternStrings, BaseModel):
     """Judge artifact representing evaluation results."""
+    model_config = _ARTIFACT_CONFIG
+
     repo_url: str
     pr_number: int
     base_commit: str
@@ -65,15 +252,66 @@ class Judge(BaseModel):
     judge_mode: str = "llm"  # Always 'llm' (kept for backward compatibility)
     judge_model: Optional[str] = None
     scores: Scores
-    aggregate: float = Field(ge=-1.0, le=1.0)
     rationale: Optional[str] = None
     edit_run_id: Optional[str] = None  # ID of the edit run being evaluated
     judge_run_id: Optional[str] = None  # ID of the judge run that produced this
     ground_truth_patch: Optional[str] = None  # Ground truth unified diff
 
+    @computed_field
+    @property
+    def aggregate(self) -> float:
+        """Mean of the five scores, in [-1.0, 1.0].
+
+        Derived on access rather than stored, so it can never disagree with
+        `scores`. It is still written to judge.json for the web dashboard, and
+        an `aggregate` key in older files (or passed to the constructor) is
+        ignored.
+        """
+        return self.scores.mean
+
+
+class EditLite(FastLoad, InternStrings, BaseModel):
+    """The fields of an Edit that summaries and reports read.
 
-class EditRunManifest(BaseModel):
+    Loading edit.json as EditLite skips building patch_unified, errors and
+    logs_path; the extra keys are ignored.
+    """
+    model_config = _ARTIFACT_CONFIG
+
+    repo_url: str
+    pr_number: int
+    runner: str
+    model: str
+    status: str  # success|timeout|error
+    elapsed_ms: int
+    edit_run_id: str
+    test_label: Optional[str] = None
+
+
+class JudgeLite(FastLoad, InternStrings, BaseModel):
+    """The fields of a Judge that summaries and reports read.
+
+    Loading judge.json as JudgeLite skips building rationale and
+    ground_truth_patch; the extra keys are ignored.
+    """
+    model_config = _ARTIFACT_CONFIG
+
+    repo_url: str
+    pr_number: int
+    scores: Scores
+    edit_run_id: Optional[str] = None
+    judge_run_id: Optional[str] = None
+
+    @property
+    def aggregate(self) -> float:
+        """Mean of the five scores, as in Judge.aggregate."""
+        return self.scores.mean
+
+
+class EditRunManifest(FastLoad, BaseModel):
     """Manifest for an edit run (attempt generation)."""
+    model_config = _ARTIFACT_CONFIG
+
     dataset_version: str
     harness_version: str
     runner: str
@@ -91,8 +329,10 @@ class EditRunManifest(BaseModel):
     test_label: Optional[str] = None  # Optional label for grouping runs for comparison
 
 
-class JudgeRunManifest(BaseModel):
+class JudgeRunManifest(FastLoad, BaseModel):
     """Manifest for a judge run (evaluation)."""
+    model_config = _ARTIFACT_CONFIG
+
     harness_version: str
     judge_mode: str = "llm"  # Always 'llm' (kept for backward compatibility)
     judge_model: Optional[str] = None
@@ -104,8 +344,10 @@ class JudgeRunManifest(BaseModel):
     test_label: Optional[str] = None  # Optional label for grouping runs for comparison
 
 
-class RunManifest(BaseModel):
+class RunManifest(FastLoad, BaseModel):
     """Manifest recording full provenance of a benchmark run (legacy/pipeline mode)."""
+    model_config = _ARTIFACT_CONFIG
+
     dataset_version: str
     harness_version: str
     runner: str
@@ -125,8 +367,10 @@ class RunManifest(BaseModel):
     test_label: Optional[str] = None  # Optional label for grouping runs for comparison
 
 
-class AggregateSummary(BaseModel):
+class AggregateSummary(FastLoad, BaseModel):
     """Aggregate summary statistics across all samples."""
+    model_config = _ARTIFACT_CONFIG
+
     run_id: str
     total_samples: int
     successful_samples: int
@@ -150,8 +394,10 @@ class AggregateSummary(BaseModel):
     model: Optional[str] = None  # Model name for comparison reports
 
 
-class AgentResult(BaseModel):
+class AgentResult(FastLoad, InternStrings, BaseModel):
     """Individual agent's result for cross-agent comparison."""
+    model_config = _ARTIFACT_CONFIG
+
     runner: str
     model: str
     edit_run_id: str
@@ -169,6 +415,8 @@ class AgentResult(BaseModel):
 
 class ComparativeAnalysis(BaseModel):
     """LLM-generated comparative analysis of multiple agents."""
+    model_config = _ARTIFACT_CONFIG
+
     summary: str  # Overall comparison summary
     best_agent: str  # Which agent performed best (runner:model)
     best_agent_reasoning: str  # Why this agent was best
@@ -176,8 +424,10 @@ class ComparativeAnalysis(BaseModel):
     ranking: List[str]  # Ordered list of agents (runner:model) from best to worst
 
 
-class CrossAgentJudge(BaseModel):
+class CrossAgentJudge(FastLoad, InternStrings, BaseModel):
     """Cross-agent comparison results for a single PR."""
+    model_config = _ARTIFACT_CONFIG
+
     repo_url: str
     pr_number: int
     base_commit: str
@@ -195,12 +445,13 @@ class CrossAgentJudge(BaseModel):
 
 
 
-class AgentVsHumanDecision(BaseModel):
+class AgentVsHumanDecision(InternStrings, BaseModel):
     """Individual agent judgment against human ground truth diff.
 
     This model stores the evaluation of a single agent's submission compared
     to the human diff, with detailed scores for each metric.
     """
+    model_config = _ARTIFACT_CONFIG
 
     # Identity
     repo_url: str
@@ -228,8 +479,13 @@ class AgentVsHumanDecision(BaseModel):
     timestamp: str
     codebase_context_files: Optional[List[str]] = None
 
+    @property
+    def agent_parts(self) -> tuple[str, str, str]:
+        """(runner, model, edit_run_id) parsed from agent_id."""
+        return parse_agent_id(self.agent_id)
 
-class PairwiseJudgeDecision(BaseModel):
+
+class PairwiseJudgeDecision(InternStrings, BaseModel):
     """Pairwise head-to-head judgment between two submissions on a PR.
 
     Submissions are identified by stable agent IDs (e.g. "runner:model:edit_run_id").
@@ -237,6 +493,7 @@ class PairwiseJudgeDecision(BaseModel):
     DEPRECATED: This model is kept for backward compatibility but new evaluations
     should use AgentVsHumanDecision instead.
     """
+    model_config = _ARTIFACT_CONFIG
 
     # Identity
     repo_url: str
@@ -265,8 +522,9 @@ class PairwiseJudgeDecision(BaseModel):
     codebase_context_files: Optional[List[str]] = None
 
 
-class HeadToHeadAgentStats(BaseModel):
+class HeadToHeadAgentStats(InternStrings, BaseModel):
     """Per-agent head-to-head stats for a single PR."""
+    model_config = _ARTIFACT_CONFIG
 
     agent_id: str  # runner:model:edit_run_id
     wins: int
@@ -274,12 +532,13 @@ class HeadToHeadAgentStats(BaseModel):
     ties: int
 
 
-class HeadToHeadPRResult(BaseModel):
+class HeadToHeadPRResult(FastLoad, InternStrings, BaseModel):
     """Head-to-head comparison results for a single PR.
 
     This model now stores individual agent-vs-human evaluations and derives
     win/loss/tie statistics by comparing agent scores.
     """
+    model_config = _ARTIFACT_CONFIG
 
     # PR/sample metadata
     repo_url: str
@@ -294,16 +553,23 @@ class HeadToHeadPRResult(BaseModel):
     agent_decisions: List[AgentVsHumanDecision]  # Individual agent-vs-human evaluations
     agent_stats: List[HeadToHeadAgentStats]  # Win/loss/tie derived from score comparisons
 
-    # Deprecated: kept for backward compatibility with old data
-    pairwise_decisions: Optional[List[PairwiseJudgeDecision]] = None
+    # Deprecated: kept for backward compatibility with old data. Stored raw so
+    # that loading new results never builds the PairwiseJudgeDecision schema;
+    # use legacy_pairwise_decisions() to read them.
+    pairwise_decisions: Optional[List[Any]] = None
 
     # Run metadata
     head_to_head_run_id: str
     timestamp: str
 
+    def legacy_pairwise_decisions(self) -> List[PairwiseJudgeDecision]:
+        """Validate and return the deprecated pairwise decisions, if any."""
+        return [PairwiseJudgeDecision.model_validate(d) for d in self.pairwise_decisions or []]
+
 
-class HeadToHeadAgentSummary(BaseModel):
+class HeadToHeadAgentSummary(InternStrings, BaseModel):
     """Cross-PR head-to-head summary for a single agent."""
+    model_config = _ARTIFACT_CONFIG
 
     agent_id: str  # runner:model[:edit_run_id] identifier used in comparisons
     runner: str
@@ -319,9 +585,15 @@ class HeadToHeadAgentSummary(BaseModel):
     elo_rating: float
     elo_uncertainty: Optional[float] = None
 
+    @property
+    def edit_run_id(self) -> str:
+        """Edit run ID parsed from agent_id, or "" if it has none."""
+        return parse_agent_id(self.agent_id)[2]
+
 
-class HeadToHeadGlobalSummary(BaseModel):
+class HeadToHeadGlobalSummary(FastLoad, BaseModel):
     """Global head-to-head summary across PRs for a test label."""
+    model_config = _ARTIFACT_CONFIG
 
     test_label: Optional[str] = None
     agents: List[HeadToHeadAgentSummary]
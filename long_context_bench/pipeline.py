@@ -1,30 +1,37 @@
 """Pipeline orchestration: sample → edit → judge."""
 
+import csv
 import json
 import hashlib
+import os
 import platform
+import queue
 import sys
+import traceback
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Sequence, Tuple, Union
 
 from rich.console import Console
 
 from long_context_bench import __version__
-from long_context_bench.models import RunManifest, EditRunManifest
+from long_context_bench.models import AggregateSummary, RunManifest, EditRunManifest
 from long_context_bench.stages.sample import run_sample_stage, sample_pr
-from long_context_bench.stages.edit import run_edit_on_sample, load_sample
-from long_context_bench.stages.judge import judge_edit
+from long_context_bench.stages.edit import run_edit_on_sample, _run_edit_on_sample_buffered, load_sample
+from long_context_bench.stages.judge import _judge_edit_buffered
 
 console = Console()
 
 
+@lru_cache(maxsize=8192)
 def compute_shard_hash(repo_url: str, pr_number: int) -> int:
     """Compute stable hash for sharding.
     
     Per R-4.8: Partition by stable hashing of (repo_url, pr_number).
+    Memoized, since every shard of a run hashes the same dataset.
     
     Args:
         repo_url: Repository URL
@@ -34,7 +41,8 @@ def compute_shard_hash(repo_url: str, pr_number: int) -> int:
         Hash value
     """
     key = f"{repo_url}:{pr_number}"
-    return int(hashlib.md5(key.encode()).hexdigest(), 16)
+    # Same value as int(hexdigest(), 16), without the hex round trip
+    return int.from_bytes(hashlib.md5(key.encode()).digest(), "big")
 
 
 def should_process_in_shard(
@@ -61,6 +69,33 @@ def should_process_in_shard(
     return (hash_val % total_shards) == shard_index
 
 
+def pr_in_shard(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    total_shards: int,
+    shard_index: int,
+) -> bool:
+    """Determine if a GitHub PR belongs to this shard.
+
+    Shared by the pipeline and the staged edit command so both pick the same
+    PRs for a given --total-shards/--shard-index.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        pr_number: PR number
+        total_shards: Total number of shards
+        shard_index: Current shard index (0-based)
+
+    Returns:
+        True if should process in this shard
+    """
+    return should_process_in_shard(
+        f"https://github.com/{owner}/{repo}", pr_number, total_shards, shard_index
+    )
+
+
 def get_dataset_path(dataset_version: str) -> Path:
     """Get path to built-in dataset file.
 
@@ -87,38 +122,56 @@ def get_dataset_path(dataset_version: str) -> Path:
     return dataset_path
 
 
+@lru_cache(maxsize=4)
+def _load_pr_url_tuple(dataset_version: str) -> Tuple[str, ...]:
+    """Read and parse the dataset file once per process (see load_pr_urls)."""
+    dataset_path = get_dataset_path(dataset_version)
+    return tuple(json.loads(dataset_path.read_bytes()))
+
+
 def load_pr_urls(dataset_version: str = "v0") -> List[str]:
     """Load PR URLs from built-in dataset.
 
+    The parsed dataset is cached per version, so repeated calls (e.g. when
+    sweeping shards in-process) don't re-read the file. Each call returns a
+    fresh list that callers may mutate.
+
     Args:
         dataset_version: Dataset version (e.g., 'v0')
 
     Returns:
         List of PR URLs
     """
-    dataset_path = get_dataset_path(dataset_version)
-    with open(dataset_path) as f:
-        return json.load(f)
+    return list(_load_pr_url_tuple(dataset_version))
+
+
+def _int_set(values: Union[str, Sequence[int]]) -> set[int]:
+    """Return a set of ints from a comma-separated string or a parsed sequence."""
+    if isinstance(values, str):
+        return {int(v) for v in values.split(",") if v.strip()}
+    return set(values)
 
 
 def filter_pr_urls(
     pr_urls: List[str],
-    pr_numbers: Optional[str] = None,
-    pr_indices: Optional[str] = None,
+    pr_numbers: Optional[Union[str, Sequence[int]]] = None,
+    pr_indices: Optional[Union[str, Sequence[int]]] = None,
 ) -> List[str]:
     """Filter PR URLs by numbers or indices.
 
     Args:
         pr_urls: List of all PR URLs
-        pr_numbers: Comma-separated PR numbers (e.g., '115001,114998')
-        pr_indices: Comma-separated indices (0-based, e.g., '0,1,2')
+        pr_numbers: PR numbers, as parsed by the CLI or comma-separated
+            (e.g., '115001,114998')
+        pr_indices: Indices (0-based), as parsed by the CLI or comma-separated
+            (e.g., '0,1,2')
 
     Returns:
         Filtered list of PR URLs
     """
     if pr_numbers:
         # Parse PR numbers
-        requested_numbers = set(int(n.strip()) for n in pr_numbers.split(","))
+        requested_numbers = _int_set(pr_numbers)
         # Extract PR number from URL and filter
         from long_context_bench.stages.sample import parse_pr_url
         filtered = []
@@ -130,7 +183,7 @@ def filter_pr_urls(
 
     if pr_indices:
         # Parse indices
-        requested_indices = set(int(i.strip()) for i in pr_indices.split(","))
+        requested_indices = _int_set(pr_indices)
         # Filter by index
         return [pr_urls[i] for i in requested_indices if i < len(pr_urls)]
 
@@ -142,7 +195,7 @@ def _run_single_agent(
     runner: str,
     model: str,
     agent_binary: Optional[str],
-    samples: List[Any],
+    samples: Iterable[Any],
     output_dir: Path,
     timeout: int,
     disable_retrieval: bool,
@@ -157,17 +210,22 @@ def _run_single_agent(
     stream_output: bool = False,
     mcp_config_path: Optional[str] = None,
     model_dir: Optional[str] = None,
+    concurrency: int = 1,
 ) -> Dict[str, Any]:
     """Run a single agent configuration on all samples.
 
     This function is designed to be run in parallel with other agents.
-    Each agent writes to its own isolated directory structure.
+    Each agent writes to its own isolated directory structure. Judging runs
+    in the background, one sample behind editing, so the agent can start on
+    the next sample while the previous edit is scored. With concurrency > 1,
+    up to that many samples are edited (and then judged) at once.
 
     Args:
         runner: Agent runner name
         model: Model name
         agent_binary: Optional agent binary path
-        samples: List of samples to process
+        samples: Samples to process; may be filled lazily while the sample
+            stage is still running
         output_dir: Output root directory
         timeout: Timeout in seconds
         disable_retrieval: Disable retrieval
@@ -180,6 +238,7 @@ def _run_single_agent(
         judge_model: Optional judge model
         dataset_version: Dataset version
         model_dir: Optional model directory name
+        concurrency: Max samples edited at once for this agent
 
     Returns:
         Dict with agent results including edits, judges, and summary
@@ -216,7 +275,7 @@ def _run_single_agent(
             os=platform.system(),
             python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
             timeout_s=timeout,
-            concurrency=1,
+            concurrency=concurrency,
             total_shards=1,
             shard_index=0,
             flags={
@@ -228,55 +287,100 @@ def _run_single_agent(
             edit_run_id=run_id,
             test_label=test_label,
         )
-        with open(manifest_file, "w") as f:
-            f.write(manifest.model_dump_json(indent=2))
+        manifest_file.write_bytes(manifest.dump_json())
         console.print(f"[green]Created manifest: {manifest_file}[/green]")
 
-    for sample in samples:
+    edit_kwargs = dict(
+        runner=runner,
+        model=model,
+        agent_binary=agent_binary,
+        output_dir=edits_dir,
+        timeout=timeout,
+        disable_retrieval=disable_retrieval,
+        disable_shell=disable_shell,
+        enable_mcp_codebase_qa=enable_mcp_codebase_qa,
+        run_id=run_id,
+        cache_dir=cache_dir,
+        force=force,
+        test_label=test_label,
+        stream_output=stream_output,
+        mcp_config_path=mcp_config_path,
+        model_dir=model_dir_name,
+    )
+    judge_kwargs = dict(
+        judge_model=judge_model,
+        output_dir=judges_dir,
+        judge_run_id=run_id,
+        cache_dir=cache_dir,
+        force=force,
+        test_label=test_label,
+    )
+
+    if concurrency > 1:
+        # Each worker edits then judges one sample, each stage's output
+        # flushed as one block; streamed agent output bypasses the console,
+        # so edits are only buffered without it
+        run_edit = run_edit_on_sample if stream_output else _run_edit_on_sample_buffered
+
+        def _edit_then_judge(sample: Any) -> Tuple[Optional[Any], Optional[Any]]:
+            try:
+                edit = run_edit(sample=sample, **edit_kwargs)
+            except Exception as e:
+                console.print(f"[red]✗ Pipeline failed for PR #{sample.pr_number} ({runner}/{model}): {e}[/red]")
+                console.print(f"[red]{traceback.format_exc()}[/red]")
+                return None, None
+            if not judge_model:
+                return edit, None
+            try:
+                return edit, _judge_edit_buffered(sample=sample, edit=edit, **judge_kwargs)
+            except Exception as e:
+                console.print(f"[red]✗ Pipeline failed for PR #{sample.pr_number} ({runner}/{model}): {e}[/red]")
+                return edit, None
+
+        console.print(f"\n[bold cyan]═══ Edit Stage ({runner}/{model_dir_name}, {concurrency} at a time) ═══[/bold cyan]")
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="edit") as executor:
+            # map() submits each sample as soon as the sample stage yields it
+            for edit, judge in executor.map(_edit_then_judge, samples):
+                if edit is not None:
+                    edits.append(edit)
+                if judge is not None:
+                    judges.append(judge)
+        if not judge_model:
+            console.print(f"\n[yellow]Skipping judge stage (no judge model provided)[/yellow]")
+        return {
+            "runner": runner,
+            "model": model,
+            "edits": edits,
+            "judges": judges,
+        }
+
+    judge_futures = []
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="judge") as judge_executor:
+        for sample in samples:
+            try:
+                # Edit stage
+                console.print(f"\n[bold cyan]═══ Edit Stage ({runner}/{model_dir_name}) ═══[/bold cyan]")
+                edit = run_edit_on_sample(sample=sample, **edit_kwargs)
+                edits.append(edit)
+
+                # Judge stage (optional), overlapped with the next sample's edit;
+                # its output is flushed as one block so it doesn't interleave
+                if judge_model:
+                    console.print(f"\n[bold cyan]═══ Judge Stage ({runner}/{model}) ═══[/bold cyan]")
+                    future = judge_executor.submit(_judge_edit_buffered, sample=sample, edit=edit, **judge_kwargs)
+                    judge_futures.append((sample, future))
+                else:
+                    console.print(f"\n[yellow]Skipping judge stage (no judge model provided)[/yellow]")
+
+            except Exception as e:
+                console.print(f"[red]✗ Pipeline failed for PR #{sample.pr_number} ({runner}/{model}): {e}[/red]")
+                console.print(f"[red]{traceback.format_exc()}[/red]")
+
+    for sample, future in judge_futures:
         try:
-            # Edit stage
-            console.print(f"\n[bold cyan]═══ Edit Stage ({runner}/{model_dir_name}) ═══[/bold cyan]")
-            edit = run_edit_on_sample(
-                sample=sample,
-                runner=runner,
-                model=model,
-                agent_binary=agent_binary,
-                output_dir=edits_dir,
-                timeout=timeout,
-                disable_retrieval=disable_retrieval,
-                disable_shell=disable_shell,
-                enable_mcp_codebase_qa=enable_mcp_codebase_qa,
-                run_id=run_id,
-                cache_dir=cache_dir,
-                force=force,
-                test_label=test_label,
-                stream_output=stream_output,
-                mcp_config_path=mcp_config_path,
-                model_dir=model_dir_name,
-            )
-            edits.append(edit)
-
-            # Judge stage (optional)
-            if judge_model:
-                console.print(f"\n[bold cyan]═══ Judge Stage ({runner}/{model}) ═══[/bold cyan]")
-                judge = judge_edit(
-                    sample=sample,
-                    edit=edit,
-                    judge_model=judge_model,
-                    output_dir=judges_dir,
-                    judge_run_id=run_id,
-                    cache_dir=cache_dir,
-                    force=force,
-                    test_label=test_label,
-                )
-                judges.append(judge)
-            else:
-                console.print(f"\n[yellow]Skipping judge stage (no judge model provided)[/yellow]")
-
+            judges.append(future.result())
         except Exception as e:
-            import traceback
             console.print(f"[red]✗ Pipeline failed for PR #{sample.pr_number} ({runner}/{model}): {e}[/red]")
-            console.print(f"[red]{traceback.format_exc()}[/red]")
 
     return {
         "runner": runner,
@@ -286,6 +390,108 @@ def _run_single_agent(
     }
 
 
+def _select_shard_prs(
+    pr_urls: List[str], total_shards: int, shard_index: int
+) -> List[Tuple[str, str, str, int]]:
+    """Parse PR URLs once and keep those that belong to this shard.
+
+    Unparseable URLs are reported and skipped. With a single shard every PR
+    is selected without hashing.
+
+    Args:
+        pr_urls: PR URLs to consider
+        total_shards: Total number of shards
+        shard_index: Current shard index (0-based)
+
+    Returns:
+        List of (pr_url, owner, repo, pr_number) in input order
+    """
+    from long_context_bench.stages.sample import parse_pr_url
+
+    selected = []
+    for url in pr_urls:
+        try:
+            owner, repo, pr_number = parse_pr_url(url)
+        except ValueError as e:
+            console.print(f"[yellow]Warning: Failed to parse {url}: {e}[/yellow]")
+            continue
+        if total_shards == 1 or pr_in_shard(owner, repo, pr_number, total_shards, shard_index):
+            selected.append((url, owner, repo, pr_number))
+    return selected
+
+
+def _iter_pipeline_samples(
+    shard_prs: List[Tuple[str, str, str, int]],
+    samples_dir: Path,
+    dataset_version: str,
+    github_token: Optional[str],
+    cache_dir: Path,
+    force: bool,
+    concurrency: int = 1,
+) -> Iterator[Any]:
+    """Yield samples for the given PRs as soon as each one is ready.
+
+    Pre-synthesized samples shipped under data/samples are preferred; other
+    PRs are loaded from or written to samples_dir. Up to ``concurrency`` PRs
+    are sampled at once (GitHub API calls and git fetches are I/O bound), in
+    which case samples are yielded in completion order so a slow clone does
+    not hold back edits for PRs that are already sampled. PRs that fail to
+    sample are reported and skipped.
+
+    Args:
+        shard_prs: (pr_url, owner, repo, pr_number) for each PR in this shard
+        samples_dir: Output directory for sampled PRs
+        dataset_version: Dataset version
+        github_token: Optional GitHub token
+        cache_dir: Directory for caching cloned repositories
+        force: If True, re-sample even if sample.json already exists
+        concurrency: Max PRs sampled at once
+
+    Yields:
+        Sample objects
+    """
+    from long_context_bench.stages.sample import get_pr_id
+
+    # Check for pre-synthesized samples in data/samples first
+    import long_context_bench
+    package_dir = Path(long_context_bench.__file__).parent.parent
+    builtin_samples_dir = package_dir / "data" / "samples" / dataset_version
+    # One directory listing instead of a stat per PR that has no built-in sample
+    try:
+        with os.scandir(builtin_samples_dir) as entries:
+            builtin_pr_ids = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        builtin_pr_ids = set()
+
+    def _sample_one(pr: Tuple[str, str, str, int]) -> Optional[Any]:
+        pr_url, owner, repo, pr_number = pr
+        try:
+            pr_id = get_pr_id(owner, repo, pr_number)
+
+            # First, try to load from built-in pre-synthesized samples
+            builtin_sample_file = builtin_samples_dir / pr_id / "sample.json"
+            if pr_id in builtin_pr_ids and builtin_sample_file.exists():
+                console.print(f"[green]✓ Loading pre-synthesized sample: {pr_id}[/green]")
+                return load_sample(builtin_sample_file)
+            # Fall back to sampling (will check output/samples or re-sample from GitHub)
+            return sample_pr(pr_url, samples_dir, dataset_version, github_token, cache_dir, force=force)
+        except Exception as e:
+            console.print(f"[red]✗ Sample failed for {pr_url}: {e}[/red]")
+            console.print(f"[red]{traceback.format_exc()}[/red]")
+            return None
+
+    if concurrency <= 1:
+        yield from filter(None, map(_sample_one, shard_prs))
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sample") as executor:
+        futures = [executor.submit(_sample_one, pr) for pr in shard_prs]
+        for future in as_completed(futures):
+            sample = future.result()
+            if sample is not None:
+                yield sample
+
+
 def run_pipeline(
     runner: str,
     model: str,
@@ -302,8 +508,8 @@ def run_pipeline(
     disable_retrieval: bool,
     disable_shell: bool,
     enable_mcp_codebase_qa: bool,
-    pr_numbers: Optional[str],
-    pr_indices: Optional[str],
+    pr_numbers: Optional[Sequence[int]],
+    pr_indices: Optional[Sequence[int]],
     cache_dir: Path,
     force: bool = False,
     stream_output: bool = False,
@@ -313,6 +519,10 @@ def run_pipeline(
 ) -> None:
     """Run complete pipeline: sample → edit → judge.
 
+    The stages overlap: each agent starts editing a PR as soon as its sample
+    is ready, while later PRs are still being sampled, and judging trails
+    editing by one PR.
+
     Args:
         runner: Runner name (used if agent_configs is None)
         model: Model name (used if agent_configs is None)
@@ -329,8 +539,8 @@ def run_pipeline(
         disable_retrieval: Disable retrieval
         disable_shell: Disable shell
         enable_mcp_codebase_qa: Enable MCP codebase QA
-        pr_numbers: Comma-separated PR numbers to run
-        pr_indices: Comma-separated PR indices to run
+        pr_numbers: PR numbers to run
+        pr_indices: PR indices (0-based) to run
         cache_dir: Directory for caching cloned repositories
         force: If True, re-run all stages even if outputs already exist
         mcp_config_path: Optional path to MCP configuration file
@@ -379,128 +589,82 @@ def run_pipeline(
         console.print(f"  Filtered to {len(pr_urls)} PRs based on selection")
 
     # Filter by shard
-    filtered_urls = []
-    for url in pr_urls:
-        from long_context_bench.stages.sample import parse_pr_url
-        try:
-            owner, repo, pr_number = parse_pr_url(url)
-            repo_url = f"https://github.com/{owner}/{repo}"
-            if should_process_in_shard(repo_url, pr_number, total_shards, shard_index):
-                filtered_urls.append(url)
-        except Exception as e:
-            console.print(f"[yellow]Warning: Failed to parse {url}: {e}[/yellow]")
+    shard_prs = _select_shard_prs(pr_urls, total_shards, shard_index)
 
-    console.print(f"[bold]Processing {len(filtered_urls)} PRs in this shard[/bold]\n")
+    console.print(f"[bold]Processing {len(shard_prs)} PRs in this shard[/bold]\n")
 
     # Sample stage (shared across all agents)
-    samples = []
     console.print(f"\n[bold cyan]═══ Sample Stage (shared) ═══[/bold cyan]")
-
-    # Check for pre-synthesized samples in data/samples first
-    import long_context_bench
-    package_dir = Path(long_context_bench.__file__).parent.parent
-    builtin_samples_dir = package_dir / "data" / "samples"
-
-    for pr_url in filtered_urls:
-        try:
-            from long_context_bench.stages.sample import parse_pr_url, get_pr_id
-            owner, repo, pr_number = parse_pr_url(pr_url)
-            pr_id = get_pr_id(owner, repo, pr_number)
-
-            # First, try to load from built-in pre-synthesized samples
-            builtin_sample_file = builtin_samples_dir / dataset_version / pr_id / "sample.json"
-            if builtin_sample_file.exists():
-                console.print(f"[green]✓ Loading pre-synthesized sample: {pr_id}[/green]")
-                with open(builtin_sample_file) as f:
-                    sample_data = json.load(f)
-                    from long_context_bench.models import Sample
-                    sample = Sample(**sample_data)
-                    samples.append(sample)
-                continue
-
-            # Fall back to sampling (will check output/samples or re-sample from GitHub)
-            sample = sample_pr(pr_url, samples_dir, dataset_version, github_token, cache_dir, force=force)
-            if sample:
-                samples.append(sample)
-        except Exception as e:
-            import traceback
-            console.print(f"[red]✗ Sample failed for {pr_url}: {e}[/red]")
-            console.print(f"[red]{traceback.format_exc()}[/red]")
-
-    if not samples:
+    sample_iter = _iter_pipeline_samples(
+        shard_prs, samples_dir, dataset_version, github_token, cache_dir, force, concurrency
+    )
+    first_sample = next(sample_iter, None)
+    if first_sample is None:
         console.print("[yellow]No samples to process[/yellow]")
         return
 
-    console.print(f"[bold green]Loaded {len(samples)} samples[/bold green]")
+    # Run agents in parallel, each consuming samples from its own queue as the
+    # sample stage produces them (None marks the end of the stream)
+    if len(agent_configs) > 1:
+        console.print(f"\n[bold magenta]Running {len(agent_configs)} agents in parallel[/bold magenta]")
 
-    # Run agents in parallel
+    samples = []
+    sample_queues = [queue.Queue() for _ in agent_configs]
     all_agent_results = []
 
-    if len(agent_configs) == 1:
-        # Single agent - no parallelization needed
-        cfg = agent_configs[0]
-        result = _run_single_agent(
-            runner=cfg["runner"],
-            model=cfg["model"],
-            agent_binary=cfg.get("agent_binary"),
-            samples=samples,
-            output_dir=output_dir,
-            timeout=timeout,
-            disable_retrieval=disable_retrieval,
-            disable_shell=disable_shell,
-            enable_mcp_codebase_qa=enable_mcp_codebase_qa,
-            run_id=run_id,
-            cache_dir=cache_dir,
-            force=force,
-            test_label=test_label,
-            judge_model=judge_model,
-            dataset_version=dataset_version,
-            stream_output=stream_output,
-            mcp_config_path=mcp_config_path,
-            model_dir=model_dir,
-        )
-        all_agent_results.append(result)
-    else:
-        # Multiple agents - run in parallel
-        console.print(f"\n[bold magenta]Running {len(agent_configs)} agents in parallel[/bold magenta]")
+    labels = [f"{cfg['runner']}/{cfg['model']}" for cfg in agent_configs]
+    with ThreadPoolExecutor(max_workers=len(agent_configs), thread_name_prefix="agent") as executor:
+        futures = [
+            executor.submit(
+                _run_single_agent,
+                runner=cfg["runner"],
+                model=cfg["model"],
+                agent_binary=cfg.get("agent_binary"),
+                samples=iter(sample_queue.get, None),
+                output_dir=output_dir,
+                timeout=timeout,
+                disable_retrieval=disable_retrieval,
+                disable_shell=disable_shell,
+                enable_mcp_codebase_qa=enable_mcp_codebase_qa,
+                run_id=run_id,
+                cache_dir=cache_dir,
+                force=force,
+                test_label=test_label,
+                judge_model=judge_model,
+                dataset_version=dataset_version,
+                stream_output=stream_output,
+                mcp_config_path=mcp_config_path,
+                model_dir=cfg.get("model_dir", model_dir),
+                concurrency=concurrency,
+            )
+            for cfg, sample_queue in zip(agent_configs, sample_queues)
+        ]
 
-        with ThreadPoolExecutor(max_workers=len(agent_configs)) as executor:
-            futures = {}
-            for cfg in agent_configs:
-                future = executor.submit(
-                    _run_single_agent,
-                    runner=cfg["runner"],
-                    model=cfg["model"],
-                    agent_binary=cfg.get("agent_binary"),
-                    samples=samples,
-                    output_dir=output_dir,
-                    timeout=timeout,
-                    disable_retrieval=disable_retrieval,
-                    disable_shell=disable_shell,
-                    enable_mcp_codebase_qa=enable_mcp_codebase_qa,
-                    run_id=run_id,
-                    cache_dir=cache_dir,
-                    force=force,
-                    test_label=test_label,
-                    judge_model=judge_model,
-                    dataset_version=dataset_version,
-                    stream_output=stream_output,
-                    mcp_config_path=mcp_config_path,
-                    model_dir=cfg.get("model_dir", model_dir),
-                )
-                futures[future] = f"{cfg['runner']}/{cfg['model']}"
-
-            # Wait for all agents to complete
-            for future in as_completed(futures):
-                agent_name = futures[future]
-                try:
-                    result = future.result()
-                    all_agent_results.append(result)
+        # Produce samples on this thread while the agents work
+        try:
+            samples.append(first_sample)
+            for sample_queue in sample_queues:
+                sample_queue.put(first_sample)
+            for sample in sample_iter:
+                samples.append(sample)
+                for sample_queue in sample_queues:
+                    sample_queue.put(sample)
+        finally:
+            for sample_queue in sample_queues:
+                sample_queue.put(None)
+
+        console.print(f"[bold green]Loaded {len(samples)} samples[/bold green]")
+
+        # Wait for all agents to complete; summaries need every result anyway
+        for future, agent_name in zip(futures, labels):
+            try:
+                result = future.result()
+                all_agent_results.append(result)
+                if len(agent_configs) > 1:
                     console.print(f"[bold green]✓ Agent {agent_name} completed[/bold green]")
-                except Exception as e:
-                    import traceback
-                    console.print(f"[red]✗ Agent {agent_name} failed: {e}[/red]")
-                    console.print(f"[red]{traceback.format_exc()}[/red]")
+            except Exception as e:
+                console.print(f"[red]✗ Agent {agent_name} failed: {e}[/red]")
+                console.print(f"[red]{traceback.format_exc()}[/red]")
 
     # Collect all edits and judges from all agents
     edits = []
@@ -513,78 +677,79 @@ def run_pipeline(
     console.print(f"\n[bold cyan]═══ Generating Summaries ═══[/bold cyan]")
 
     from long_context_bench.stats import compute_aggregate_summary
-    import pandas as pd
 
     all_summaries = []
+    summary_blobs = []
 
-    for result in all_agent_results:
-        agent_runner = result["runner"]
-        agent_model = result["model"]
-        agent_edits = result["edits"]
-        agent_judges = result["judges"]
-
-        # Create run manifest for this agent
-        manifest = RunManifest(
-            dataset_version=dataset_version,
-            harness_version=__version__,
-            runner=agent_runner,
-            runner_version=None,  # TODO: Get from adapter
-            model=agent_model,
-            judge_mode="llm" if judge_model else None,
-            judge_model=judge_model,
-            os=platform.system(),
-            python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            timeout_s=timeout,
-            concurrency=concurrency,
-            total_shards=total_shards,
-            shard_index=shard_index,
-            flags={
-                "disable_retrieval": disable_retrieval,
-                "disable_shell": disable_shell,
-                "enable_mcp_codebase_qa": enable_mcp_codebase_qa,
-            },
-            timestamp=datetime.utcnow().isoformat(),
-            run_id=run_id,
-            test_label=test_label,
-        )
-
-        manifest_file = summaries_dir / f"run_manifest_{agent_runner}_{agent_model}.json"
-        with open(manifest_file, "w") as f:
-            f.write(manifest.model_dump_json(indent=2))
+    # Combined CSV, one row per agent, written as each summary is computed
+    csv_file = summaries_dir / "summary.csv"
+    with open(csv_file, "w", newline="") as csv_f:
+        csv_writer = csv.DictWriter(csv_f, fieldnames=list(AggregateSummary.model_fields), lineterminator="\n")
+        csv_writer.writeheader()
+        for result in all_agent_results:
+            agent_runner = result["runner"]
+            agent_model = result["model"]
+            agent_edits = result["edits"]
+            agent_judges = result["judges"]
+
+            # Create run manifest for this agent
+            manifest = RunManifest(
+                dataset_version=dataset_version,
+                harness_version=__version__,
+                runner=agent_runner,
+                runner_version=None,  # TODO: Get from adapter
+                model=agent_model,
+                judge_mode="llm" if judge_model else None,
+                judge_model=judge_model,
+                os=platform.system(),
+                python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+                timeout_s=timeout,
+                concurrency=concurrency,
+                total_shards=total_shards,
+                shard_index=shard_index,
+                flags={
+                    "disable_retrieval": disable_retrieval,
+                    "disable_shell": disable_shell,
+                    "enable_mcp_codebase_qa": enable_mcp_codebase_qa,
+                },
+                timestamp=datetime.utcnow().isoformat(),
+                run_id=run_id,
+                test_label=test_label,
+            )
 
-        # Compute aggregate statistics for this agent
-        summary = compute_aggregate_summary(
-            run_id=run_id,
-            samples=samples,
-            edits=agent_edits,
-            judges=agent_judges,
-            test_label=test_label,
-            runner=agent_runner,
-            model=agent_model,
-        )
+            manifest_file = summaries_dir / f"run_manifest_{agent_runner}_{agent_model}.json"
+            manifest_file.write_bytes(manifest.dump_json())
 
-        summary_file = summaries_dir / f"summary_{agent_runner}_{agent_model}.json"
-        with open(summary_file, "w") as f:
-            f.write(summary.model_dump_json(indent=2))
+            # Compute aggregate statistics for this agent
+            summary = compute_aggregate_summary(
+                run_id=run_id,
+                samples=samples,
+                edits=agent_edits,
+                judges=agent_judges,
+                test_label=test_label,
+                runner=agent_runner,
+                model=agent_model,
+            )
 
-        all_summaries.append(summary)
+            # Serialized once; the same bytes are copied into the per-agent run dir below
+            summary_bytes = summary.dump_json()
+            summary_file = summaries_dir / f"summary_{agent_runner}_{agent_model}.json"
+            summary_file.write_bytes(summary_bytes)
 
-        console.print(f"  {agent_runner}/{agent_model}: {summary.success_rate:.1%} success, {summary.mean_aggregate:.2f} mean score")
+            all_summaries.append(summary)
+            summary_blobs.append(summary_bytes)
+            csv_writer.writerow(summary.model_dump())
 
-    # Write combined CSV
-    df = pd.DataFrame([s.model_dump() for s in all_summaries])
-    csv_file = summaries_dir / "summary.csv"
-    df.to_csv(csv_file, index=False)
+            console.print(f"  {agent_runner}/{agent_model}: {summary.success_rate:.1%} success, {summary.mean_aggregate:.2f} mean score")
 
     # For each agent, also create a separate run directory with summary.json
     # so it shows up in the web dashboard
-    for summary in all_summaries:
+    for summary, summary_bytes in zip(all_summaries, summary_blobs):
         agent_run_dir = summaries_dir.parent / f"{run_id}_{summary.runner}_{summary.model}"
         agent_run_dir.mkdir(parents=True, exist_ok=True)
 
         agent_summary_file = agent_run_dir / "summary.json"
-        with open(agent_summary_file, "w") as f:
-            f.write(summary.model_dump_json(indent=2))
+        agent_summary_file.write_bytes(summary_bytes)
 
     # Update web app
     from long_context_bench.stats import update_web_app
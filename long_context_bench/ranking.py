@@ -6,63 +6,114 @@ and PairwiseJudgeDecision artifacts, as described in plan.md.
 
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, List, Union
+import math
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
 
 from long_context_bench.models import AgentVsHumanDecision, PairwiseJudgeDecision
 
+# Aggregate scores closer than this are a tie
+TIE_EPSILON = 1e-3
 
-def compute_win_loss_matrix_from_scores(
+# 10 ** (diff / 400) == exp(diff * _LN10_OVER_400); exp is cheaper than pow
+_LN10_OVER_400 = math.log(10.0) / 400.0
+
+
+def agent_score_columns(
     decisions: List[AgentVsHumanDecision],
-) -> Dict[str, Dict[str, Dict[str, int]]]:
-    """Compute head-to-head win/loss/tie counts by comparing agent scores.
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Flatten agent decisions into per-agent columns.
 
-    Each agent is compared against every other agent based on their aggregate scores.
+    Returns:
+        Tuple of (agent_ids, counts, scores): agent IDs in first-seen order,
+        the number of decisions for each agent, and each agent's aggregate
+        score (the last one seen when an agent has several decisions).
+    """
 
-    Returns a nested mapping of the form:
-        matrix[agent_id][opponent_id] -> {"wins", "losses", "ties"}
-    where the counts are from the perspective of ``agent_id``.
+    score_map: Dict[str, float] = {}
+    count_map: Dict[str, int] = {}
+    for decision in decisions:
+        score_map[decision.agent_id] = decision.aggregate
+        count_map[decision.agent_id] = count_map.get(decision.agent_id, 0) + 1
+
+    agent_ids = list(score_map)
+    counts = np.fromiter(count_map.values(), dtype=np.int64, count=len(agent_ids))
+    scores = np.fromiter(score_map.values(), dtype=np.float64, count=len(agent_ids))
+    return agent_ids, counts, scores
+
+
+def pairwise_outcomes(scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compare every score against every other one.
+
+    Returns:
+        Boolean (N, N) arrays (wins, losses, ties), where ``wins[i, j]`` means
+        ``scores[i]`` beat ``scores[j]``. The diagonal counts as a tie.
     """
 
-    matrix: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"wins": 0, "losses": 0, "ties": 0})
-    )
+    diff = scores[:, None] - scores[None, :]
+    ties = np.abs(diff) < TIE_EPSILON
+    wins = ~ties & (diff > 0)
+    losses = ~ties & (diff < 0)
+    return wins, losses, ties
 
-    # Create a mapping of agent_id to aggregate score
-    score_map: Dict[str, float] = {
-        decision.agent_id: decision.aggregate for decision in decisions
-    }
 
-    # Compare each agent against every other agent
-    for decision_i in decisions:
-        agent_i = decision_i.agent_id
-        score_i = score_map[agent_i]
+def win_loss_counts_from_scores(
+    decisions: List[AgentVsHumanDecision],
+) -> Tuple[List[str], np.ndarray]:
+    """Dense form of compute_win_loss_matrix_from_scores.
 
-        for decision_j in decisions:
-            agent_j = decision_j.agent_id
-            if agent_i == agent_j:
-                continue  # Don't compare agent to itself
+    Returns:
+        Tuple of (agent_ids, counts), where ``counts[i, j]`` holds the
+        (wins, losses, ties) of ``agent_ids[i]`` against ``agent_ids[j]``.
+        ``counts`` has shape (N, N, 3) and a zero diagonal; it is empty when
+        fewer than two agents have decisions.
+    """
 
-            score_j = score_map[agent_j]
+    agent_ids, counts, scores = agent_score_columns(decisions)
+    if len(agent_ids) < 2:
+        return [], np.zeros((0, 0, 3), dtype=np.int64)
 
-            # Ensure entry exists
-            _ = matrix[agent_i][agent_j]
+    # Every decision of agent i meets every decision of agent j
+    games = np.outer(counts, counts)
+    np.fill_diagonal(games, 0)
+    outcomes = np.stack(pairwise_outcomes(scores), axis=-1)
+    return agent_ids, games[:, :, None] * outcomes
 
-            # Determine win/loss/tie based on score comparison
-            if abs(score_i - score_j) < 1e-3:
-                matrix[agent_i][agent_j]["ties"] += 1
-            elif score_i > score_j:
-                matrix[agent_i][agent_j]["wins"] += 1
-            else:
-                matrix[agent_i][agent_j]["losses"] += 1
 
-    # Convert nested defaultdicts back to plain dicts for serialization
+def nest_win_loss_counts(
+    agent_ids: List[str], counts: np.ndarray
+) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Convert dense (N, N, 3) counts to the nested matrix written to disk.
+
+    Pairs that never met (all-zero counts, e.g. the diagonal) are left out.
+    """
+
+    rows = counts.tolist()
     return {
-        agent_id: {opponent_id: stats for opponent_id, stats in opponents.items()}
-        for agent_id, opponents in matrix.items()
+        agent_i: {
+            agent_ids[j]: dict(zip(("wins", "losses", "ties"), rows[i][j]))
+            for j in np.flatnonzero(met).tolist()
+        }
+        for i, (agent_i, met) in enumerate(zip(agent_ids, counts.any(axis=2)))
     }
 
 
+def compute_win_loss_matrix_from_scores(
+    decisions: List[AgentVsHumanDecision],
+) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Compute head-to-head win/loss/tie counts by comparing agent scores.
+
+    Each agent is compared against every other agent based on their aggregate scores.
+
+    Returns a nested mapping of the form:
+        matrix[agent_id][opponent_id] -> {"wins", "losses", "ties"}
+    where the counts are from the perspective of ``agent_id``.
+    """
+
+    return nest_win_loss_counts(*win_loss_counts_from_scores(decisions))
+
+
 def compute_elo_ratings_from_scores(
     decisions: List[AgentVsHumanDecision],
     initial_rating: float = 1500.0,
@@ -74,49 +125,90 @@ def compute_elo_ratings_from_scores(
     aggregate score wins. Ties occur when scores are within epsilon.
     """
 
-    ratings: Dict[str, float] = {}
+    if len(decisions) < 2:
+        return {}
 
-    def _get_rating(agent_id: str) -> float:
-        if agent_id not in ratings:
-            ratings[agent_id] = initial_rating
-        return ratings[agent_id]
+    agent_ids, _, scores = agent_score_columns(decisions)
+    index = {agent_id: i for i, agent_id in enumerate(agent_ids)}
+    order = [index[decision.agent_id] for decision in decisions]
 
-    # Create a mapping of agent_id to aggregate score
-    score_map: Dict[str, float] = {
-        decision.agent_id: decision.aggregate for decision in decisions
-    }
-
-    # Process all pairwise comparisons
-    for i, decision_i in enumerate(decisions):
-        for j, decision_j in enumerate(decisions):
-            if i >= j:
-                continue  # Only process each pair once
+    # actual[i][j]: agent i's result against agent j (1 win, 0.5 tie, 0 loss)
+    wins, _, ties = pairwise_outcomes(scores)
+    actual = np.where(ties, 0.5, wins).tolist()
 
-            agent_i = decision_i.agent_id
-            agent_j = decision_j.agent_id
-            score_i = score_map[agent_i]
-            score_j = score_map[agent_j]
-
-            ra = _get_rating(agent_i)
-            rj = _get_rating(agent_j)
+    # Elo updates are sequential, so the pair loop stays in Python, but over
+    # list indices and a precomputed outcome table
+    ratings = [initial_rating] * len(agent_ids)
+    for pos, i in enumerate(order):
+        actual_row = actual[i]
+        for j in order[pos + 1:]:
+            ra = ratings[i]
+            rj = ratings[j]
 
             # Expected scores
-            expected_i = 1.0 / (1.0 + 10 ** ((rj - ra) / 400.0))
+            expected_i = 1.0 / (1.0 + math.exp((rj - ra) * _LN10_OVER_400))
             expected_j = 1.0 - expected_i
 
-            # Actual scores based on aggregate comparison
-            if abs(score_i - score_j) < 1e-3:
-                actual_i = actual_j = 0.5  # Tie
-            elif score_i > score_j:
-                actual_i, actual_j = 1.0, 0.0  # i wins
-            else:
-                actual_i, actual_j = 0.0, 1.0  # j wins
+            actual_i = actual_row[j]
+            ratings[i] = ra + k_factor * (actual_i - expected_i)
+            ratings[j] = rj + k_factor * ((1.0 - actual_i) - expected_j)
+
+    return dict(zip(agent_ids, ratings))
+
+
+# Position of a pairwise verdict in (wins, losses, ties), from submission A's
+# side; winners are matched case-insensitively and anything other than A or B
+# is a tie. Both cases are listed so lookups need no per-decision lower()
+_VERDICT_INDEX = {"a": 0, "A": 0, "b": 1, "B": 1}
+# The same verdict from submission B's side
+_MIRRORED_VERDICT = np.array([1, 0, 2])
+# Elo game score for submission A, by verdict position
+_VERDICT_SCORE = (1.0, 0.0, 0.5)
+
+
+def _index_comparisons(
+    comparisons: List[PairwiseJudgeDecision],
+) -> Tuple[List[str], List[int], List[int], List[int]]:
+    """Flatten pairwise decisions into parallel index columns.
+
+    Returns:
+        Tuple of (agent_ids, a_idx, b_idx, verdicts): agent IDs in first-seen
+        order, each decision's submission A and B as indices into agent_ids,
+        and its verdict as a (wins, losses, ties) position from A's side.
+    """
 
-            # Update ratings
-            ratings[agent_i] = ra + k_factor * (actual_i - expected_i)
-            ratings[agent_j] = rj + k_factor * (actual_j - expected_j)
+    index: Dict[str, int] = {}
+    a_idx: List[int] = []
+    b_idx: List[int] = []
+    verdicts: List[int] = []
+    for decision in comparisons:
+        a_idx.append(index.setdefault(decision.submission_a_id, len(index)))
+        b_idx.append(index.setdefault(decision.submission_b_id, len(index)))
+        verdicts.append(_VERDICT_INDEX.get(decision.winner, 2))
+    return list(index), a_idx, b_idx, verdicts
 
-    return ratings
+
+def win_loss_counts(
+    comparisons: List[PairwiseJudgeDecision],
+) -> Tuple[List[str], np.ndarray]:
+    """Dense form of compute_win_loss_matrix.
+
+    Returns:
+        Tuple of (agent_ids, counts): agent IDs in first-seen order and an
+        (N, N, 3) array where ``counts[i, j]`` holds the (wins, losses, ties)
+        of ``agent_ids[i]`` against ``agent_ids[j]``.
+    """
+
+    agent_ids, a_idx, b_idx, verdicts = _index_comparisons(comparisons)
+    counts = np.zeros((len(agent_ids), len(agent_ids), 3), dtype=np.int64)
+    if verdicts:
+        a = np.array(a_idx)
+        b = np.array(b_idx)
+        verdict = np.array(verdicts)
+        # add.at accumulates repeated (a, b) pairs, unlike fancy-index +=
+        np.add.at(counts, (a, b, verdict), 1)
+        np.add.at(counts, (b, a, _MIRRORED_VERDICT[verdict]), 1)
+    return agent_ids, counts
 
 
 def compute_win_loss_matrix(
@@ -126,37 +218,11 @@ def compute_win_loss_matrix(
 
     Returns a nested mapping of the form:
         matrix[agent_id][opponent_id] -> {"wins", "losses", "ties"}
-    where the counts are from the perspective of ``agent_id``.
+    where the counts are from the perspective of ``agent_id``. Only pairs
+    that met in at least one decision are included.
     """
 
-    matrix: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"wins": 0, "losses": 0, "ties": 0})
-    )
-
-    for decision in comparisons:
-        a = decision.submission_a_id
-        b = decision.submission_b_id
-
-        # Ensure entries exist
-        _ = matrix[a][b]
-        _ = matrix[b][a]
-
-        winner = decision.winner.lower()
-        if winner == "a":
-            matrix[a][b]["wins"] += 1
-            matrix[b][a]["losses"] += 1
-        elif winner == "b":
-            matrix[a][b]["losses"] += 1
-            matrix[b][a]["wins"] += 1
-        else:
-            matrix[a][b]["ties"] += 1
-            matrix[b][a]["ties"] += 1
-
-    # Convert nested defaultdicts back to plain dicts for serialization
-    return {
-        agent_id: {opponent_id: stats for opponent_id, stats in opponents.items()}
-        for agent_id, opponents in matrix.items()
-    }
+    return nest_win_loss_counts(*win_loss_counts(comparisons))
 
 
 def compute_elo_ratings(
@@ -170,36 +236,23 @@ def compute_elo_ratings(
     submission_a_id and submission_b_id. Ties count as 0.5 for both sides.
     """
 
-    ratings: Dict[str, float] = {}
+    agent_ids, a_idx, b_idx, verdicts = _index_comparisons(comparisons)
 
-    def _get_rating(agent_id: str) -> float:
-        if agent_id not in ratings:
-            ratings[agent_id] = initial_rating
-        return ratings[agent_id]
-
-    for decision in comparisons:
-        a = decision.submission_a_id
-        b = decision.submission_b_id
-
-        ra = _get_rating(a)
-        rb = _get_rating(b)
+    # Elo updates are sequential; the loop runs over list indices
+    ratings = [initial_rating] * len(agent_ids)
+    for a, b, verdict in zip(a_idx, b_idx, verdicts):
+        ra = ratings[a]
+        rb = ratings[b]
 
         # Expected scores
-        expected_a = 1.0 / (1.0 + 10 ** ((rb - ra) / 400.0))
+        expected_a = 1.0 / (1.0 + math.exp((rb - ra) * _LN10_OVER_400))
         expected_b = 1.0 - expected_a
 
-        winner = decision.winner.lower()
-        if winner == "a":
-            score_a, score_b = 1.0, 0.0
-        elif winner == "b":
-            score_a, score_b = 0.0, 1.0
-        else:
-            score_a = score_b = 0.5
-
+        score_a = _VERDICT_SCORE[verdict]
         ratings[a] = ra + k_factor * (score_a - expected_a)
-        ratings[b] = rb + k_factor * (score_b - expected_b)
+        ratings[b] = rb + k_factor * ((1.0 - score_a) - expected_b)
 
-    return ratings
+    return dict(zip(agent_ids, ratings))
 
 
 def rank_agents(
@@ -220,12 +273,11 @@ def rank_agents(
         return []
 
     if method == "win_loss":
-        matrix = compute_win_loss_matrix(comparisons)
+        agent_ids, counts = win_loss_counts(comparisons)
+        # Per-agent (wins, losses, ties) totals across all opponents
+        totals = counts.sum(axis=1).tolist()
         scores: Dict[str, tuple[float, int, int]] = {}
-        for agent_id, opponents in matrix.items():
-            wins = sum(v["wins"] for v in opponents.values())
-            losses = sum(v["losses"] for v in opponents.values())
-            ties = sum(v["ties"] for v in opponents.values())
+        for agent_id, (wins, losses, ties) in zip(agent_ids, totals):
             matches = wins + losses + ties
             if matches == 0:
                 score = 0.0
@@ -0,0 +1,282 @@
+"""Shared on-disk repository cache used by the edit and judge stages.
+
+A cache directory holds two kinds of bare mirror per repository:
+
+- ``{owner}_{repo}.git``: the judge's blob:none partial clone of ``origin``,
+  holding base and head commits for ground-truth diffs.
+- ``workspaces/{owner}_{repo}.git``: the source of agent workspaces. It has
+  no remote and only ever receives base commits, so a workspace checked out
+  from it never shares an object store with ground-truth head commits.
+
+Mirrors are locked per thread and, where ``fcntl`` is available, with a lock
+file next to the mirror, so shard processes may share one cache directory.
+On platforms without ``fcntl`` (Windows), a cache directory must not be used
+by more than one process at a time.
+"""
+
+import atexit
+import os
+import re
+import subprocess
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List
+
+import git
+from rich.console import Console
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Not available on Windows: mirrors are only locked in-process
+
+console = Console()
+
+# Long-lived `git cat-file --batch-check` processes, one per cached repository.
+# Used to answer "is this commit already present?" without spawning git per query.
+_object_checkers: dict[Path, tuple[subprocess.Popen, threading.Lock]] = {}
+_object_checkers_lock = threading.Lock()
+
+# Serializes clone/fetch on a cached repository so concurrent judges
+# (--concurrency > 1) working on PRs from the same repo don't race.
+_repo_locks: defaultdict[Path, threading.Lock] = defaultdict(threading.Lock)
+_repo_locks_lock = threading.Lock()
+
+# Open bare mirror handles per cache path, shared across PRs from the same
+# repository
+_repo_cache: dict[Path, git.Repo] = {}
+
+# Matches the trailing "<owner>/<repo>[.git][/]" of a repository URL
+_REPO_URL_RE = re.compile(r"(?:.*/)?([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+# Maximum number of SHAs passed to a single batched `git fetch`
+_PREFETCH_BATCH_SIZE = 100
+
+
+def _close_object_checkers() -> None:
+    """Terminate all persistent cat-file processes."""
+    with _object_checkers_lock:
+        for proc, _ in _object_checkers.values():
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=5)
+            except Exception:
+                proc.kill()
+        _object_checkers.clear()
+
+
+atexit.register(_close_object_checkers)
+
+
+def _has_commit(cache_path: Path, sha: str) -> bool:
+    """Check whether a commit exists in a cached repository.
+
+    Reuses a persistent `git cat-file --batch-check` process per repository.
+    Lazy fetching is disabled for it: in a promisor mirror, git would
+    otherwise download any commit it is asked about (with its full history),
+    bypassing the shallow fetch in fetch_missing_commits.
+
+    Args:
+        cache_path: Path to the cached repository
+        sha: Commit SHA to look up
+
+    Returns:
+        True if the commit object is available locally
+    """
+    with _object_checkers_lock:
+        entry = _object_checkers.get(cache_path)
+        if entry is None or entry[0].poll() is not None:
+            proc = subprocess.Popen(
+                ["git", "-C", str(cache_path), "cat-file", "--batch-check"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                env={**os.environ, "GIT_NO_LAZY_FETCH": "1"},
+            )
+            entry = (proc, threading.Lock())
+            _object_checkers[cache_path] = entry
+
+    proc, lock = entry
+    try:
+        with lock:
+            proc.stdin.write(f"{sha}^{{commit}}\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+    except (BrokenPipeError, OSError):
+        return False
+    return bool(line) and not line.rstrip().endswith("missing")
+
+
+@lru_cache(maxsize=1024)
+def _parse_repo_url(repo_url: str) -> tuple[str, str]:
+    """Extract (owner, repo_name) from a repository URL.
+
+    Args:
+        repo_url: Repository URL (e.g., https://github.com/elastic/elasticsearch.git)
+
+    Returns:
+        Tuple of (owner, repo_name)
+    """
+    match = _REPO_URL_RE.match(repo_url)
+    if not match:
+        raise ValueError(f"Invalid repository URL: {repo_url}")
+    return match.group(1), match.group(2)
+
+
+def _mirror_path(cache_dir: Path, repo_url: str) -> Path:
+    """Return the ground-truth mirror location for a repository under the cache directory."""
+    owner, repo_name = _parse_repo_url(repo_url)
+    return cache_dir / f"{owner}_{repo_name}.git"
+
+
+def _base_mirror_path(cache_dir: Path, repo_url: str) -> Path:
+    """Return the workspace mirror location for a repository under the cache directory."""
+    owner, repo_name = _parse_repo_url(repo_url)
+    return cache_dir / "workspaces" / f"{owner}_{repo_name}.git"
+
+
+@contextmanager
+def _locked(cache_path: Path) -> Iterator[None]:
+    """Hold a cached repository exclusively, across threads and processes.
+
+    Args:
+        cache_path: Path to the cached repository
+    """
+    with _repo_locks_lock:
+        repo_lock = _repo_locks[cache_path]
+
+    with repo_lock:
+        if fcntl is None:
+            yield
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{cache_path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _get_or_open_repo(cache_path: Path, repo_url: str) -> git.Repo:
+    """Return the process-wide Repo handle for a cached ground-truth mirror.
+
+    Initializes an empty partial-clone mirror on first use; nothing is
+    downloaded until commits are fetched into it. Callers must hold the cache
+    path via _locked.
+
+    Args:
+        cache_path: Path to the cached repository
+        repo_url: Repository URL to clone from if the cache is missing
+
+    Returns:
+        Repo object
+    """
+    repo = _repo_cache.get(cache_path)
+    if repo is not None:
+        return repo
+
+    if cache_path.exists():
+        repo = git.Repo(cache_path)
+    else:
+        console.print(f"  Initializing repository mirror at {cache_path}...")
+        repo = git.Repo.init(cache_path, bare=True)
+        repo.create_remote("origin", repo_url)
+        # Mark origin as a blob:none promisor so later fetches stay partial and
+        # git lazily fetches only the blobs a diff or checkout touches
+        with repo.config_writer() as config:
+            config.set_value('remote "origin"', "promisor", "true")
+            config.set_value('remote "origin"', "partialclonefilter", "blob:none")
+            config.set_value("core", "repositoryformatversion", "1")
+            config.set_value("extensions", "partialClone", "origin")
+
+    _repo_cache[cache_path] = repo
+    return repo
+
+
+@contextmanager
+def locked_repo_mirror(repo_url: str, cache_dir: Path) -> Iterator[git.Repo]:
+    """Hold the ground-truth mirror of a repository for exclusive use.
+
+    The mirror is created on first use and shared by every judge given the
+    same cache directory, so a repository is only ever downloaded once.
+
+    Args:
+        repo_url: Repository URL
+        cache_dir: Cache directory for repositories
+
+    Yields:
+        Repo object for the bare mirror
+    """
+    cache_path = _mirror_path(cache_dir, repo_url)
+    with _locked(cache_path):
+        yield _get_or_open_repo(cache_path, repo_url)
+
+
+@contextmanager
+def locked_base_mirror(repo_url: str, cache_dir: Path) -> Iterator[git.Repo]:
+    """Hold the workspace mirror of a repository for exclusive use.
+
+    Agent workspaces are worktrees of this mirror. It is initialized empty
+    with no remote, and commits only enter it through fetch_base_commits.
+
+    Args:
+        repo_url: Repository URL
+        cache_dir: Cache directory for repositories
+
+    Yields:
+        Repo object for the bare mirror
+    """
+    cache_path = _base_mirror_path(cache_dir, repo_url)
+    with _locked(cache_path):
+        repo = _repo_cache.get(cache_path)
+        if repo is None:
+            if cache_path.exists():
+                repo = git.Repo(cache_path)
+            else:
+                console.print(f"  Initializing workspace mirror at {cache_path}...")
+                repo = git.Repo.init(cache_path, bare=True)
+            _repo_cache[cache_path] = repo
+        yield repo
+
+
+def _fetch_missing(repo: git.Repo, commits: List[str], *fetch_args: str) -> None:
+    """Run `git fetch <fetch_args> <shas>` in batches for commits not yet present."""
+    cache_path = Path(repo.git_dir)
+    missing = sorted({c for c in commits if not _has_commit(cache_path, c)})
+    for i in range(0, len(missing), _PREFETCH_BATCH_SIZE):
+        repo.git.fetch(*fetch_args, *missing[i:i + _PREFETCH_BATCH_SIZE])
+
+
+def fetch_missing_commits(repo: git.Repo, commits: List[str]) -> None:
+    """Shallow-fetch the given commits into a mirror, skipping any already present.
+
+    Only commits and trees are transferred; blobs are fetched lazily by git
+    when a diff or checkout needs them. Callers must hold the mirror via
+    locked_repo_mirror.
+
+    Args:
+        repo: Bare mirror from locked_repo_mirror
+        commits: Commit SHAs to make available locally
+    """
+    _fetch_missing(repo, commits, "--no-tags", "--depth=1", "--filter=blob:none", "origin")
+
+
+def fetch_base_commits(repo: git.Repo, repo_url: str, commits: List[str]) -> None:
+    """Shallow-fetch base commits into a workspace mirror, skipping any already present.
+
+    Fetched by URL with their blobs, so the mirror records no remote and needs
+    none to check the commits out. Callers must hold the mirror via
+    locked_base_mirror.
+
+    Args:
+        repo: Bare mirror from locked_base_mirror
+        repo_url: Repository URL to fetch from
+        commits: Base commit SHAs to make available locally
+    """
+    _fetch_missing(repo, commits, "--no-tags", "--depth=1", repo_url)
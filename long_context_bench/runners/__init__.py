@@ -1,6 +1,8 @@
 """Runner adapters for CLI-based coding agents."""
 
-from long_context_bench.runners.base import RunnerAdapter, RunnerResult
+from types import MappingProxyType
+
+from long_context_bench.runners.base import RunnerAdapter, RunnerResult, base_agent_env
 from long_context_bench.runners.auggie import AuggieAdapter
 from long_context_bench.runners.generic import GenericAdapter
 from long_context_bench.runners.claude_code import ClaudeCodeAdapter
@@ -11,6 +13,7 @@ from long_context_bench.runners.factory import FactoryAdapter
 __all__ = [
     "RunnerAdapter",
     "RunnerResult",
+    "base_agent_env",
     "AuggieAdapter",
     "GenericAdapter",
     "ClaudeCodeAdapter",
@@ -19,6 +22,16 @@ __all__ = [
     "FactoryAdapter",
 ]
 
+# Runner name -> adapter class. Unknown names fall back to GenericAdapter.
+_ADAPTERS = MappingProxyType({
+    "auggie": AuggieAdapter,
+    "generic": GenericAdapter,
+    "claude-code": ClaudeCodeAdapter,
+    "codex": CodexAdapter,
+    "aider": AiderAdapter,
+    "factory": FactoryAdapter,
+})
+
 
 def get_runner_adapter(runner_name: str, **kwargs) -> RunnerAdapter:
     """Get runner adapter by name.
@@ -30,15 +43,4 @@ def get_runner_adapter(runner_name: str, **kwargs) -> RunnerAdapter:
     Returns:
         RunnerAdapter instance
     """
-    adapters = {
-        "auggie": AuggieAdapter,
-        "generic": GenericAdapter,
-        "claude-code": ClaudeCodeAdapter,
-        "codex": CodexAdapter,
-        "aider": AiderAdapter,
-        "factory": FactoryAdapter,
-    }
-
-    adapter_class = adapters.get(runner_name, GenericAdapter)
-    return adapter_class(**kwargs)
-
+    return _ADAPTERS.get(runner_name, GenericAdapter)(**kwargs)
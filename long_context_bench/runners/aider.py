@@ -1,14 +1,20 @@
 """Aider runner adapter."""
 
 import json
+import re
+import shutil
 import subprocess
 import time
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 
-from long_context_bench.runners.base import RunnerAdapter, RunnerResult
+from long_context_bench.runners.base import RunnerAdapter, RunnerResult, probe_version
 from long_context_bench.runners.stream_utils import run_with_streaming
 
+# Case-insensitive scan for failure markers in agent output, so large stdout
+# is searched once without building a lowercased copy
+_ERROR_OUTPUT_RE = re.compile(r"error|failed", re.IGNORECASE)
+
 
 class AiderAdapter(RunnerAdapter):
     """Adapter for Aider CLI agent.
@@ -17,6 +23,24 @@ class AiderAdapter(RunnerAdapter):
     Install: pip install aider-chat
     Docs: https://aider.chat/docs/
     """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+
+        # Flags that only depend on adapter settings, built once per adapter
+        # rather than on every run
+        self._base_cmd = [
+            self.agent_binary or "aider",
+            "--yes-always",  # Auto-accept all prompts
+            "--auto-commits",  # Auto-commit changes
+        ]
+        if self.model:
+            self._base_cmd.extend(["--model", self.model])
+        # Disable features based on adapter settings
+        if self.disable_retrieval:
+            self._base_cmd.append("--map-tokens=0")  # Disable repo map
+        if self.disable_shell:
+            self._base_cmd.append("--no-suggest-shell-commands")
     
     def run(
         self,
@@ -39,29 +63,15 @@ class AiderAdapter(RunnerAdapter):
         start_time = time.time()
         errors = []
 
-        # Aider uses --message for non-interactive execution
+        # Aider uses --message for non-interactive execution; the LLM history
+        # file is per-workspace and used for logging
+        llm_history = workspace_path / ".aider.llm.history"
         cmd = [
-            self.agent_binary or "aider",
-            "--message", task_instructions,  # Non-interactive mode with message
-            "--yes-always",  # Auto-accept all prompts
-            "--auto-commits",  # Auto-commit changes
+            *self._base_cmd,
+            "--message", task_instructions,
+            "--llm-history-file", str(llm_history),
         ]
 
-        # Add model if specified
-        if self.model:
-            cmd.extend(["--model", self.model])
-
-        # Add LLM history file for logging
-        llm_history = workspace_path / ".aider.llm.history"
-        cmd.extend(["--llm-history-file", str(llm_history)])
-
-        # Disable features based on adapter settings
-        if self.disable_retrieval:
-            cmd.append("--map-tokens=0")  # Disable repo map
-        
-        if self.disable_shell:
-            cmd.append("--no-suggest-shell-commands")
-
         # Prepare environment
         run_env = env.copy() if env else {}
 
@@ -76,7 +86,7 @@ class AiderAdapter(RunnerAdapter):
             )
 
             # Write logs - combine stdout and LLM history
-            with open(logs_path, "w") as f:
+            with open(logs_path, "wb") as f:
                 log_entry = {
                     "timestamp": time.time(),
                     "event": "agent_run",
@@ -84,13 +94,15 @@ class AiderAdapter(RunnerAdapter):
                     "stderr": "",  # Merged into stdout when streaming
                     "returncode": returncode,
                 }
-                f.write(json.dumps(log_entry) + "\n")
+                f.write(json.dumps(log_entry).encode() + b"\n")
 
-                # Append LLM history if it exists
-                if llm_history.exists():
-                    with open(llm_history, "r") as llm_f:
-                        for line in llm_f:
-                            f.write(line)
+                # Append LLM history if it exists, copied as raw bytes in
+                # large chunks (the history can run to many megabytes)
+                try:
+                    with open(llm_history, "rb") as llm_f:
+                        shutil.copyfileobj(llm_f, f, 1 << 20)
+                except FileNotFoundError:
+                    pass
 
             elapsed_ms = int((time.time() - start_time) * 1000)
 
@@ -100,7 +112,7 @@ class AiderAdapter(RunnerAdapter):
                 status = "error"
                 errors.append(f"Agent exited with code {returncode}")
                 # Extract error from stdout if present
-                if "error" in stdout.lower() or "failed" in stdout.lower():
+                if _ERROR_OUTPUT_RE.search(stdout):
                     errors.append(stdout[-500:])  # Last 500 chars for context
             
             return RunnerResult(
@@ -126,16 +138,5 @@ class AiderAdapter(RunnerAdapter):
     
     def get_version(self) -> Optional[str]:
         """Get Aider version."""
-        try:
-            result = subprocess.run(
-                [self.agent_binary or "aider", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        return probe_version(self.agent_binary or "aider")
 
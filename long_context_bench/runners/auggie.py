@@ -6,7 +6,7 @@ import time
 from pathlib import Path
 from typing import Optional, Dict
 
-from long_context_bench.runners.base import RunnerAdapter, RunnerResult
+from long_context_bench.runners.base import RunnerAdapter, RunnerResult, probe_version
 from long_context_bench.runners.stream_utils import run_with_streaming
 
 
@@ -34,9 +34,11 @@ class AuggieAdapter(RunnerAdapter):
         start_time = time.time()
         errors = []
 
-        # Write task instructions to temp file
+        # Write task instructions to temp file. Encoded once up front and
+        # written in binary mode, skipping the text-layer wrapper; UTF-8 so
+        # the file doesn't depend on the host locale
         task_file = workspace_path / ".auggie_task.txt"
-        task_file.write_text(task_instructions)
+        task_file.write_bytes(task_instructions.encode("utf-8"))
 
         # Prepare command using correct auggie flags
         # Use the configured timeout for retry-timeout (in seconds)
@@ -61,7 +63,9 @@ class AuggieAdapter(RunnerAdapter):
         run_env.setdefault("GIT_ASKPASS", "true")       # non-interactive askpass
 
         try:
-            # Write command info to logs first
+            # Keep one handle on the JSONL log for the whole run. The start
+            # entry is flushed before the agent launches so it survives a
+            # hang or kill
             with open(logs_path, "w") as f:
                 log_entry = {
                     "timestamp": time.time(),
@@ -73,18 +77,18 @@ class AuggieAdapter(RunnerAdapter):
                     "timeout_s": self.timeout,
                 }
                 f.write(json.dumps(log_entry) + "\n")
-
-            # Run agent with optional streaming
-            returncode, stdout = run_with_streaming(
-                cmd=cmd,
-                cwd=str(workspace_path),
-                env=run_env,
-                timeout=self.timeout,
-                stream_output=self.stream_output,
-            )
-
-            # Write comprehensive logs
-            with open(logs_path, "a") as f:
+                f.flush()
+
+                # Run agent with optional streaming
+                returncode, stdout = run_with_streaming(
+                    cmd=cmd,
+                    cwd=str(workspace_path),
+                    env=run_env,
+                    timeout=self.timeout,
+                    stream_output=self.stream_output,
+                )
+
+                # Write comprehensive logs
                 log_entry = {
                     "timestamp": time.time(),
                     "event": "agent_run",
@@ -92,23 +96,29 @@ class AuggieAdapter(RunnerAdapter):
                     "stderr": "",  # Merged into stdout
                     "returncode": returncode,
                 }
-                f.write(json.dumps(log_entry) + "\n")
+                # stdout can be megabytes; write the newline separately rather than
+                # copying the whole serialized entry to append it
+                f.write(json.dumps(log_entry))
+                f.write("\n")
 
-            # Also write human-readable logs
+            # Also write human-readable logs, assembled and written in one go
+            rule = "=" * 80 + "\n"
             readable_log_path = logs_path.parent / "logs_readable.txt"
-            with open(readable_log_path, "w") as f:
-                f.write("=" * 80 + "\n")
-                f.write("AUGGIE RUN LOG\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(f"Model: {self.model}\n")
-                f.write(f"Command: {' '.join(cmd)}\n")
-                f.write(f"Workspace: {workspace_path}\n")
-                f.write(f"Timeout: {self.timeout}s\n")
-                f.write(f"Return Code: {returncode}\n\n")
-                f.write("=" * 80 + "\n")
-                f.write("STDOUT\n")
-                f.write("=" * 80 + "\n")
-                f.write(stdout or "(empty)\n\n")
+            readable_log_path.write_text("".join([
+                rule,
+                "AUGGIE RUN LOG\n",
+                rule,
+                "\n",
+                f"Model: {self.model}\n",
+                f"Command: {' '.join(cmd)}\n",
+                f"Workspace: {workspace_path}\n",
+                f"Timeout: {self.timeout}s\n",
+                f"Return Code: {returncode}\n\n",
+                rule,
+                "STDOUT\n",
+                rule,
+                stdout or "(empty)\n\n",
+            ]))
 
             elapsed_ms = int((time.time() - start_time) * 1000)
 
@@ -148,16 +158,5 @@ class AuggieAdapter(RunnerAdapter):
     
     def get_version(self) -> Optional[str]:
         """Get Auggie version."""
-        try:
-            result = subprocess.run(
-                [self.agent_binary or "auggie", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        return probe_version(self.agent_binary or "auggie")
 
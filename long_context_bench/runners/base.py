@@ -1,9 +1,13 @@
 """Base runner adapter interface."""
 
+import os
+import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 
 
 @dataclass
@@ -14,6 +18,43 @@ class RunnerResult:
     errors: Optional[list[str]] = None
 
 
+@lru_cache(maxsize=1)
+def base_agent_env() -> Mapping[str, str]:
+    """Return the environment agents are launched with, snapshotted once per process.
+
+    Adapters copy this before adding their own variables, so every sample
+    shares one read-only snapshot instead of copying os.environ per run.
+
+    Returns:
+        Read-only view of the process environment at first call
+    """
+    return MappingProxyType(os.environ.copy())
+
+
+@lru_cache(maxsize=None)
+def probe_version(binary: str) -> Optional[str]:
+    """Run ``<binary> --version`` once per binary and cache the answer.
+
+    Args:
+        binary: Agent executable name or path
+
+    Returns:
+        Stripped version output, or None if the probe failed
+    """
+    try:
+        result = subprocess.run(
+            [binary, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return None
+
+
 class RunnerAdapter(ABC):
     """Abstract base class for agent runner adapters.
     
@@ -7,7 +7,7 @@ import time
 from pathlib import Path
 from typing import Optional, Dict
 
-from long_context_bench.runners.base import RunnerAdapter, RunnerResult
+from long_context_bench.runners.base import RunnerAdapter, RunnerResult, probe_version
 from long_context_bench.runners.stream_utils import run_with_streaming, run_with_pty
 
 
@@ -123,25 +123,31 @@ class ClaudeCodeAdapter(RunnerAdapter):
                     "stderr": "",  # Merged into stdout when streaming
                     "returncode": returncode,
                 }
-                f.write(json.dumps(log_entry) + "\n")
+                # stdout can be megabytes; write the newline separately rather than
+                # copying the whole serialized entry to append it
+                f.write(json.dumps(log_entry))
+                f.write("\n")
 
-            # Also write human-readable logs
+            # Also write human-readable logs, assembled and written in one go
+            rule = "=" * 80 + "\n"
             readable_log_path = logs_path.parent / "logs_readable.txt"
-            with open(readable_log_path, "w") as f:
-                f.write("=" * 80 + "\n")
-                f.write("CLAUDE CODE RUN LOG\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(f"Model: {self.model}\n")
-                f.write(f"Auth Mode: {used_auth} (config={auth_mode})\n")
-                f.write(f"API Key Present: {api_key_present}\n")
-                f.write(f"Command: {' '.join(cmd)}\n")
-                f.write(f"Workspace: {workspace_path}\n")
-                f.write(f"Timeout: {self.timeout}s\n")
-                f.write(f"Return Code: {returncode}\n\n")
-                f.write("=" * 80 + "\n")
-                f.write("STDOUT\n")
-                f.write("=" * 80 + "\n")
-                f.write(stdout or "(empty)\n\n")
+            readable_log_path.write_text("".join([
+                rule,
+                "CLAUDE CODE RUN LOG\n",
+                rule,
+                "\n",
+                f"Model: {self.model}\n",
+                f"Auth Mode: {used_auth} (config={auth_mode})\n",
+                f"API Key Present: {api_key_present}\n",
+                f"Command: {' '.join(cmd)}\n",
+                f"Workspace: {workspace_path}\n",
+                f"Timeout: {self.timeout}s\n",
+                f"Return Code: {returncode}\n\n",
+                rule,
+                "STDOUT\n",
+                rule,
+                stdout or "(empty)\n\n",
+            ]))
 
             elapsed_ms = int((time.time() - start_time) * 1000)
 
@@ -177,16 +183,5 @@ class ClaudeCodeAdapter(RunnerAdapter):
 
     def get_version(self) -> Optional[str]:
         """Get Claude Code version."""
-        try:
-            result = subprocess.run(
-                [self.agent_binary or "claude", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        return probe_version(self.agent_binary or "claude")
 
@@ -6,7 +6,7 @@ import time
 from pathlib import Path
 from typing import Optional, Dict
 
-from long_context_bench.runners.base import RunnerAdapter, RunnerResult
+from long_context_bench.runners.base import RunnerAdapter, RunnerResult, probe_version
 from long_context_bench.runners.stream_utils import run_with_streaming
 
 
@@ -125,16 +125,5 @@ class CodexAdapter(RunnerAdapter):
     
     def get_version(self) -> Optional[str]:
         """Get Codex CLI version."""
-        try:
-            result = subprocess.run(
-                [self.agent_binary or "codex", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        return probe_version(self.agent_binary or "codex")
 
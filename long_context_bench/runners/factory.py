@@ -8,7 +8,7 @@ import time
 from pathlib import Path
 from typing import Optional, Dict
 
-from long_context_bench.runners.base import RunnerAdapter, RunnerResult
+from long_context_bench.runners.base import RunnerAdapter, RunnerResult, probe_version
 from long_context_bench.runners.stream_utils import run_with_streaming
 
 
@@ -160,23 +160,25 @@ class FactoryAdapter(RunnerAdapter):
                 }
                 f.write(json.dumps(log_entry) + "\n")
 
-            # Also write human-readable logs
+            # Also write human-readable logs, assembled and written in one go
+            rule = "=" * 80 + "\n"
             readable_log_path = logs_path.parent / "logs_readable.txt"
-            with open(readable_log_path, "w") as f:
-                f.write("=" * 80 + "\n")
-                f.write("FACTORY (DROID) RUN LOG\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(f"Model: {self.model or 'default (from config)'}\n")
-                f.write(f"Command: {' '.join(cmd)}\n")
-                f.write(f"Workspace: {workspace_path}\n")
-                f.write(f"Timeout: {self.timeout}s\n")
-                if self.mcp_config_path:
-                    f.write(f"MCP Config: {self.mcp_config_path}\n")
-                f.write(f"Return Code: {returncode}\n\n")
-                f.write("=" * 80 + "\n")
-                f.write("STDOUT (stream-json format)\n")
-                f.write("=" * 80 + "\n")
-                f.write(stdout or "(empty)\n\n")
+            readable_log_path.write_text("".join([
+                rule,
+                "FACTORY (DROID) RUN LOG\n",
+                rule,
+                "\n",
+                f"Model: {self.model or 'default (from config)'}\n",
+                f"Command: {' '.join(cmd)}\n",
+                f"Workspace: {workspace_path}\n",
+                f"Timeout: {self.timeout}s\n",
+                f"MCP Config: {self.mcp_config_path}\n" if self.mcp_config_path else "",
+                f"Return Code: {returncode}\n\n",
+                rule,
+                "STDOUT (stream-json format)\n",
+                rule,
+                stdout or "(empty)\n\n",
+            ]))
 
             elapsed_ms = int((time.time() - start_time) * 1000)
 
@@ -219,16 +221,5 @@ class FactoryAdapter(RunnerAdapter):
     
     def get_version(self) -> Optional[str]:
         """Get Factory CLI (droid) version."""
-        try:
-            result = subprocess.run(
-                [self.agent_binary or "droid", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        return probe_version(self.agent_binary or "droid")
 
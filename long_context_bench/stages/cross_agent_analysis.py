@@ -350,13 +350,7 @@ def run_cross_agent_analysis(
             judge_model,
         )
 
-        aggregate = (
-            scores.correctness +
-            scores.completeness +
-            scores.code_reuse +
-            scores.best_practices +
-            scores.unsolicited_docs
-        ) / 5.0
+        aggregate = scores.mean
 
         # Compute relative logs path for web UI
         # edit_file is like: output/edits/{runner}/{model}/{run_id}/{pr_id}/edit.json
@@ -427,8 +421,7 @@ def run_cross_agent_analysis(
     output_file = output_dir / "cross_agent_analysis" / f"pr{pr_number}_{analysis_run_id}.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, "w") as f:
-        f.write(cross_agent_judge.model_dump_json(indent=2))
+    output_file.write_bytes(cross_agent_judge.dump_json())
     
     console.print(f"[green]✓ Cross-agent analysis saved to {output_file}[/green]")
     
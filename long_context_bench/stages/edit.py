@@ -1,23 +1,31 @@
 """Edit stage: Run agent on samples and capture diffs."""
 
-import json
 import platform
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import os
 
 import git
+from pydantic_core import from_json, to_json
 from rich.console import Console
 
 from long_context_bench import __version__
 from long_context_bench.models import Sample, Edit, EditRunManifest, RunManifest
-from long_context_bench.runners import get_runner_adapter
+from long_context_bench.runners import base_agent_env, get_runner_adapter
+from long_context_bench.repo_cache import fetch_base_commits, locked_base_mirror
 
 console = Console()
 
+# Caps simultaneous workspace fetches from the remote when running with
+# --concurrency > 1; agent runs themselves are not limited by this.
+_MAX_CONCURRENT_FETCHES = 4
+_fetch_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_FETCHES)
+
 
 def load_sample(sample_path: Path) -> Sample:
     """Load sample from JSON file.
@@ -28,9 +36,53 @@ def load_sample(sample_path: Path) -> Sample:
     Returns:
         Sample object
     """
-    with open(sample_path) as f:
-        data = json.load(f)
-    return Sample(**data)
+    return Sample.load_json(sample_path.read_bytes())
+
+
+def find_sample_files(
+    samples_dir: Path,
+    total_shards: int = 1,
+    shard_index: int = 0,
+) -> List[Path]:
+    """Find sample.json files under a directory, keeping only this shard's share.
+
+    Samples are assigned to shards exactly as the pipeline assigns PRs (see
+    pipeline.pr_in_shard). The PR is read from the sample's directory name
+    (the PR id), so files belonging to other shards are normally never opened;
+    samples in differently named directories are parsed to find their PR.
+
+    Args:
+        samples_dir: Directory to search recursively
+        total_shards: Total number of shards
+        shard_index: Current shard index (0-based)
+
+    Returns:
+        Sorted list of sample.json paths assigned to this shard
+    """
+    from long_context_bench.pipeline import pr_in_shard
+    from long_context_bench.stages.sample import parse_pr_id
+
+    found = []
+    pending = [samples_dir]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.name == "sample.json":
+                    sample_file = Path(entry.path)
+                    if total_shards > 1:
+                        try:
+                            owner, repo, pr_number = parse_pr_id(sample_file.parent.name)
+                        except ValueError:
+                            sample = load_sample(sample_file)
+                            owner, repo = sample.repo_url.rstrip("/").split("/")[-2:]
+                            repo = repo.removesuffix(".git")
+                            pr_number = sample.pr_number
+                        if not pr_in_shard(owner, repo, pr_number, total_shards, shard_index):
+                            continue
+                    found.append(sample_file)
+    return sorted(found)
 
 
 def materialize_workspace(
@@ -45,14 +97,28 @@ def materialize_workspace(
     IMPORTANT: Do NOT expose full git history to the agent. We initialize a fresh
     repo and fetch only the base commit by SHA (shallow, no tags, no remote).
 
+    With a cache directory, the base commit is instead shallow-fetched into the
+    repository's workspace mirror (see repo_cache.locked_base_mirror) and
+    checked out as a detached worktree, so later PRs from the same repository
+    only transfer what is new. That mirror likewise has no remote and holds
+    base commits only; it is separate from the judge's ground-truth mirror.
+    Pass the returned repo to release_workspace when the workspace is no
+    longer needed.
+
     Args:
         sample: Sample object
         workspace_path: Path to workspace directory
-        cache_dir: Optional cache directory for repositories (unused for workspace materialization)
+        cache_dir: Optional cache directory for repositories
 
     Returns:
         Git repository object rooted at base commit with minimal history
     """
+    if cache_dir:
+        try:
+            return _add_mirror_worktree(sample, workspace_path, cache_dir)
+        except Exception as e:
+            console.print(f"  [yellow]Warning: Cached worktree failed, fetching directly: {e}[/yellow]")
+
     # Ensure workspace directory exists and is empty
     workspace_path.mkdir(parents=True, exist_ok=True)
 
@@ -97,6 +163,79 @@ def materialize_workspace(
     return repo
 
 
+def _add_mirror_worktree(sample: Sample, workspace_path: Path, cache_dir: Path) -> git.Repo:
+    """Check out the base commit as a detached worktree of the workspace mirror.
+
+    The worktree is added locked: while an agent runs, its ``.git`` file is
+    moved aside, and an unlocked worktree would then look stale to a
+    ``git worktree prune`` issued by any other process sharing the mirror.
+    Callers release it with release_workspace once they are done.
+
+    Args:
+        sample: Sample object
+        workspace_path: Path to workspace directory (must not exist or be empty)
+        cache_dir: Cache directory for repositories
+
+    Returns:
+        Git repository object for the worktree
+    """
+    with locked_base_mirror(sample.repo_url, cache_dir) as mirror:
+        console.print(f"  Fetching base commit into cached mirror (shallow)...")
+        fetch_base_commits(mirror, sample.repo_url, [sample.base_commit])
+        console.print(f"  Adding worktree at base commit {sample.base_commit[:8]} (detached)...")
+        mirror.git.worktree(
+            "add", "--lock", "--detach", str(workspace_path), sample.base_commit
+        )
+    return git.Repo(workspace_path)
+
+
+def release_workspace(repo: git.Repo, sample: Sample, cache_dir: Optional[Path]) -> None:
+    """Unregister a workspace created by materialize_workspace from the mirror.
+
+    Workspaces fetched directly (no cache directory) own their repository and
+    need no cleanup. Mirror worktrees are removed explicitly, which drops only
+    this worktree's entry under the mirror's ``worktrees/`` directory.
+
+    Args:
+        repo: Repository returned by materialize_workspace
+        sample: Sample the workspace was created for
+        cache_dir: Cache directory passed to materialize_workspace
+    """
+    admin_dir = Path(repo.git_dir)
+    if not cache_dir or admin_dir == Path(repo.common_dir):
+        return
+
+    with locked_base_mirror(sample.repo_url, cache_dir) as mirror:
+        try:
+            # Twice --force: the worktree is locked and may hold agent edits
+            mirror.git.worktree("remove", "--force", "--force", repo.working_tree_dir)
+        except git.GitCommandError:
+            # git refuses when the worktree's .git file is missing (e.g. it
+            # could not be restored after the agent ran); drop the
+            # administrative entry directly instead
+            import shutil
+            shutil.rmtree(admin_dir, ignore_errors=True)
+
+
+def _read_patch(patch_file: Path) -> str:
+    """Read a saved edit.patch, or return "" if it is missing.
+
+    The file is read as raw bytes and decoded once, skipping text-mode newline
+    translation so multi-MB patches are not scanned twice and CRLF hunks in
+    the agent's diff survive the round trip unchanged.
+
+    Args:
+        patch_file: Path to edit.patch
+
+    Returns:
+        Unified diff text
+    """
+    try:
+        return patch_file.read_bytes().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return ""
+
+
 def capture_diff(repo: git.Repo, base_commit: str) -> str:
     """Capture unified diff from workspace.
     
@@ -108,13 +247,11 @@ def capture_diff(repo: git.Repo, base_commit: str) -> str:
         
     Returns:
         Unified diff string
+
+    Raises:
+        git.GitCommandError: If the diff cannot be produced
     """
-    try:
-        diff = repo.git.diff(base_commit, unified=True)
-        return diff
-    except Exception as e:
-        console.print(f"[yellow]Warning: Failed to capture diff: {e}[/yellow]")
-        return ""
+    return repo.git.diff(base_commit, unified=True)
 
 
 def run_edit_on_sample(
@@ -174,20 +311,15 @@ def run_edit_on_sample(
 
     if edit_summary_file.exists() and not force:
         # Load and check status
-        with open(edit_summary_file) as f:
-            edit_data = json.load(f)
+        with open(edit_summary_file, "rb") as f:
+            edit_data = from_json(f.read())
             # Only skip if the previous run was successful
             if edit_data.get("status") != "success":
                 console.print(f"[yellow]⊙ Retrying {pr_id} (previous run had status '{edit_data.get('status')}')[/yellow]")
             else:
                 console.print(f"[yellow]⊙ Skipping {pr_id} (already edited in this run)[/yellow]")
                 # Load patch from separate file
-                patch_file = edit_dir / "edit.patch"
-                if patch_file.exists():
-                    with open(patch_file) as pf:
-                        edit_data["patch_unified"] = pf.read()
-                else:
-                    edit_data["patch_unified"] = ""
+                edit_data["patch_unified"] = _read_patch(edit_dir / "edit.patch")
                 return Edit(**edit_data)
 
     # If test_label is provided, check if this PR was already edited in any run with the same test_label
@@ -202,26 +334,21 @@ def run_edit_on_sample(
                 # Check if this run has the same test_label
                 manifest_file = other_run_dir / "edit_run_manifest.json"
                 if manifest_file.exists():
-                    with open(manifest_file) as f:
-                        manifest = EditRunManifest(**json.load(f))
+                    with open(manifest_file, "rb") as f:
+                        manifest = EditRunManifest.model_validate_json(f.read())
                         if manifest.test_label == test_label:
                             # Check if this PR was edited in that run
                             other_edit_file = other_run_dir / pr_id / "edit_summary.json"
                             if other_edit_file.exists():
-                                with open(other_edit_file) as f:
-                                    edit_data = json.load(f)
+                                with open(other_edit_file, "rb") as f:
+                                    edit_data = from_json(f.read())
                                     # Only skip if the previous run was successful
                                     if edit_data.get("status") != "success":
                                         console.print(f"[yellow]⊙ Retrying {pr_id} (previous run in {other_run_dir.name} had status '{edit_data.get('status')}')[/yellow]")
                                         continue
                                     console.print(f"[yellow]⊙ Skipping {pr_id} (already edited in run {other_run_dir.name} with test label '{test_label}')[/yellow]")
                                     # Load patch from separate file
-                                    patch_file = other_run_dir / pr_id / "edit.patch"
-                                    if patch_file.exists():
-                                        with open(patch_file) as pf:
-                                            edit_data["patch_unified"] = pf.read()
-                                    else:
-                                        edit_data["patch_unified"] = ""
+                                    edit_data["patch_unified"] = _read_patch(other_run_dir / pr_id / "edit.patch")
                                     return Edit(**edit_data)
 
         # Check in pipeline mode (run_manifest.json in summaries/run_id/)
@@ -234,26 +361,21 @@ def run_edit_on_sample(
                 # Check if this run has the same test_label
                 manifest_file = other_run_dir / "run_manifest.json"
                 if manifest_file.exists():
-                    with open(manifest_file) as f:
-                        manifest = RunManifest(**json.load(f))
+                    with open(manifest_file, "rb") as f:
+                        manifest = RunManifest.model_validate_json(f.read())
                         if manifest.test_label == test_label and manifest.runner == runner and manifest.model == model:
                             # Check if this PR was edited in that run
                             other_edit_file = output_dir / runner / model_dir_name / other_run_dir.name / pr_id / "edit_summary.json"
                             if other_edit_file.exists():
-                                with open(other_edit_file) as f:
-                                    edit_data = json.load(f)
+                                with open(other_edit_file, "rb") as f:
+                                    edit_data = from_json(f.read())
                                     # Only skip if the previous run was successful
                                     if edit_data.get("status") != "success":
                                         console.print(f"[yellow]⊙ Retrying {pr_id} (previous run in {other_run_dir.name} had status '{edit_data.get('status')}')[/yellow]")
                                         continue
                                     console.print(f"[yellow]⊙ Skipping {pr_id} (already edited in run {other_run_dir.name} with test label '{test_label}')[/yellow]")
                                     # Load patch from separate file
-                                    patch_file = output_dir / runner / model_dir_name / other_run_dir.name / pr_id / "edit.patch"
-                                    if patch_file.exists():
-                                        with open(patch_file) as pf:
-                                            edit_data["patch_unified"] = pf.read()
-                                    else:
-                                        edit_data["patch_unified"] = ""
+                                    edit_data["patch_unified"] = _read_patch(output_dir / runner / model_dir_name / other_run_dir.name / pr_id / "edit.patch")
                                     return Edit(**edit_data)
 
     console.print(f"[cyan]Running edit on {pr_id}...[/cyan]")
@@ -276,18 +398,28 @@ def run_edit_on_sample(
     # Materialize workspace
     with tempfile.TemporaryDirectory() as tmpdir:
         workspace_path = Path(tmpdir) / "workspace"
+        repo = None
 
         try:
-            repo = materialize_workspace(sample, workspace_path, cache_dir)
+            with _fetch_slots:
+                repo = materialize_workspace(sample, workspace_path, cache_dir)
 
             # Hide .git from the agent to prevent history inspection
             import shutil
             git_dir = workspace_path / ".git"
             hidden_git_dir = Path(tmpdir) / ".git_hidden"
             git_was_hidden = False
+            # A cached workspace's .git is a one-line "gitdir:" pointer into
+            # the shared mirror. Keep it in memory rather than on disk, so
+            # nothing the agent can reach leads to the cache directory
+            git_pointer = None
             if git_dir.exists():
                 try:
-                    shutil.move(str(git_dir), str(hidden_git_dir))
+                    if git_dir.is_file():
+                        git_pointer = git_dir.read_bytes()
+                        git_dir.unlink()
+                    else:
+                        shutil.move(str(git_dir), str(hidden_git_dir))
                     console.print("  .git hidden from agent during execution")
                     git_was_hidden = True
                 except Exception as e:
@@ -309,27 +441,37 @@ def run_edit_on_sample(
                 workspace_path=workspace_path,
                 task_instructions=task_instructions,
                 logs_path=logs_path,
-                env=os.environ.copy(),
+                env=base_agent_env(),
             )
 
             # Restore .git after agent run (only if it was hidden)
-            if git_was_hidden and hidden_git_dir.exists() and not git_dir.exists():
+            if git_was_hidden and not git_dir.exists() and (git_pointer or hidden_git_dir.exists()):
                 try:
-                    shutil.move(str(hidden_git_dir), str(git_dir))
+                    if git_pointer:
+                        git_dir.write_bytes(git_pointer)
+                    else:
+                        shutil.move(str(hidden_git_dir), str(git_dir))
                     console.print("  .git restored after agent execution")
                     # Reopen repo after restoring .git
                     repo = git.Repo(workspace_path)
                 except Exception as e:
                     console.print(f"  [yellow]Warning: Failed to restore .git: {e}[/yellow]")
 
-            # Capture diff
+            # Capture diff. A failed diff is an error, not an empty edit
             console.print(f"  Capturing diff...")
-            patch_unified = capture_diff(repo, sample.base_commit)
+            status = result.status
+            errors = list(result.errors or [])
+            try:
+                patch_unified = capture_diff(repo, sample.base_commit)
+            except git.GitCommandError as e:
+                console.print(f"  [red]Failed to capture diff: {e}[/red]")
+                status = "error"
+                errors.append(f"Failed to capture diff: {e}")
+                patch_unified = ""
 
             # Save patch to separate file
             patch_file = edit_dir / "edit.patch"
-            with open(patch_file, "w") as f:
-                f.write(patch_unified)
+            patch_file.write_bytes(patch_unified.encode("utf-8"))
 
             # Create edit artifact
             edit = Edit(
@@ -339,29 +481,26 @@ def run_edit_on_sample(
                 runner=runner,
                 model=model,
                 timeout_s=timeout,
-                status=result.status,
+                status=status,
                 elapsed_ms=result.elapsed_ms,
                 patch_unified=patch_unified,
                 logs_path=str(logs_path.relative_to(output_dir)),
-                errors=result.errors or [],
+                errors=errors,
                 edit_run_id=run_id,
                 test_label=test_label,
             )
 
             # Write edit.json
             edit_file = edit_dir / "edit.json"
-            with open(edit_file, "w") as f:
-                f.write(edit.model_dump_json(indent=2))
+            edit_file.write_bytes(edit.dump_json())
 
             # Also write a version without the patch for easier reading
             edit_summary_file = edit_dir / "edit_summary.json"
-            edit_dict = edit.model_dump()
+            edit_dict = edit.model_dump(mode="json", exclude={"patch_unified"})  # Drop the inline patch
             edit_dict["patch_file"] = "edit.patch"
-            edit_dict.pop("patch_unified")  # Remove the inline patch
-            with open(edit_summary_file, "w") as f:
-                json.dump(edit_dict, f, indent=2)
+            edit_summary_file.write_bytes(to_json(edit_dict, indent=2))
             
-            console.print(f"[green]✓ Edit completed for {pr_id} (status: {result.status})[/green]")
+            console.print(f"[green]✓ Edit completed for {pr_id} (status: {status})[/green]")
             return edit
             
         except Exception as e:
@@ -386,23 +525,37 @@ def run_edit_on_sample(
 
             # Create empty patch file for consistency
             patch_file = edit_dir / "edit.patch"
-            with open(patch_file, "w") as f:
-                f.write("")
+            patch_file.write_bytes(b"")
 
             edit_file = edit_dir / "edit.json"
-            with open(edit_file, "w") as f:
-                f.write(edit.model_dump_json(indent=2))
+            edit_file.write_bytes(edit.dump_json())
 
             # Also write summary version
             edit_summary_file = edit_dir / "edit_summary.json"
-            edit_dict = edit.model_dump()
+            edit_dict = edit.model_dump(mode="json", exclude={"patch_unified"})
             edit_dict["patch_file"] = "edit.patch"
-            edit_dict.pop("patch_unified")
-            with open(edit_summary_file, "w") as f:
-                json.dump(edit_dict, f, indent=2)
+            edit_summary_file.write_bytes(to_json(edit_dict, indent=2))
 
             return edit
 
+        finally:
+            if repo is not None:
+                try:
+                    release_workspace(repo, sample, cache_dir)
+                except Exception as e:
+                    console.print(f"  [yellow]Warning: Failed to release workspace: {e}[/yellow]")
+
+
+def _run_edit_on_sample_buffered(**kwargs) -> Edit:
+    """Run run_edit_on_sample with its console output written as one block.
+
+    Used for concurrent edits without --stream-output: each worker buffers its
+    PR's progress lines (rich buffers per thread) and flushes once, instead
+    of writing and flushing per line interleaved with the other workers.
+    """
+    with console:
+        return run_edit_on_sample(**kwargs)
+
 
 def run_edit_stage(
     sample_path: Path,
@@ -422,6 +575,8 @@ def run_edit_stage(
     use_synthesized: bool = False,
     stream_output: bool = False,
     mcp_config_path: Optional[str] = None,
+    total_shards: int = 1,
+    shard_index: int = 0,
 ) -> str:
     """Run the edit stage.
 
@@ -443,6 +598,8 @@ def run_edit_stage(
         use_synthesized: If True, use synthesized task instructions instead of template-based
         stream_output: If True, stream agent output to console in real-time
         mcp_config_path: Optional path to MCP configuration file
+        total_shards: Total number of shards (directory input only)
+        shard_index: Current shard index (0-based)
 
     Returns:
         Edit run ID
@@ -468,8 +625,10 @@ def run_edit_stage(
     if sample_path.is_file():
         samples = [load_sample(sample_path)]
     elif sample_path.is_dir():
-        for sample_file in sample_path.rglob("sample.json"):
+        for sample_file in find_sample_files(sample_path, total_shards, shard_index):
             samples.append(load_sample(sample_file))
+        if total_shards > 1:
+            console.print(f"  Shard: {shard_index + 1}/{total_shards}")
 
     console.print(f"[bold]Running edit stage on {len(samples)} samples...[/bold]")
 
@@ -484,8 +643,8 @@ def run_edit_stage(
         python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
         timeout_s=timeout,
         concurrency=concurrency,
-        total_shards=1,
-        shard_index=0,
+        total_shards=total_shards,
+        shard_index=shard_index,
         flags={
             "disable_retrieval": disable_retrieval,
             "disable_shell": disable_shell,
@@ -500,35 +659,49 @@ def run_edit_stage(
     manifest_dir = output_dir / runner / model_dir_name / edit_run_id
     manifest_dir.mkdir(parents=True, exist_ok=True)
     manifest_file = manifest_dir / "edit_run_manifest.json"
-    with open(manifest_file, "w") as f:
-        f.write(manifest.model_dump_json(indent=2))
-
-    # For now, run sequentially (concurrency support can be added later)
-    for sample in samples:
-        run_edit_on_sample(
-            sample=sample,
-            runner=runner,
-            model=model,  # Original model name for adapter
-            agent_binary=agent_binary,
-            output_dir=output_dir,
-            timeout=timeout,
-            disable_retrieval=disable_retrieval,
-            disable_shell=disable_shell,
-            enable_mcp_codebase_qa=enable_mcp_codebase_qa,
-            run_id=edit_run_id,
-            cache_dir=cache_dir,
-            force=force,
-            test_label=test_label,
-            use_synthesized=use_synthesized,
-            stream_output=stream_output,
-            mcp_config_path=mcp_config_path,
-            model_dir=model_dir_name,  # Use model_dir_name for directory structure
-        )
+    manifest_file.write_bytes(manifest.dump_json())
+
+    edit_kwargs = dict(
+        runner=runner,
+        model=model,  # Original model name for adapter
+        agent_binary=agent_binary,
+        output_dir=output_dir,
+        timeout=timeout,
+        disable_retrieval=disable_retrieval,
+        disable_shell=disable_shell,
+        enable_mcp_codebase_qa=enable_mcp_codebase_qa,
+        run_id=edit_run_id,
+        cache_dir=cache_dir,
+        force=force,
+        test_label=test_label,
+        use_synthesized=use_synthesized,
+        stream_output=stream_output,
+        mcp_config_path=mcp_config_path,
+        model_dir=model_dir_name,  # Use model_dir_name for directory structure
+    )
+
+    if concurrency > 1:
+        # Parallel execution; workspace fetches are additionally capped by _fetch_slots.
+        # Streamed agent output bypasses the console, so only buffer without it.
+        run_one = run_edit_on_sample if stream_output else _run_edit_on_sample_buffered
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(run_one, sample=sample, **edit_kwargs): sample
+                for sample in samples
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    sample = futures[future]
+                    console.print(f"[red]✗ Edit failed for PR {sample.pr_number}: {e}[/red]")
+    else:
+        # Sequential execution
+        for sample in samples:
+            run_edit_on_sample(sample=sample, **edit_kwargs)
 
     console.print(f"\n[bold green]Edit run {edit_run_id} complete![/bold green]")
     console.print(f"Results saved to: {manifest_dir}")
 
     return edit_run_id
-    
-    console.print(f"\n[bold]Edit stage complete[/bold]")
 
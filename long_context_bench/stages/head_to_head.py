@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import json
 import hashlib
-import os
 import tempfile
 import uuid
 from datetime import datetime
@@ -22,18 +21,19 @@ from long_context_bench.models import (
     Scores,
     AgentResult,
     AgentVsHumanDecision,
-    PairwiseJudgeDecision,
     HeadToHeadAgentStats,
     HeadToHeadPRResult,
     CrossAgentJudge,
+    aggregate_score,
 )
 from long_context_bench.stages.judge import (
     load_sample,
     get_ground_truth_diff,
 )
 from long_context_bench.stages.cross_agent_analysis import find_edits_for_pr
-from long_context_bench.stages.edit import materialize_workspace
-from long_context_bench.runners import get_runner_adapter
+from long_context_bench.stages.edit import materialize_workspace, release_workspace
+from long_context_bench.ranking import agent_score_columns, pairwise_outcomes
+from long_context_bench.runners import base_agent_env, get_runner_adapter
 
 console = Console()
 
@@ -75,32 +75,35 @@ def get_codebase_context_for_pr(
 
     with tempfile.TemporaryDirectory() as tmpdir:
         workspace = Path(tmpdir) / "workspace"
-        _ = materialize_workspace(sample, workspace, cache_dir)
+        repo = materialize_workspace(sample, workspace, cache_dir)
 
-        for rel_path in changed_files:
-            file_path = workspace / rel_path
-            if not file_path.is_file():
-                continue
+        try:
+            for rel_path in changed_files:
+                file_path = workspace / rel_path
+                if not file_path.is_file():
+                    continue
 
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                continue
+                try:
+                    content = file_path.read_text(encoding="utf-8", errors="ignore")
+                except Exception:
+                    continue
 
-            encoded = content.encode("utf-8")
-            if total_bytes + len(encoded) > max_bytes:
-                remaining = max_bytes - total_bytes
-                if remaining <= 0:
-                    break
-                encoded = encoded[:remaining]
-                content = encoded.decode("utf-8", errors="ignore")
+                encoded = content.encode("utf-8")
+                if total_bytes + len(encoded) > max_bytes:
+                    remaining = max_bytes - total_bytes
+                    if remaining <= 0:
+                        break
+                    encoded = encoded[:remaining]
+                    content = encoded.decode("utf-8", errors="ignore")
 
-            context[rel_path] = content
-            selected.append(rel_path)
-            total_bytes += len(encoded)
+                context[rel_path] = content
+                selected.append(rel_path)
+                total_bytes += len(encoded)
 
-            if total_bytes >= max_bytes:
-                break
+                if total_bytes >= max_bytes:
+                    break
+        finally:
+            release_workspace(repo, sample, cache_dir)
 
     return context, selected
 
@@ -287,9 +290,7 @@ def _load_cross_agent_results_for_pr(
     # Prefer artifacts that match both test_label and judge_model
     for ca_file in sorted(ca_dir.glob(f"pr{pr_number}_*.json")):
         try:
-            with open(ca_file) as f:
-                data = json.load(f)
-            ca = CrossAgentJudge(**data)
+            ca = CrossAgentJudge.load_json(ca_file.read_bytes())
         except Exception:
             continue
 
@@ -419,46 +420,49 @@ code blocks, no additional text before or after):
     try:
         with tempfile.TemporaryDirectory() as tmpdir:
             workspace_path = Path(tmpdir) / "workspace"
-            _ = materialize_workspace(sample, workspace_path, cache_dir)
+            repo = materialize_workspace(sample, workspace_path, cache_dir)
 
-            # Write full diff files for the judge to inspect.
-            (workspace_path / "HUMAN.diff").write_text(ground_truth_diff or "", encoding="utf-8")
-            (workspace_path / "AGENT.diff").write_text(
-                edit.patch_unified or "", encoding="utf-8"
-            )
+            try:
+                # Write full diff files for the judge to inspect.
+                (workspace_path / "HUMAN.diff").write_text(ground_truth_diff or "", encoding="utf-8")
+                (workspace_path / "AGENT.diff").write_text(
+                    edit.patch_unified or "", encoding="utf-8"
+                )
 
-            logs_dir = output_dir / "head_to_head" / "logs" / f"pr{sample.pr_number}_{head_to_head_run_id}"
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            logs_hash = hashlib.sha256(
-                f"{agent_id}|{judge_runner}".encode("utf-8")
-            ).hexdigest()[:8]
-            logs_path = logs_dir / f"{judge_runner}_{logs_hash}.jsonl"
-
-            adapter = get_runner_adapter(
-                judge_runner,
-                model=judge_runner_model or "",
-                agent_binary=None,
-                timeout=1800,
-                disable_retrieval=False,
-                disable_shell=False,
-                enable_mcp_codebase_qa=False,
-                stream_output=False,
-            )
-            result = adapter.run(
-                workspace_path=workspace_path,
-                task_instructions=prompt,
-                logs_path=logs_path,
-                env=os.environ.copy(),
-            )
+                logs_dir = output_dir / "head_to_head" / "logs" / f"pr{sample.pr_number}_{head_to_head_run_id}"
+                logs_dir.mkdir(parents=True, exist_ok=True)
+                logs_hash = hashlib.sha256(
+                    f"{agent_id}|{judge_runner}".encode("utf-8")
+                ).hexdigest()[:8]
+                logs_path = logs_dir / f"{judge_runner}_{logs_hash}.jsonl"
+
+                adapter = get_runner_adapter(
+                    judge_runner,
+                    model=judge_runner_model or "",
+                    agent_binary=None,
+                    timeout=1800,
+                    disable_retrieval=False,
+                    disable_shell=False,
+                    enable_mcp_codebase_qa=False,
+                    stream_output=False,
+                )
+                result = adapter.run(
+                    workspace_path=workspace_path,
+                    task_instructions=prompt,
+                    logs_path=logs_path,
+                    env=base_agent_env(),
+                )
 
-            if result.status != "success":
-                raise RuntimeError(f"Judge runner exited with status {result.status}")
+                if result.status != "success":
+                    raise RuntimeError(f"Judge runner exited with status {result.status}")
 
-            stdout = _load_agent_stdout_from_logs(logs_path)
-            if not stdout.strip():
-                raise RuntimeError("No stdout captured from judge runner")
+                stdout = _load_agent_stdout_from_logs(logs_path)
+                if not stdout.strip():
+                    raise RuntimeError("No stdout captured from judge runner")
 
-            raw = _parse_agent_judge_output(stdout)
+                raw = _parse_agent_judge_output(stdout)
+            finally:
+                release_workspace(repo, sample, cache_dir)
 
     except Exception as e:
         console.print(f"[yellow]Warning: Agent judge {judge_runner} failed: {e}[/yellow]")
@@ -496,7 +500,7 @@ code blocks, no additional text before or after):
         matches_human = 0.0
 
     # Calculate aggregate score (average of the 5 main metrics)
-    aggregate = (correctness + completeness + code_reuse + best_practices + unsolicited_docs) / 5.0
+    aggregate = aggregate_score(correctness, completeness, code_reuse, best_practices, unsolicited_docs)
 
     return AgentVsHumanDecision(
         repo_url=sample.repo_url,
@@ -678,37 +682,19 @@ def run_head_to_head_for_pr(
         console.print("[yellow]No agent decisions produced[/yellow]")
         return None
 
-    # Calculate per-agent stats by comparing scores
-    # For each agent, count wins/losses/ties against all other agents
+    # Calculate per-agent stats by comparing scores: each decision is
+    # compared against every other decision on this PR
+    agent_ids, counts, scores = agent_score_columns(agent_decisions)
+    wins, losses, ties = (
+        counts * (mask @ counts) for mask in pairwise_outcomes(scores)
+    )
+    # A decision is not compared with itself (the diagonal counts as a tie)
+    ties -= counts
     stats_map: Dict[str, Dict[str, int]] = {
-        decision.agent_id: {"wins": 0, "losses": 0, "ties": 0} for decision in agent_decisions
+        agent_id: {"wins": int(wins[i]), "losses": int(losses[i]), "ties": int(ties[i])}
+        for i, agent_id in enumerate(agent_ids)
     }
 
-    # Create a mapping of agent_id to aggregate score for easy lookup
-    score_map: Dict[str, float] = {
-        decision.agent_id: decision.aggregate for decision in agent_decisions
-    }
-
-    # Compare each agent against every other agent based on scores
-    for i, decision_i in enumerate(agent_decisions):
-        for j, decision_j in enumerate(agent_decisions):
-            if i == j:
-                continue  # Don't compare agent to itself
-
-            agent_i = decision_i.agent_id
-            agent_j = decision_j.agent_id
-            score_i = score_map[agent_i]
-            score_j = score_map[agent_j]
-
-            # Determine win/loss/tie based on score comparison
-            # Use a small epsilon for tie detection
-            if abs(score_i - score_j) < 1e-3:
-                stats_map[agent_i]["ties"] += 1
-            elif score_i > score_j:
-                stats_map[agent_i]["wins"] += 1
-            else:
-                stats_map[agent_i]["losses"] += 1
-
     agent_stats = [
         HeadToHeadAgentStats(
             agent_id=agent_id,
@@ -737,8 +723,7 @@ def run_head_to_head_for_pr(
 
     h2h_dir.mkdir(parents=True, exist_ok=True)
     output_file = h2h_dir / f"pr{pr_number}_{head_to_head_run_id}.json"
-    with open(output_file, "w") as f:
-        f.write(h2h_result.model_dump_json(indent=2))
+    output_file.write_bytes(h2h_result.dump_json())
 
     console.print(f"[green]✓ Head-to-head results written to {output_file}[/green]")
     return head_to_head_run_id
@@ -4,25 +4,39 @@ This module uses Claude Code CLI exclusively for judging agent outputs.
 All judge operations run through the `claude` command-line tool.
 """
 
+import gzip
+import hashlib
 import json
 import os
 import platform
 import subprocess
 import sys
 import tempfile
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
 import git
 from rich.console import Console
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # Optional: falls back to the git CLI via GitPython
+
 from long_context_bench import __version__
 from long_context_bench.models import Sample, Edit, Judge, Scores, JudgeRunManifest, RunManifest
+from long_context_bench.repo_cache import fetch_missing_commits, locked_repo_mirror
 
 console = Console()
 
+# Clone options for ground-truth repositories: only the two commits being
+# diffed are ever needed, so skip history, tags, checkout and eager blobs.
+_PARTIAL_CLONE_OPTIONS = ["--filter=blob:none", "--no-checkout", "--depth=1", "--no-tags"]
+
 
 def load_edit(edit_path: Path) -> Edit:
     """Load edit from JSON file.
@@ -33,14 +47,31 @@ def load_edit(edit_path: Path) -> Edit:
     Returns:
         Edit object
     """
-    with open(edit_path) as f:
-        data = json.load(f)
-    return Edit(**data)
+    return Edit.load_json(edit_path.read_bytes())
+
+
+def load_judge(judge_path: Path) -> Judge:
+    """Load judge from JSON file.
+
+    Parses and validates in a single pass, which matters on the skip path where
+    judge.json files carry the full ground truth patch.
+
+    Args:
+        judge_path: Path to judge.json
+
+    Returns:
+        Judge object
+    """
+    return Judge.load_json(judge_path.read_bytes())
 
 
 def get_ground_truth_diff(sample: Sample, cache_dir: Optional[Path] = None) -> str:
     """Get ground truth diff from base to head commit.
 
+    Recent diffs are memoized in-process and, when a cache directory is given,
+    stored gzip-compressed on disk under ``cache_dir/diffs`` keyed by repo and
+    commit pair.
+
     Args:
         sample: Sample object
         cache_dir: Optional cache directory for repositories
@@ -48,41 +79,133 @@ def get_ground_truth_diff(sample: Sample, cache_dir: Optional[Path] = None) -> s
     Returns:
         Ground truth unified diff
     """
+    return _cached_ground_truth_diff(
+        sample.repo_url, sample.base_commit, sample.head_commit, cache_dir
+    )
+
+
+def _diff_cache_path(cache_dir: Path, repo_url: str, base_commit: str, head_commit: str) -> Path:
+    """Return the on-disk cache location for a ground truth diff."""
+    key = hashlib.sha1(f"{repo_url}|{base_commit}|{head_commit}".encode()).hexdigest()
+    return cache_dir / "diffs" / f"{key}.diff.gz"
+
+
+@lru_cache(maxsize=128)
+def _cached_ground_truth_diff(
+    repo_url: str, base_commit: str, head_commit: str, cache_dir: Optional[Path]
+) -> str:
+    """Return the ground truth diff, consulting the on-disk diff cache first."""
+    if not cache_dir:
+        return _compute_ground_truth_diff(repo_url, base_commit, head_commit, cache_dir)
+
+    diff_path = _diff_cache_path(cache_dir, repo_url, base_commit, head_commit)
+    if diff_path.exists():
+        return gzip.decompress(diff_path.read_bytes()).decode("utf-8")
+
+    diff = _compute_ground_truth_diff(repo_url, base_commit, head_commit, cache_dir)
+
+    # Write atomically so concurrent judges never observe a partial diff
+    diff_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = diff_path.with_name(f"{diff_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(gzip.compress(diff.encode("utf-8"), mtime=0))
+    tmp_path.replace(diff_path)
+    return diff
+
+
+def _diff_commits(repo: git.Repo, base_commit: str, head_commit: str) -> str:
+    """Diff two commits.
+
+    Uses libgit2 in-process when pygit2 is installed and all objects are
+    present locally. Otherwise runs git diff-tree, reading its output as bytes
+    and decoding once; in partial clones git lazily fetches the blobs it needs.
+
+    Args:
+        repo: Repository containing both commits
+        base_commit: Base commit SHA
+        head_commit: Head commit SHA
+
+    Returns:
+        Unified diff text
+    """
+    if pygit2 is not None:
+        try:
+            diff = pygit2.Repository(repo.git_dir).diff(base_commit, head_commit, context_lines=3)
+            diff.find_similar()  # rename detection, matching -M below
+            patch = diff.patch or ""
+            return patch[:-1] if patch.endswith("\n") else patch
+        except (KeyError, ValueError, UnicodeDecodeError, pygit2.GitError):
+            # Missing objects (e.g. filtered blobs) or undecodable content
+            pass
+
+    # diff-tree compares the two trees directly, skipping the index/worktree
+    # handling of porcelain `git diff`; -M keeps its default rename detection
+    proc = repo.git.diff_tree(
+        "-p", "-r", "-M", "-U3", base_commit, head_commit, as_process=True
+    )
+    buf = proc.stdout.read()
+    proc.wait()
+    # Match GitPython's default of stripping the single trailing newline
+    if buf.endswith(b"\n"):
+        buf = buf[:-1]
+    return buf.decode("utf-8", errors="replace")
+
+
+def prefetch_ground_truth_commits(samples: List[Sample], cache_dir: Path) -> None:
+    """Fetch the base/head commits for many samples with one fetch per repository.
+
+    Samples whose diff is already in the on-disk cache, and commits already
+    present locally, are skipped. Failures are reported and left for
+    get_ground_truth_diff to retry per PR.
+
+    Args:
+        samples: Samples that are about to be judged
+        cache_dir: Cache directory for repositories
+    """
+    commits_by_repo: dict[str, set[str]] = {}
+    for sample in samples:
+        if _diff_cache_path(cache_dir, sample.repo_url, sample.base_commit, sample.head_commit).exists():
+            continue
+        commits_by_repo.setdefault(sample.repo_url, set()).update(
+            (sample.base_commit, sample.head_commit)
+        )
+
+    for repo_url, commits in commits_by_repo.items():
+        try:
+            with locked_repo_mirror(repo_url, cache_dir) as repo:
+                fetch_missing_commits(repo, sorted(commits))
+        except Exception as e:
+            console.print(f"  [yellow]Warning: Failed to prefetch commits for {repo_url}: {e}[/yellow]")
+
+
+def _compute_ground_truth_diff(
+    repo_url: str, base_commit: str, head_commit: str, cache_dir: Optional[Path]
+) -> str:
+    """Fetch the base/head commits and compute their diff with git."""
     if cache_dir:
-        # Extract repo name from URL
-        repo_name = sample.repo_url.rstrip("/").split("/")[-1].replace(".git", "")
-        owner = sample.repo_url.rstrip("/").split("/")[-2]
-        cache_path = cache_dir / f"{owner}_{repo_name}"
-
-        if cache_path.exists():
-            console.print(f"  Using cached repository for ground truth")
-            repo = git.Repo(cache_path)
+        with locked_repo_mirror(repo_url, cache_dir) as repo:
             try:
-                # Shallow fetch just the required commits (no history, no tags)
-                repo.git.fetch("--no-tags", "--depth=1", "origin", sample.base_commit)
-                repo.git.fetch("--no-tags", "--depth=1", "origin", sample.head_commit)
+                # Shallow fetch just the required commits (no history, no tags),
+                # skipping any that are already present from earlier runs
+                fetch_missing_commits(repo, [base_commit, head_commit])
             except Exception as e:
                 console.print(f"  [yellow]Warning: Failed to shallow-fetch commits: {e}[/yellow]")
-        else:
-            console.print(f"  Cloning repository for ground truth...")
-            cache_path.mkdir(parents=True, exist_ok=True)
-            repo = git.Repo.clone_from(sample.repo_url, cache_path)
-            try:
-                repo.git.fetch("origin", sample.base_commit)
-                repo.git.fetch("origin", sample.head_commit)
-            except Exception as e:
-                console.print(f"  [yellow]Warning: Failed to fetch commits: {e}[/yellow]")
 
-        diff = repo.git.diff(sample.base_commit, sample.head_commit, unified=True)
+        diff = _diff_commits(repo, base_commit, head_commit)
         return diff
     else:
         with tempfile.TemporaryDirectory() as tmpdir:
-            repo = git.Repo.clone_from(sample.repo_url, tmpdir)
-            # Shallow fetch just the required commits (no history, no tags)
-            repo.git.fetch("--no-tags", "--depth=1", "origin", sample.base_commit)
-            repo.git.fetch("--no-tags", "--depth=1", "origin", sample.head_commit)
+            repo = git.Repo.clone_from(
+                repo_url, tmpdir, multi_options=_PARTIAL_CLONE_OPTIONS
+            )
+            # Shallow fetch just the required commits (no history, no tags, no blobs)
+            repo.git.fetch(
+                "--no-tags", "--depth=1", "--filter=blob:none", "origin", base_commit
+            )
+            repo.git.fetch(
+                "--no-tags", "--depth=1", "--filter=blob:none", "origin", head_commit
+            )
 
-            diff = repo.git.diff(sample.base_commit, sample.head_commit, unified=True)
+            diff = _diff_commits(repo, base_commit, head_commit)
             return diff
 
 
@@ -324,6 +447,22 @@ Score interpretation: -1 = much worse than human, 0 = human level (ground truth)
         return scores, rationale, rating, summary
 
 
+def _write_judge(judge_file: Path, judge: Judge) -> None:
+    """Write a judge artifact in a single pass.
+
+    The model is serialized once by pydantic's native encoder and the bytes are
+    written to a temp file that replaces judge.json, so an interrupted run never
+    leaves a truncated artifact for the skip path to trip over.
+
+    Args:
+        judge_file: Destination judge.json path
+        judge: Judge object to write
+    """
+    tmp_file = judge_file.with_name(f"{judge_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_file.write_bytes(judge.dump_json())
+    tmp_file.replace(judge_file)
+
+
 def judge_edit(
     sample: Sample,
     edit: Edit,
@@ -364,9 +503,7 @@ def judge_edit(
     if judge_file.exists() and not force:
         console.print(f"[yellow]⊙ Skipping {pr_id} for edit_run {edit_run_id} (already judged in this run)[/yellow]")
         # Load and return existing judge
-        with open(judge_file) as f:
-            judge_data = json.load(f)
-            return Judge(**judge_data)
+        return load_judge(judge_file)
 
     # If test_label is provided, check if this PR was already judged in any run with the same test_label
     if test_label and not force:
@@ -380,17 +517,15 @@ def judge_edit(
                 # Check if this run has the same test_label
                 manifest_file = other_run_dir / "judge_run_manifest.json"
                 if manifest_file.exists():
-                    with open(manifest_file) as f:
-                        manifest = JudgeRunManifest(**json.load(f))
+                    with open(manifest_file, "rb") as f:
+                        manifest = JudgeRunManifest.model_validate_json(f.read())
                         if manifest.test_label == test_label:
                             # Check if this PR was judged in that run (include edit_run_id in path)
                             other_judge_file = other_run_dir / edit_run_id / pr_id / "judge.json"
                             if other_judge_file.exists():
                                 console.print(f"[yellow]⊙ Skipping {pr_id} for edit_run {edit_run_id} (already judged in run {other_run_dir.name} with test label '{test_label}')[/yellow]")
                                 # Load and return existing judge
-                                with open(other_judge_file) as f:
-                                    judge_data = json.load(f)
-                                    return Judge(**judge_data)
+                                return load_judge(other_judge_file)
 
         # Check in pipeline mode (run_manifest.json in summaries/run_id/)
         summaries_dir = output_dir / "summaries"
@@ -402,17 +537,15 @@ def judge_edit(
                 # Check if this run has the same test_label
                 manifest_file = other_run_dir / "run_manifest.json"
                 if manifest_file.exists():
-                    with open(manifest_file) as f:
-                        manifest = RunManifest(**json.load(f))
+                    with open(manifest_file, "rb") as f:
+                        manifest = RunManifest.model_validate_json(f.read())
                         if manifest.test_label == test_label:
                             # Check if this PR was judged in that run (include edit_run_id in path)
                             other_judge_file = judges_base / "llm" / judge_model / other_run_dir.name / edit_run_id / pr_id / "judge.json"
                             if other_judge_file.exists():
                                 console.print(f"[yellow]⊙ Skipping {pr_id} for edit_run {edit_run_id} (already judged in run {other_run_dir.name} with test label '{test_label}')[/yellow]")
                                 # Load and return existing judge
-                                with open(other_judge_file) as f:
-                                    judge_data = json.load(f)
-                                    return Judge(**judge_data)
+                                return load_judge(other_judge_file)
 
     console.print(f"[cyan]Judging {pr_id}...[/cyan]")
 
@@ -430,15 +563,6 @@ def judge_edit(
             judge_model,
         )
 
-        # Compute aggregate score
-        aggregate = (
-            scores.correctness +
-            scores.completeness +
-            scores.code_reuse +
-            scores.best_practices +
-            scores.unsolicited_docs
-        ) / 5.0
-
         # Create judge artifact
         judge = Judge(
             repo_url=sample.repo_url,
@@ -448,7 +572,6 @@ def judge_edit(
             judge_mode="llm",
             judge_model=judge_model,
             scores=scores,
-            aggregate=aggregate,
             rationale=rationale,
             edit_run_id=edit.edit_run_id,
             judge_run_id=judge_run_id,
@@ -457,10 +580,9 @@ def judge_edit(
 
         # Write judge.json
         judge_file = judge_dir / "judge.json"
-        with open(judge_file, "w") as f:
-            f.write(judge.model_dump_json(indent=2))
+        _write_judge(judge_file, judge)
 
-        console.print(f"[green]✓ Judged {pr_id} (aggregate: {aggregate:.2f})[/green]")
+        console.print(f"[green]✓ Judged {pr_id} (aggregate: {judge.aggregate:.2f})[/green]")
         return judge
 
     except Exception as e:
@@ -481,7 +603,6 @@ def judge_edit(
                 best_practices=0.0,
                 unsolicited_docs=0.0,
             ),
-            aggregate=0.0,
             rationale=f"Error: {str(e)}",
             edit_run_id=edit.edit_run_id,
             judge_run_id=judge_run_id,
@@ -489,12 +610,22 @@ def judge_edit(
         )
         
         judge_file = judge_dir / "judge.json"
-        with open(judge_file, "w") as f:
-            f.write(judge.model_dump_json(indent=2))
-        
+        _write_judge(judge_file, judge)
+
         return judge
 
 
+def _judge_edit_buffered(**kwargs) -> Judge:
+    """Run judge_edit with its console output written as one block.
+
+    Used for concurrent judging: each worker buffers its PR's progress lines
+    (rich buffers per thread) and flushes once, instead of writing and
+    flushing per line interleaved with the other workers.
+    """
+    with console:
+        return judge_edit(**kwargs)
+
+
 def load_sample(sample_path: Path) -> Sample:
     """Load sample from JSON file.
 
@@ -504,9 +635,7 @@ def load_sample(sample_path: Path) -> Sample:
     Returns:
         Sample object
     """
-    with open(sample_path) as f:
-        data = json.load(f)
-    return Sample(**data)
+    return Sample.load_json(sample_path.read_bytes())
 
 
 def run_judge_stage(
@@ -621,13 +750,17 @@ def run_judge_stage(
 
             console.print(f"[bold]Found {len(tasks)} edits to judge[/bold]")
 
+            # Fetch every needed commit up front, one git fetch per repository
+            if cache_dir and tasks:
+                prefetch_ground_truth_commits([sample for sample, _ in tasks], cache_dir)
+
             # Judge edits with concurrency
             if concurrency > 1:
                 # Parallel execution
                 with ThreadPoolExecutor(max_workers=concurrency) as executor:
                     futures = {
                         executor.submit(
-                            judge_edit,
+                            _judge_edit_buffered,
                             sample=sample,
                             edit=edit,
                             judge_model=judge_model,
@@ -707,8 +840,7 @@ def run_judge_stage(
     manifest_dir = judges_base / "llm" / judge_model / judge_run_id
     manifest_dir.mkdir(parents=True, exist_ok=True)
     manifest_file = manifest_dir / "judge_run_manifest.json"
-    with open(manifest_file, "w") as f:
-        f.write(manifest.model_dump_json(indent=2))
+    manifest_file.write_bytes(manifest.dump_json())
 
     console.print(f"\n[bold green]Judge run {judge_run_id} complete![/bold green]")
     console.print(f"  Evaluated {len(judges)} edit(s)")
@@ -3,20 +3,42 @@
 import json
 import re
 import tempfile
+import threading
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
 import git
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from urllib3.util.retry import Retry
 
 from long_context_bench.models import Sample, SampleStats
 
 console = Console()
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
+# Serializes clone/fetch on a cached repository so PRs from the same repo can
+# be sampled concurrently (see run_pipeline)
+_repo_locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+_repo_locks_lock = threading.Lock()
+
+# Maximum number of PRs requested in a single GraphQL query
+GRAPHQL_BATCH_SIZE = 100
+
+
+_PR_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
+
+@lru_cache(maxsize=4096)
 def parse_pr_url(url: str) -> tuple[str, str, int]:
     """Parse GitHub PR URL into owner, repo, and PR number.
+
+    Cached, since the same URL is parsed by PR filtering, shard selection
+    and sampling.
     
     Args:
         url: GitHub PR URL (e.g., https://github.com/owner/repo/pull/123)
@@ -24,7 +46,7 @@ def parse_pr_url(url: str) -> tuple[str, str, int]:
     Returns:
         Tuple of (owner, repo, pr_number)
     """
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)", url)
+    match = _PR_URL_RE.match(url)
     if not match:
         raise ValueError(f"Invalid GitHub PR URL: {url}")
     owner, repo, pr_num = match.groups()
@@ -45,6 +67,52 @@ def get_pr_id(owner: str, repo: str, pr_number: int) -> str:
     return f"{owner}_{repo}_pr{pr_number}"
 
 
+def parse_pr_id(pr_id: str) -> tuple[str, str, int]:
+    """Parse a PR ID produced by get_pr_id back into its parts.
+
+    GitHub owner names cannot contain underscores, so the owner ends at the
+    first one; repository names may contain them.
+
+    Args:
+        pr_id: PR ID string (e.g., "elastic_elasticsearch_pr115001")
+
+    Returns:
+        Tuple of (owner, repo, pr_number)
+    """
+    owner, _, rest = pr_id.partition("_")
+    repo, _, pr_num = rest.rpartition("_pr")
+    if not owner or not repo or not pr_num.isdigit():
+        raise ValueError(f"Invalid PR ID: {pr_id}")
+    return owner, repo, int(pr_num)
+
+
+@lru_cache(maxsize=None)
+def _github_session(github_token: Optional[str] = None) -> requests.Session:
+    """Return a pooled GitHub API session for a token, built once per process.
+
+    Args:
+        github_token: Optional GitHub token for authentication
+
+    Returns:
+        requests.Session with auth headers, connection pooling and retries
+    """
+    session = requests.Session()
+    session.headers["Accept"] = "application/vnd.github+json"
+    if github_token:
+        session.headers["Authorization"] = f"Bearer {github_token}"
+    # 403 is deliberately not retried: GitHub uses it for bad tokens,
+    # permission errors and primary rate limits that reset only after minutes
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),  # GraphQL queries are read-only
+        raise_on_status=False,  # Surface the last response to raise_for_status
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+    return session
+
+
 def fetch_pr_metadata(
     owner: str, repo: str, pr_number: int, github_token: Optional[str] = None
 ) -> dict:
@@ -60,15 +128,75 @@ def fetch_pr_metadata(
         PR metadata dictionary
     """
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
-    headers = {}
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
-    
-    response = requests.get(url, headers=headers)
+    response = _github_session(github_token).get(url)
     response.raise_for_status()
     return response.json()
 
 
+def fetch_pr_metadata_batch(
+    prs: List[tuple[str, str, int]], github_token: str
+) -> dict[tuple[str, str, int], dict]:
+    """Fetch metadata for many PRs with batched GitHub GraphQL queries.
+
+    One query is issued per repository and per GRAPHQL_BATCH_SIZE PRs. Results
+    are shaped like the REST response fields used by the sample stage (title,
+    body, base/head SHAs and base clone URL). PRs that cannot be resolved are
+    omitted so callers can fall back to fetch_pr_metadata.
+
+    Args:
+        prs: List of (owner, repo, pr_number) tuples
+        github_token: GitHub token (GraphQL requires authentication)
+
+    Returns:
+        Mapping of (owner, repo, pr_number) to PR metadata dictionary
+    """
+    by_repo: dict[tuple[str, str], List[int]] = {}
+    for owner, repo, pr_number in prs:
+        by_repo.setdefault((owner, repo), []).append(pr_number)
+
+    session = _github_session(github_token)
+    metadata = {}
+    for (owner, repo), numbers in by_repo.items():
+        for i in range(0, len(numbers), GRAPHQL_BATCH_SIZE):
+            batch = numbers[i:i + GRAPHQL_BATCH_SIZE]
+            fields = " ".join(
+                f"pr{n}: pullRequest(number: {n}) "
+                "{ title body baseRefOid headRefOid baseRepository { url } }"
+                for n in batch
+            )
+            query = (
+                "query($owner: String!, $name: String!) "
+                f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            try:
+                response = session.post(
+                    GITHUB_GRAPHQL_URL,
+                    json={"query": query, "variables": {"owner": owner, "name": repo}},
+                )
+                response.raise_for_status()
+                repository = (response.json().get("data") or {}).get("repository") or {}
+            except Exception as e:
+                console.print(f"[yellow]Warning: GraphQL metadata fetch failed for {owner}/{repo}: {e}[/yellow]")
+                continue
+
+            for n in batch:
+                pr = repository.get(f"pr{n}")
+                # baseRepository is null when e.g. the source repo was deleted;
+                # leave those PRs to the REST fallback
+                if not pr or not pr.get("baseRepository"):
+                    continue
+                metadata[(owner, repo, n)] = {
+                    "title": pr["title"],
+                    "body": pr["body"],
+                    "base": {
+                        "sha": pr["baseRefOid"],
+                        "repo": {"clone_url": f"{pr['baseRepository']['url']}.git"},
+                    },
+                    "head": {"sha": pr["headRefOid"]},
+                }
+    return metadata
+
+
 def create_task_instructions(pr_metadata: dict) -> str:
     """Create task instructions from PR metadata using template-based approach.
 
@@ -217,6 +345,7 @@ def sample_pr(
     github_token: Optional[str] = None,
     cache_dir: Optional[Path] = None,
     force: bool = False,
+    pr_metadata: Optional[dict] = None,
 ) -> Optional[Sample]:
     """Sample a single PR and create sample.json.
 
@@ -227,6 +356,7 @@ def sample_pr(
         github_token: Optional GitHub token
         cache_dir: Optional cache directory for repositories
         force: If True, re-sample even if sample.json already exists
+        pr_metadata: Optional prefetched PR metadata (skips the REST call)
 
     Returns:
         Sample object if successful, None if failed
@@ -242,25 +372,28 @@ def sample_pr(
         if sample_file.exists() and not force:
             console.print(f"[yellow]⊙ Skipping {pr_id} (already sampled)[/yellow]")
             # Load and return existing sample
-            with open(sample_file) as f:
-                sample_data = json.load(f)
-                return Sample(**sample_data)
+            return Sample.load_json(sample_file.read_bytes())
 
         console.print(f"[cyan]Sampling {pr_id}...[/cyan]")
 
         # Fetch PR metadata
-        pr_metadata = fetch_pr_metadata(owner, repo, pr_number, github_token)
+        if pr_metadata is None:
+            pr_metadata = fetch_pr_metadata(owner, repo, pr_number, github_token)
 
         base_sha = pr_metadata["base"]["sha"]
         head_sha = pr_metadata["head"]["sha"]
         repo_url = pr_metadata["base"]["repo"]["clone_url"]
 
-        # Get or clone repository
-        git_repo = get_or_clone_repo(repo_url, cache_dir)
+        with _repo_locks_lock:
+            repo_lock = _repo_locks[repo_url]
+
+        with repo_lock:
+            # Get or clone repository
+            git_repo = get_or_clone_repo(repo_url, cache_dir)
 
-        # Fetch commits (shallow, no tags) to minimize history exposure and bandwidth
-        git_repo.git.fetch("--no-tags", "--depth=1", "origin", base_sha)
-        git_repo.git.fetch("--no-tags", "--depth=1", "origin", head_sha)
+            # Fetch commits (shallow, no tags) to minimize history exposure and bandwidth
+            git_repo.git.fetch("--no-tags", "--depth=1", "origin", base_sha)
+            git_repo.git.fetch("--no-tags", "--depth=1", "origin", head_sha)
 
         # Compute statistics
         console.print(f"  Computing statistics...")
@@ -297,8 +430,7 @@ def sample_pr(
         sample_dir.mkdir(parents=True, exist_ok=True)
 
         sample_file = sample_dir / "sample.json"
-        with open(sample_file, "w") as f:
-            f.write(sample.model_dump_json(indent=2))
+        sample_file.write_bytes(sample.dump_json())
 
         console.print(f"[green]✓ Sampled {pr_id}[/green]")
         return sample
@@ -344,10 +476,30 @@ def run_sample_stage(
 
     console.print(f"[bold]Sampling {len(pr_urls)} PRs...[/bold]")
 
+    # Prefetch metadata for PRs that still need sampling with batched GraphQL
+    # queries (requires a token); anything not resolved falls back to REST
+    prefetched: dict[tuple[str, str, int], dict] = {}
+    if github_token:
+        to_fetch = []
+        for pr_url in pr_urls:
+            try:
+                owner, repo, pr_number = parse_pr_url(pr_url)
+            except ValueError:
+                continue
+            sample_file = output_dir / dataset_version / get_pr_id(owner, repo, pr_number) / "sample.json"
+            if force or not sample_file.exists():
+                to_fetch.append((owner, repo, pr_number))
+        if len(to_fetch) > 1:
+            prefetched = fetch_pr_metadata_batch(to_fetch, github_token)
+
     successful = 0
     failed = 0
 
     for pr_url in pr_urls:
+        try:
+            pr_metadata = prefetched.get(parse_pr_url(pr_url))
+        except ValueError:
+            pr_metadata = None
         result = sample_pr(
             pr_url,
             output_dir,
@@ -355,6 +507,7 @@ def run_sample_stage(
             github_token,
             cache_dir=cache_dir,
             force=force,
+            pr_metadata=pr_metadata,
         )
         if result:
             successful += 1
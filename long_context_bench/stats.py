@@ -1,24 +1,55 @@
 """Statistics and reporting."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
-import statistics
+from typing import Iterator, Optional, List, TypeVar, Union
 
-import pandas as pd
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 
-from long_context_bench.models import Sample, Edit, Judge, AggregateSummary, HeadToHeadPRResult, HeadToHeadAgentSummary, HeadToHeadGlobalSummary
+from long_context_bench.models import FastLoad, Sample, Edit, EditLite, Judge, JudgeLite, AggregateSummary, HeadToHeadPRResult, HeadToHeadAgentSummary, HeadToHeadGlobalSummary, parse_agent_id
 
 console = Console()
 
+_ModelT = TypeVar("_ModelT", bound=FastLoad)
+
+
+def _iter_named_files(root: Path, filename: str) -> Iterator[str]:
+    """Recursively yield paths of files named ``filename`` under ``root``.
+
+    Walks with os.scandir, whose entries carry the file type from the
+    directory listing, so large results trees are scanned without building a
+    Path or issuing a stat call per entry. Symlinked directories are not
+    followed and unreadable directories are skipped.
+
+    Args:
+        root: Directory to search
+        filename: Exact file name to match (e.g. "judge.json")
+
+    Yields:
+        Matching file paths as strings
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == filename:
+                        yield entry.path
+        except OSError:
+            continue
+
 
 def compute_aggregate_summary(
     run_id: str,
     samples: List[Sample],
-    edits: List[Edit],
-    judges: List[Judge],
+    edits: List[Union[Edit, EditLite]],
+    judges: List[Union[Judge, JudgeLite]],
     edit_run_id: Optional[str] = None,
     judge_run_id: Optional[str] = None,
     test_label: Optional[str] = None,
@@ -52,24 +83,38 @@ def compute_aggregate_summary(
 
     success_rate = successful_samples / total_samples if total_samples > 0 else 0.0
 
-    # Compute mean scores and win rate
+    # Compute mean scores and win rate in one pass over an (N, 6) array:
+    # the five metric columns followed by the aggregate column
     if judges:
-        mean_correctness = statistics.mean(j.scores.correctness for j in judges)
-        mean_completeness = statistics.mean(j.scores.completeness for j in judges)
-        mean_code_reuse = statistics.mean(j.scores.code_reuse for j in judges)
-        mean_best_practices = statistics.mean(j.scores.best_practices for j in judges)
-        mean_unsolicited_docs = statistics.mean(j.scores.unsolicited_docs for j in judges)
-        mean_aggregate = statistics.mean(j.aggregate for j in judges)
-
-        # Compute standard deviation
-        if len(judges) > 1:
-            std_aggregate = statistics.stdev(j.aggregate for j in judges)
-        else:
-            std_aggregate = 0.0
+        score_matrix = np.array(
+            [
+                (
+                    j.scores.correctness,
+                    j.scores.completeness,
+                    j.scores.code_reuse,
+                    j.scores.best_practices,
+                    j.scores.unsolicited_docs,
+                    j.aggregate,
+                )
+                for j in judges
+            ],
+            dtype=np.float64,
+        )
+        (
+            mean_correctness,
+            mean_completeness,
+            mean_code_reuse,
+            mean_best_practices,
+            mean_unsolicited_docs,
+            mean_aggregate,
+        ) = score_matrix.mean(axis=0).tolist()
+        aggregates = score_matrix[:, 5]
+
+        # Sample standard deviation (matches statistics.stdev)
+        std_aggregate = float(aggregates.std(ddof=1)) if len(judges) > 1 else 0.0
 
         # Win rate: fraction of PRs where agent beat human (aggregate > 0)
-        wins = sum(1 for j in judges if j.aggregate > 0)
-        win_rate = wins / len(judges) if judges else 0.0
+        win_rate = float((aggregates > 0).mean())
     else:
         mean_correctness = 0.0
         mean_completeness = 0.0
@@ -82,7 +127,8 @@ def compute_aggregate_summary(
 
     # Compute latency metrics
     if edits:
-        mean_elapsed_ms = statistics.mean(e.elapsed_ms for e in edits)
+        elapsed = np.fromiter((e.elapsed_ms for e in edits), dtype=np.float64, count=len(edits))
+        mean_elapsed_ms = float(elapsed.mean())
         # Tasks per hour
         mean_elapsed_hours = mean_elapsed_ms / (1000 * 3600)
         tasks_per_hour = 1 / mean_elapsed_hours if mean_elapsed_hours > 0 else 0.0
@@ -121,39 +167,43 @@ def compute_aggregate_summary(
     )
 
 
-def load_results_from_dir(results_dir: Path) -> tuple[List[Sample], List[Edit], List[Judge]]:
+def _load_models(
+    executor: ThreadPoolExecutor, model_cls: type[_ModelT], root: Path, filename: str
+) -> List[_ModelT]:
+    """Load every ``filename`` under ``root`` as ``model_cls`` on a thread pool.
+
+    Args:
+        executor: Thread pool to read files on
+        model_cls: Artifact model to load each file as
+        root: Directory to search (may not exist)
+        filename: Exact file name to load
+
+    Returns:
+        List of loaded models, in walk order
+    """
+    if not root.exists():
+        return []
+    return model_cls.load_many(_iter_named_files(root, filename), executor)
+
+
+def load_results_from_dir(
+    results_dir: Path, lite: bool = False
+) -> tuple[List[Sample], List[Union[Edit, EditLite]], List[Union[Judge, JudgeLite]]]:
     """Load all results from a directory.
 
     Args:
         results_dir: Results directory
+        lite: Load edits and judges as EditLite/JudgeLite, leaving out the
+            patches and rationales that summaries never read
 
     Returns:
         Tuple of (samples, edits, judges)
     """
-    samples = []
-    edits = []
-    judges = []
-
-    # Load samples
-    samples_dir = results_dir / "samples"
-    if samples_dir.exists():
-        for sample_file in samples_dir.rglob("sample.json"):
-            with open(sample_file) as f:
-                samples.append(Sample(**json.load(f)))
-
-    # Load edits
-    edits_dir = results_dir / "edits"
-    if edits_dir.exists():
-        for edit_file in edits_dir.rglob("edit.json"):
-            with open(edit_file) as f:
-                edits.append(Edit(**json.load(f)))
-
-    # Load judges
-    judges_dir = results_dir / "judges"
-    if judges_dir.exists():
-        for judge_file in judges_dir.rglob("judge.json"):
-            with open(judge_file) as f:
-                judges.append(Judge(**json.load(f)))
+    edit_cls, judge_cls = (EditLite, JudgeLite) if lite else (Edit, Judge)
+    with ThreadPoolExecutor() as executor:
+        samples = _load_models(executor, Sample, results_dir / "samples", "sample.json")
+        edits = _load_models(executor, edit_cls, results_dir / "edits", "edit.json")
+        judges = _load_models(executor, judge_cls, results_dir / "judges", "judge.json")
 
     return samples, edits, judges
 
@@ -179,7 +229,7 @@ def generate_summary_for_runs(
         console.print(f"  Judge run ID: {judge_run_id}")
 
     # Load all results
-    all_samples, all_edits, all_judges = load_results_from_dir(results_dir)
+    all_samples, all_edits, all_judges = load_results_from_dir(results_dir, lite=True)
 
     # If only judge_run_id provided, infer edit_run_ids from the judge manifest
     edit_run_ids: Optional[List[str]] = None
@@ -188,9 +238,9 @@ def generate_summary_for_runs(
 
         manifest_path = results_dir / "judges"
         if manifest_path.exists():
-            for manifest_file in manifest_path.rglob("judge_run_manifest.json"):
-                with open(manifest_file) as f:
-                    manifest = JudgeRunManifest(**json.load(f))
+            for manifest_file in _iter_named_files(manifest_path, "judge_run_manifest.json"):
+                with open(manifest_file, "rb") as f:
+                    manifest = JudgeRunManifest.model_validate_json(f.read())
                     if manifest.judge_run_id == judge_run_id:
                         edit_run_ids = manifest.edit_run_ids
                         break
@@ -234,9 +284,9 @@ def generate_summary_for_runs(
         from long_context_bench.models import EditRunManifest
         edits_dir = results_dir / "edits"
         if edits_dir.exists():
-            for manifest_file in edits_dir.rglob("edit_run_manifest.json"):
-                with open(manifest_file) as f:
-                    manifest = EditRunManifest(**json.load(f))
+            for manifest_file in _iter_named_files(edits_dir, "edit_run_manifest.json"):
+                with open(manifest_file, "rb") as f:
+                    manifest = EditRunManifest.model_validate_json(f.read())
                     if manifest.edit_run_id == edit_run_id:
                         test_label = manifest.test_label
                         break
@@ -246,9 +296,9 @@ def generate_summary_for_runs(
         from long_context_bench.models import JudgeRunManifest
         judges_dir = results_dir / "judges"
         if judges_dir.exists():
-            for manifest_file in judges_dir.rglob("judge_run_manifest.json"):
-                with open(manifest_file) as f:
-                    manifest = JudgeRunManifest(**json.load(f))
+            for manifest_file in _iter_named_files(judges_dir, "judge_run_manifest.json"):
+                with open(manifest_file, "rb") as f:
+                    manifest = JudgeRunManifest.model_validate_json(f.read())
                     if manifest.judge_run_id == judge_run_id:
                         test_label = manifest.test_label
                         break
@@ -315,10 +365,10 @@ def generate_summary_for_runs(
         output_dir.mkdir(parents=True, exist_ok=True)
 
         summary_file = output_dir / "summary.json"
-        with open(summary_file, "w") as f:
-            f.write(summary.model_dump_json(indent=2))
+        summary_file.write_bytes(summary.dump_json())
 
         csv_file = output_dir / "summary.csv"
+        import pandas as pd
         df = pd.DataFrame([summary.model_dump()])
         df.to_csv(csv_file, index=False)
 
@@ -379,20 +429,20 @@ def generate_comparison(
     # Find edit run manifests
     edits_dir = results_dir / "edits"
     if edits_dir.exists():
-        for manifest_file in edits_dir.rglob("edit_run_manifest.json"):
-            with open(manifest_file) as f:
+        for manifest_file in _iter_named_files(edits_dir, "edit_run_manifest.json"):
+            with open(manifest_file, "rb") as f:
                 from long_context_bench.models import EditRunManifest
-                manifest = EditRunManifest(**json.load(f))
+                manifest = EditRunManifest.model_validate_json(f.read())
                 if manifest.test_label == test_label:
                     edit_manifests.append(manifest)
 
     # Find judge run manifests
     judges_dir = results_dir / "judges"
     if judges_dir.exists():
-        for manifest_file in judges_dir.rglob("judge_run_manifest.json"):
-            with open(manifest_file) as f:
+        for manifest_file in _iter_named_files(judges_dir, "judge_run_manifest.json"):
+            with open(manifest_file, "rb") as f:
                 from long_context_bench.models import JudgeRunManifest
-                manifest = JudgeRunManifest(**json.load(f))
+                manifest = JudgeRunManifest.model_validate_json(f.read())
                 if manifest.test_label == test_label:
                     judge_manifests.append(manifest)
 
@@ -404,7 +454,7 @@ def generate_comparison(
         return
 
     # Load all results
-    all_samples, all_edits, all_judges = load_results_from_dir(results_dir)
+    all_samples, all_edits, all_judges = load_results_from_dir(results_dir, lite=True)
 
     # Group results by runner/model combination
     from collections import defaultdict
@@ -462,6 +512,7 @@ def generate_comparison(
                 json.dump(output_data, f, indent=2)
         elif output_file.suffix == ".csv":
             # Write CSV with one row per agent
+            import pandas as pd
             df = pd.DataFrame([s.model_dump() for s in summaries.values()])
             df.to_csv(output_file, index=False)
 
@@ -488,17 +539,21 @@ def generate_head_to_head_summary(
         console.print(f"[yellow]No head_to_head directory found under {results_dir}[/yellow]")
         return None
 
-    # Load all head-to-head results
-    results: List[HeadToHeadPRResult] = []
-    for result_file in h2h_dir.glob("pr*_*.json"):
+    # Load all head-to-head results, skipping unreadable files
+    def _load_result(result_file: Path) -> Optional[HeadToHeadPRResult]:
         try:
-            with open(result_file) as f:
-                data = json.load(f)
-            result = HeadToHeadPRResult(**data)
-            if result.test_label is None or result.test_label == test_label:
-                results.append(result)
+            return HeadToHeadPRResult.load_json(result_file.read_bytes())
         except Exception as e:  # pragma: no cover - defensive
             console.print(f"[yellow]Warning: Failed to load {result_file}: {e}[/yellow]")
+            return None
+
+    with ThreadPoolExecutor() as executor:
+        loaded = list(executor.map(_load_result, h2h_dir.glob("pr*_*.json")))
+    results: List[HeadToHeadPRResult] = [
+        result
+        for result in loaded
+        if result is not None and (result.test_label is None or result.test_label == test_label)
+    ]
 
     if not results:
         console.print(f"[yellow]No head-to-head results found for test label '{test_label}'[/yellow]")
@@ -514,42 +569,48 @@ def generate_head_to_head_summary(
             all_agent_decisions.extend(r.agent_decisions)
         # Fall back to old format
         elif hasattr(r, 'pairwise_decisions') and r.pairwise_decisions:
-            all_pairwise_decisions.extend(r.pairwise_decisions)
+            all_pairwise_decisions.extend(r.legacy_pairwise_decisions())
 
     from long_context_bench.ranking import (
-        compute_win_loss_matrix,
         compute_elo_ratings,
-        compute_win_loss_matrix_from_scores,
         compute_elo_ratings_from_scores,
+        nest_win_loss_counts,
+        win_loss_counts,
+        win_loss_counts_from_scores,
     )
 
     # Use new score-based ranking if we have agent decisions
     if all_agent_decisions:
         console.print(f"  Using score-based ranking from {len(all_agent_decisions)} agent decisions")
-        matrix = compute_win_loss_matrix_from_scores(all_agent_decisions)
+        agent_ids, counts = win_loss_counts_from_scores(all_agent_decisions)
+        matrix = nest_win_loss_counts(agent_ids, counts)
         elo_ratings = compute_elo_ratings_from_scores(all_agent_decisions)
     # Fall back to old pairwise ranking
     elif all_pairwise_decisions:
         console.print(f"  Using pairwise ranking from {len(all_pairwise_decisions)} pairwise decisions (legacy)")
-        matrix = compute_win_loss_matrix(all_pairwise_decisions)
+        agent_ids, counts = win_loss_counts(all_pairwise_decisions)
+        matrix = nest_win_loss_counts(agent_ids, counts)
         elo_ratings = compute_elo_ratings(all_pairwise_decisions)
     else:
         console.print("[yellow]No decisions found in results[/yellow]")
         return None
 
+    # Per-agent (wins, losses, ties) totals across all opponents
+    totals = counts.sum(axis=1)
+    matches_per_agent = totals.sum(axis=1)
+    win_rates = np.divide(
+        totals[:, 0] + 0.5 * totals[:, 2],
+        matches_per_agent,
+        out=np.zeros(len(agent_ids)),
+        where=matches_per_agent > 0,
+    )
+
     # Build per-agent summaries
     agent_summaries = []
-    for agent_id, opponents in matrix.items():
-        wins = sum(v["wins"] for v in opponents.values())
-        losses = sum(v["losses"] for v in opponents.values())
-        ties = sum(v["ties"] for v in opponents.values())
-        matches = wins + losses + ties
-        win_rate = (wins + 0.5 * ties) / matches if matches > 0 else 0.0
-
-        # Parse runner/model from agent_id (runner:model:edit_run_id)
-        parts = agent_id.split(":", 2)
-        runner = parts[0] if len(parts) >= 1 else ""
-        model = parts[1] if len(parts) >= 2 else ""
+    for agent_id, (wins, losses, ties), matches, win_rate in zip(
+        agent_ids, totals.tolist(), matches_per_agent.tolist(), win_rates.tolist()
+    ):
+        runner, model, _ = parse_agent_id(agent_id)
 
         agent_summaries.append(
             {
@@ -618,9 +679,9 @@ def generate_head_to_head_summary(
     if output_file:
         output_file.parent.mkdir(parents=True, exist_ok=True)
         if output_file.suffix == ".json":
-            with open(output_file, "w") as f:
-                f.write(global_summary.model_dump_json(indent=2))
+            output_file.write_bytes(global_summary.dump_json())
         elif output_file.suffix == ".csv":
+            import pandas as pd
             df = pd.DataFrame([a.model_dump() for a in agents_model])
             df.to_csv(output_file, index=False)
         console.print(f"[green]Head-to-head summary written to {output_file}[/green]")
@@ -743,7 +804,7 @@ def generate_stats(
     console.print(f"[bold]Generating statistics from {results_dir}[/bold]")
 
     # Load results
-    samples, edits, judges = load_results_from_dir(results_dir)
+    samples, edits, judges = load_results_from_dir(results_dir, lite=True)
 
     console.print(f"  Loaded {len(samples)} samples")
     console.print(f"  Loaded {len(edits)} edits")
@@ -784,9 +845,9 @@ def generate_stats(
     # Write output file
     if output_file:
         if output_file.suffix == ".json":
-            with open(output_file, "w") as f:
-                f.write(summary.model_dump_json(indent=2))
+            output_file.write_bytes(summary.dump_json())
         elif output_file.suffix == ".csv":
+            import pandas as pd
             df = pd.DataFrame([summary.model_dump()])
             df.to_csv(output_file, index=False)
 
@@ -926,7 +987,7 @@ def generate_index_manifest(output_dir: Path) -> None:
     # Scan summaries directory
     summaries_dir = output_dir / "summaries"
     if summaries_dir.exists():
-        for summary_file in summaries_dir.rglob("summary.json"):
+        for summary_file in _iter_named_files(summaries_dir, "summary.json"):
             try:
                 with open(summary_file) as f:
                     summary = json.load(f)
@@ -983,7 +1044,7 @@ def generate_index_manifest(output_dir: Path) -> None:
                     "model": model,
                     "judge_mode": judge_mode,
                     "judge_model": judge_model,
-                    "summary_path": str(summary_file.relative_to(output_dir)),
+                    "summary_path": str(Path(summary_file).relative_to(output_dir)),
                     "pr_ids": pr_ids,
                     "total_samples": summary.get("total_samples", 0),
                     "success_rate": summary.get("success_rate", 0),
@@ -69,3 +69,9 @@ def test_filter_pr_urls_invalid_index():
     assert len(filtered) == 1
     assert filtered[0] == urls[0]
 
+
+def test_load_pr_urls_returns_independent_lists():
+    """Cached dataset loads still hand each caller its own list."""
+    urls = load_pr_urls("v1")
+    urls.clear()
+    assert len(load_pr_urls("v1")) == 100
@@ -0,0 +1,110 @@
+"""Tests for the edit stage."""
+
+import json
+import shutil
+from pathlib import Path
+
+import git
+
+from long_context_bench.models import Sample, SampleStats
+from long_context_bench.stages.edit import (
+    capture_diff,
+    materialize_workspace,
+    release_workspace,
+    run_edit_on_sample,
+)
+
+
+def _make_sample(repo_url: str, base_commit: str) -> Sample:
+    stats = SampleStats(
+        files_changed=1,
+        lines_added=1,
+        lines_deleted=0,
+        total_diff_hunks=1,
+        context_size_bytes=0,
+        truncated=False,
+    )
+    return Sample(
+        dataset_version="v0",
+        repo_url=repo_url,
+        pr_number=1,
+        base_commit=base_commit,
+        head_commit=base_commit,
+        task_instructions="Edit app.py",
+        stats=stats,
+    )
+
+
+def test_mirror_worktrees_survive_concurrent_workspaces(tmp_path, monkeypatch):
+    """A workspace whose .git is hidden keeps its worktree while others are added."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Bench")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "bench@example.com")
+
+    origin = git.Repo.init(tmp_path / "owner" / "repo")
+    (tmp_path / "owner" / "repo" / "app.py").write_text("print('hello')\n")
+    origin.git.add("app.py")
+    origin.git.commit("-m", "base")
+    sample = _make_sample(f"file://{origin.working_tree_dir}", origin.head.commit.hexsha)
+    cache_dir = tmp_path / "cache"
+
+    first_path = tmp_path / "first" / "workspace"
+    first = materialize_workspace(sample, first_path, cache_dir)
+
+    # Hide the first workspace's .git the way run_edit_on_sample does while
+    # its agent runs, then bring up a second workspace on the same mirror
+    hidden = tmp_path / "first" / ".git_hidden"
+    shutil.move(str(first_path / ".git"), str(hidden))
+    (first_path / "app.py").write_text("print('edited')\n")
+    second = materialize_workspace(sample, tmp_path / "second" / "workspace", cache_dir)
+    shutil.move(str(hidden), str(first_path / ".git"))
+
+    # Both workspaces share a basename, so a pruned entry would be silently
+    # reused by the second worktree rather than going missing
+    admin_gitdir = Path(first.git_dir) / "gitdir"
+    assert admin_gitdir.read_text().strip() == str(first_path / ".git")
+    assert "+print('edited')" in capture_diff(git.Repo(first_path), sample.base_commit)
+
+    release_workspace(first, sample, cache_dir)
+    release_workspace(second, sample, cache_dir)
+    mirror = git.Repo(first.common_dir)
+    assert mirror.git.worktree("list").count("\n") == 0
+
+
+def test_agent_cannot_reach_the_mirror_during_run(tmp_path, monkeypatch):
+    """While the agent runs, no file around the workspace points into the cache."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Bench")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "bench@example.com")
+
+    origin = git.Repo.init(tmp_path / "owner" / "repo")
+    (tmp_path / "owner" / "repo" / "app.py").write_text("print('hello')\n")
+    origin.git.add("app.py")
+    origin.git.commit("-m", "base")
+    sample = _make_sample(f"file://{origin.working_tree_dir}", origin.head.commit.hexsha)
+
+    # The agent searches its workspace and the directory around it
+    agent = tmp_path / "agent.sh"
+    agent.write_text("#!/bin/sh\ncat >/dev/null\ngrep -rl gitdir ..\necho edited >> app.py\n")
+    agent.chmod(0o755)
+
+    edit = run_edit_on_sample(
+        sample,
+        runner="generic",
+        model="none",
+        agent_binary=str(agent),
+        output_dir=tmp_path / "out",
+        timeout=60,
+        disable_retrieval=False,
+        disable_shell=False,
+        enable_mcp_codebase_qa=False,
+        run_id="run1",
+        cache_dir=tmp_path / "cache",
+    )
+
+    assert edit.status == "success"
+    assert "+edited" in edit.patch_unified
+    log = json.loads((tmp_path / "out" / edit.logs_path).read_text())
+    assert log["stdout"] == ""
@@ -1,6 +1,9 @@
 """Tests for judge stage."""
 
+import gzip
+
 import pytest
+from long_context_bench.stages import judge as judge_stage
 from long_context_bench.stages.judge import compute_llm_scores
 from long_context_bench.models import Scores
 
@@ -38,3 +41,25 @@ index abc123..def456 100644
     assert -1.0 <= scores.unsolicited_docs <= 1.0
     assert len(rationale) > 0
 
+
+
+def test_ground_truth_diff_cache_is_compressed(tmp_path, monkeypatch):
+    """Cached ground truth diffs are stored gzipped and read back on a miss."""
+    diff = "diff --git a/file.py b/file.py\n+print('universe')\n"
+    calls = []
+
+    def fake_compute(repo_url, base_commit, head_commit, cache_dir):
+        calls.append(head_commit)
+        return diff
+
+    monkeypatch.setattr(judge_stage, "_compute_ground_truth_diff", fake_compute)
+    repo_url = "https://github.com/elastic/elasticsearch"
+
+    assert judge_stage._cached_ground_truth_diff(repo_url, "abc", "def", tmp_path) == diff
+    diff_path = judge_stage._diff_cache_path(tmp_path, repo_url, "abc", "def")
+    assert gzip.decompress(diff_path.read_bytes()).decode() == diff
+
+    # A fresh process (empty memo) reads the file instead of recomputing
+    judge_stage._cached_ground_truth_diff.cache_clear()
+    assert judge_stage._cached_ground_truth_diff(repo_url, "abc", "def", tmp_path) == diff
+    assert calls == ["def"]
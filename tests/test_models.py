@@ -6,6 +6,7 @@ from long_context_bench.models import (
     EditRunManifest, JudgeRunManifest, AggregateSummary,
     AgentResult, AgentVsHumanDecision, PairwiseJudgeDecision, HeadToHeadAgentStats,
     HeadToHeadPRResult, HeadToHeadAgentSummary, HeadToHeadGlobalSummary,
+    parse_agent_id,
 )
 
 
@@ -85,6 +86,11 @@ def test_scores():
     assert scores.correctness == 0.8
     assert scores.completeness == 0.9
 
+    # Scores are immutable and hashable
+    with pytest.raises(ValueError):
+        scores.correctness = 0.1
+    assert hash(scores) == hash(scores.model_copy())
+
     # Test bounds
     with pytest.raises(ValueError):
         Scores(
@@ -122,6 +128,36 @@ def test_judge():
     assert judge.aggregate == 0.85
     assert judge.scores.correctness == 0.8
 
+def test_judge_aggregate_is_derived_from_scores():
+    """Aggregate is the mean of the scores and survives a JSON round trip."""
+    scores = Scores(
+        correctness=0.5,
+        completeness=0.0,
+        code_reuse=-0.5,
+        best_practices=1.0,
+        unsolicited_docs=0.5,
+    )
+    judge = Judge(
+        repo_url="https://github.com/elastic/elasticsearch",
+        pr_number=115001,
+        base_commit="abc123",
+        head_commit="def456",
+        scores=scores,
+    )
+
+    assert judge.aggregate == pytest.approx(0.3)
+
+    # Older judge.json files store aggregate; the stored value is ignored on load
+    data = judge.model_dump()
+    assert data["aggregate"] == pytest.approx(0.3)
+    data["aggregate"] = 0.9
+    assert Judge.model_validate(data).aggregate == pytest.approx(0.3)
+
+    # dump_json writes the same bytes as model_dump_json, computed field included
+    assert judge.dump_json() == judge.model_dump_json(indent=2).encode()
+    assert Judge.load_json(judge.dump_json()) == judge
+
+
 def test_edit_run_manifest_with_test_label():
     """Test EditRunManifest with test_label."""
     manifest = EditRunManifest(
@@ -218,6 +254,9 @@ def test_agent_vs_human_decision_model():
     assert decision.correctness == 0.8
     assert decision.aggregate == 0.85
     assert decision.matches_human == 0.75
+    assert decision.agent_parts == ("runner1", "model1", "run1")
+    assert parse_agent_id("runner1:model1") == ("runner1", "model1", "")
+    assert parse_agent_id("runner1:model:with:colons")[1:] == ("model", "with:colons")
 
 
 def test_pairwise_judge_decision_model():
@@ -316,6 +355,120 @@ def test_head_to_head_pr_result_model():
     assert dumped["agent_stats"][0]["wins"] == 1
     assert dumped["agent_decisions"][0]["agent_id"] == "runner1:model1:run1"
     assert dumped["agent_decisions"][0]["aggregate"] == 0.85
+    assert h2h.legacy_pairwise_decisions() == []
+
+    # Legacy pairwise decisions load raw and are validated on request
+    legacy = dumped | {
+        "pairwise_decisions": [
+            {
+                "repo_url": "https://github.com/elastic/elasticsearch",
+                "pr_number": 115001,
+                "submission_a_id": "runner1:model1:run1",
+                "submission_b_id": "runner2:model2:run2",
+                "winner": "A",
+                "timestamp": "2025-01-01T00:00:00",
+            }
+        ]
+    }
+    loaded = HeadToHeadPRResult.model_validate(legacy)
+    assert isinstance(loaded.pairwise_decisions[0], dict)
+    (decision,) = loaded.legacy_pairwise_decisions()
+    assert isinstance(decision, PairwiseJudgeDecision)
+    assert decision.winner == "A"
+    # Submission IDs are interned like agent IDs, since ranking keys on them
+    fields = decision.model_dump()
+    first, second = (
+        PairwiseJudgeDecision(**{**fields, "submission_a_id": "".join(["runner1:", "model1:run1"])})
+        for _ in range(2)
+    )
+    assert first.submission_a_id is second.submission_a_id
+
+
+def test_from_trusted_builds_nested_models():
+    """from_trusted skips validation but still builds nested models."""
+    scores = Scores(
+        correctness=0.5,
+        completeness=0.5,
+        code_reuse=0.5,
+        best_practices=0.5,
+        unsolicited_docs=0.5,
+    )
+    result = AgentResult(
+        runner="runner1",
+        model="model1",
+        edit_run_id="run1",
+        status="success",
+        elapsed_ms=1234,
+        patch_unified="",
+        scores=scores,
+        aggregate=0.5,
+    )
+    data = result.model_dump()
+    data["unknown_key"] = "dropped"
+
+    trusted = AgentResult.from_trusted(data)
+
+    assert trusted == result
+    assert isinstance(trusted.scores, Scores)
+    assert not hasattr(trusted, "unknown_key")
+
+
+def test_identifier_strings_are_interned():
+    """Repeated runner/model strings share one object across loaded artifacts."""
+    scores = Scores(
+        correctness=0.5,
+        completeness=0.5,
+        code_reuse=0.5,
+        best_practices=0.5,
+        unsolicited_docs=0.5,
+    )
+    data = AgentResult(
+        runner="runner1",
+        model="model1",
+        edit_run_id="run1",
+        status="success",
+        elapsed_ms=1234,
+        patch_unified="",
+        scores=scores,
+        aggregate=0.5,
+    ).model_dump_json()
+
+    first = AgentResult.load_json(data)
+    second = AgentResult.load_json(data)
+    trusted = AgentResult.from_trusted(first.model_dump())
+
+    assert first.runner is second.runner is trusted.runner
+    assert first.model is second.model
+    assert first.patch_unified == second.patch_unified
+
+
+def test_load_many_keeps_path_order(tmp_path):
+    """load_many loads every file and returns models in input order."""
+    paths = []
+    for pr_number in (3, 1, 2):
+        path = tmp_path / f"pr{pr_number}.json"
+        path.write_text(
+            Edit(
+                repo_url="https://github.com/test/repo",
+                pr_number=pr_number,
+                base_commit="abc",
+                runner="auggie",
+                model="sonnet",
+                timeout_s=60,
+                status="success",
+                elapsed_ms=10,
+                patch_unified="",
+                logs_path="logs.jsonl",
+                edit_run_id="run1",
+            ).model_dump_json()
+        )
+        paths.append(path)
+
+    edits = Edit.load_many(paths)
+
+    assert [e.pr_number for e in edits] == [3, 1, 2]
+    with pytest.raises(FileNotFoundError):
+        Edit.load_many([paths[0], tmp_path / "missing.json"])
 
 
 def test_head_to_head_global_summary_model():
@@ -1,7 +1,15 @@
 """Tests for pipeline utilities."""
 
+import hashlib
+
 import pytest
-from long_context_bench.pipeline import compute_shard_hash, should_process_in_shard, _run_single_agent
+from long_context_bench.pipeline import (
+    compute_shard_hash,
+    should_process_in_shard,
+    _run_single_agent,
+    _select_shard_prs,
+    _iter_pipeline_samples,
+)
 
 
 def test_compute_shard_hash():
@@ -16,6 +24,10 @@ def test_compute_shard_hash():
     # Different inputs should produce different hash
     assert hash1 != hash3
 
+    # Shard assignment must stay stable across versions: the full MD5 as an int
+    key = b"https://github.com/elastic/elasticsearch:115001"
+    assert hash1 == int(hashlib.md5(key).hexdigest(), 16)
+
 
 def test_should_process_in_shard():
     """Test shard assignment."""
@@ -51,6 +63,68 @@ def test_should_process_in_shard():
     assert all(count < 2 * avg for count in shard_counts)
 
 
+def test_select_shard_prs_partitions_and_parses_once():
+    """Shards partition the URLs and carry the parsed URL parts along."""
+    pr_urls = [f"https://github.com/elastic/elasticsearch/pull/{n}" for n in range(115001, 115021)]
+    pr_urls.append("not-a-pr-url")
+
+    shards = [_select_shard_prs(pr_urls, 3, shard) for shard in range(3)]
+
+    selected = [url for shard in shards for url, _, _, _ in shard]
+    assert sorted(selected) == sorted(pr_urls[:-1])
+    url, owner, repo, pr_number = shards[0][0]
+    assert (owner, repo) == ("elastic", "elasticsearch")
+    assert url.endswith(f"/pull/{pr_number}")
+
+
+def test_iter_pipeline_samples_yields_as_completed(monkeypatch, tmp_path):
+    """With concurrency, a slow PR does not hold back samples that are ready."""
+    import threading
+    import long_context_bench.pipeline as pipeline
+
+    release_first = threading.Event()
+
+    def fake_sample_pr(pr_url, *args, **kwargs):
+        if pr_url.endswith("/1"):
+            assert release_first.wait(timeout=5)
+        return pr_url
+
+    monkeypatch.setattr(pipeline, "sample_pr", fake_sample_pr)
+    shard_prs = [(f"https://github.com/o/r/pull/{n}", "o", "r", n) for n in (1, 2)]
+
+    samples = _iter_pipeline_samples(shard_prs, tmp_path, "vtest", None, tmp_path, False, concurrency=2)
+    assert next(samples) == "https://github.com/o/r/pull/2"
+    release_first.set()
+    assert list(samples) == ["https://github.com/o/r/pull/1"]
+
+
+def test_run_single_agent_edits_samples_concurrently(monkeypatch, tmp_path):
+    """With concurrency, an agent edits several samples at once and judges each."""
+    import threading
+    from types import SimpleNamespace
+    import long_context_bench.pipeline as pipeline
+
+    both_editing = threading.Barrier(2, timeout=5)
+
+    def fake_edit(sample, **kwargs):
+        both_editing.wait()
+        return f"edit-{sample.pr_number}"
+
+    monkeypatch.setattr(pipeline, "_run_edit_on_sample_buffered", fake_edit)
+    monkeypatch.setattr(pipeline, "_judge_edit_buffered", lambda sample, edit, **kwargs: f"judge-{edit}")
+    samples = [SimpleNamespace(pr_number=n) for n in (1, 2)]
+
+    result = _run_single_agent(
+        runner="auggie", model="m", agent_binary=None, samples=iter(samples),
+        output_dir=tmp_path, timeout=1, disable_retrieval=False, disable_shell=False,
+        enable_mcp_codebase_qa=False, run_id="run", cache_dir=tmp_path, force=False,
+        test_label=None, judge_model="j", dataset_version="v0", concurrency=2,
+    )
+
+    assert result["edits"] == ["edit-1", "edit-2"]
+    assert result["judges"] == ["judge-edit-1", "judge-edit-2"]
+
+
 def test_agent_config_parsing():
     """Test agent configuration parsing for parallel execution."""
     # Test single agent config
@@ -79,3 +153,66 @@ def test_agent_config_parsing():
     }]
     assert agent_configs[0]["agent_binary"] == "/usr/local/bin/auggie"
 
+
+
+def test_find_sample_files_partitions_by_shard(tmp_path):
+    """Test that sample discovery assigns each sample to exactly one shard."""
+    from long_context_bench.stages.edit import find_sample_files
+
+    for pr_number in range(115001, 115021):
+        sample_dir = tmp_path / "v0" / f"elastic_elasticsearch_pr{pr_number}"
+        sample_dir.mkdir(parents=True)
+        (sample_dir / "sample.json").write_text("{}")
+
+    all_files = find_sample_files(tmp_path)
+    assert len(all_files) == 20
+
+    shards = [set(find_sample_files(tmp_path, 3, shard)) for shard in range(3)]
+    assert sum(len(s) for s in shards) == 20
+    assert set().union(*shards) == set(all_files)
+
+
+def test_edit_and_pipeline_pick_the_same_shard(tmp_path):
+    """The staged edit command and the pipeline assign each PR to the same shard."""
+    from long_context_bench.stages.edit import find_sample_files
+    from long_context_bench.stages.sample import get_pr_id
+
+    pr_urls = [
+        f"https://github.com/{repo}/pull/{n}"
+        for repo in ("elastic/elasticsearch", "psf/requests_toolbelt", "my-org/x_y_z")
+        for n in range(1, 15)
+    ]
+    for url in pr_urls:
+        _, _, owner, repo, _, n = url.rsplit("/", 5)
+        sample_dir = tmp_path / "v0" / get_pr_id(owner, repo, int(n))
+        sample_dir.mkdir(parents=True)
+        (sample_dir / "sample.json").write_text("{}")
+
+    for shard in range(3):
+        pipeline_ids = {
+            get_pr_id(owner, repo, n) for _, owner, repo, n in _select_shard_prs(pr_urls, 3, shard)
+        }
+        edit_ids = {f.parent.name for f in find_sample_files(tmp_path, 3, shard)}
+        assert edit_ids == pipeline_ids
+
+
+def test_pipeline_parallel_forwards_to_run_pipeline(monkeypatch):
+    """pipeline-parallel only passes arguments run_pipeline accepts."""
+    import inspect
+    from click.testing import CliRunner
+    import long_context_bench.pipeline as pipeline
+    from long_context_bench.cli import main
+
+    calls = []
+    signature = inspect.signature(pipeline.run_pipeline)
+    monkeypatch.setattr(pipeline, "run_pipeline", lambda **kw: calls.append(signature.bind(**kw)))
+
+    result = CliRunner().invoke(
+        main,
+        ["pipeline-parallel", "--agents", "auggie:m1,claude-code:m2", "--judge-mode", "llm", "--judge-model", "j"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "--judge-mode is ignored" in result.output
+    assert [cfg["runner"] for cfg in calls[0].arguments["agent_configs"]] == ["auggie", "claude-code"]
+    assert calls[0].arguments["judge_model"] == "j"
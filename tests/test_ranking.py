@@ -62,6 +62,24 @@ def test_compute_win_loss_matrix_simple():
     assert matrix["agentC"]["agentB"]["ties"] == 1
 
 
+def test_compute_win_loss_matrix_accumulates_repeat_pairs():
+    """Repeated pairings add up and only pairs that met are reported."""
+
+    decisions = [
+        _make_decision("agentA", "agentB", "A"),
+        _make_decision("agentB", "agentA", "a"),
+        _make_decision("agentA", "agentB", "tie"),
+        _make_decision("agentC", "agentA", "B"),
+    ]
+
+    matrix = compute_win_loss_matrix(decisions)
+
+    assert matrix["agentA"]["agentB"] == {"wins": 1, "losses": 1, "ties": 1}
+    assert matrix["agentB"]["agentA"] == {"wins": 1, "losses": 1, "ties": 1}
+    assert matrix["agentA"]["agentC"] == {"wins": 1, "losses": 0, "ties": 0}
+    assert "agentC" not in matrix["agentB"]
+
+
 def test_compute_elo_ratings_and_rank_agents():
     """Elo ratings and ranking should agree that agentA is best."""
 
@@ -144,3 +162,19 @@ def test_compute_elo_ratings_from_scores():
     assert elo["agentA"] > elo["agentB"]
     assert elo["agentB"] > elo["agentC"]
 
+
+
+def test_compute_win_loss_matrix_from_scores_counts_repeat_decisions():
+    """Each decision of one agent meets each decision of the other."""
+
+    decisions = [
+        _make_agent_decision("agentA", 0.9),
+        _make_agent_decision("agentA", 0.9),
+        _make_agent_decision("agentB", 0.5),
+    ]
+
+    matrix = compute_win_loss_matrix_from_scores(decisions)
+
+    assert matrix["agentA"]["agentB"] == {"wins": 2, "losses": 0, "ties": 0}
+    assert matrix["agentB"]["agentA"] == {"wins": 0, "losses": 2, "ties": 0}
+    assert "agentA" not in matrix["agentA"]
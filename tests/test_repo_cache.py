@@ -0,0 +1,73 @@
+"""Tests for the shared repository cache."""
+
+from pathlib import Path
+
+import git
+import pytest
+
+from long_context_bench import repo_cache
+
+
+def _make_origin(tmp_path, monkeypatch, commits: int) -> git.Repo:
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Bench")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "bench@example.com")
+
+    origin = git.Repo.init(tmp_path / "owner" / "repo")
+    origin.git.config("uploadpack.allowFilter", "true")
+    for i in range(commits):
+        (tmp_path / "owner" / "repo" / "app.py").write_text(f"print({i})\n")
+        origin.git.add("app.py")
+        origin.git.commit("-m", f"commit {i}")
+    return origin
+
+
+def test_fetch_missing_commits_stays_shallow(tmp_path, monkeypatch):
+    """Presence checks must not lazily fetch history into the promisor mirror."""
+    origin = _make_origin(tmp_path, monkeypatch, 3)
+    head = origin.head.commit.hexsha
+
+    repo_url = f"file://{origin.working_tree_dir}"
+    with repo_cache.locked_repo_mirror(repo_url, tmp_path / "cache") as mirror:
+        assert not repo_cache._has_commit(Path(mirror.git_dir), head)
+        repo_cache.fetch_missing_commits(mirror, [head])
+        assert (Path(mirror.git_dir) / "shallow").exists()
+        assert repo_cache._has_commit(Path(mirror.git_dir), head)
+
+
+def test_base_mirror_is_separate_from_ground_truth_mirror(tmp_path, monkeypatch):
+    """Workspace mirrors have no remote and never see ground-truth head commits."""
+    origin = _make_origin(tmp_path, monkeypatch, 2)
+    base, head = origin.head.commit.parents[0].hexsha, origin.head.commit.hexsha
+    repo_url = f"file://{origin.working_tree_dir}"
+    cache_dir = tmp_path / "cache"
+
+    with repo_cache.locked_repo_mirror(repo_url, cache_dir) as mirror:
+        repo_cache.fetch_missing_commits(mirror, [base, head])
+
+    with repo_cache.locked_base_mirror(repo_url, cache_dir) as base_mirror:
+        repo_cache.fetch_base_commits(base_mirror, repo_url, [base])
+        base_path = Path(base_mirror.git_dir)
+        assert base_path != Path(mirror.git_dir)
+        assert not base_mirror.remotes
+        assert repo_cache._has_commit(base_path, base)
+        assert not repo_cache._has_commit(base_path, head)
+
+
+@pytest.mark.skipif(repo_cache.fcntl is None, reason="file locks need fcntl")
+def test_mirror_lock_excludes_other_processes(tmp_path):
+    """While a mirror is held, its lock file cannot be taken by another open file."""
+    fcntl = repo_cache.fcntl
+    repo_url = "https://github.com/elastic/elasticsearch"
+    lock_path = f"{repo_cache._mirror_path(tmp_path, repo_url)}.lock"
+
+    with repo_cache.locked_repo_mirror(repo_url, tmp_path):
+        # flock locks belong to the open file description, so a second open
+        # stands in for another process
+        with open(lock_path, "a") as other:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    with open(lock_path, "a") as other:
+        fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
@@ -0,0 +1,68 @@
+"""Tests for sample stage."""
+
+from long_context_bench.stages import sample as sample_stage
+
+
+class _FakeSession:
+    def __init__(self, post):
+        self.post = post
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def test_fetch_pr_metadata_batch_groups_by_repo(monkeypatch):
+    """Test that batched GraphQL metadata is mapped to the REST-shaped fields."""
+    calls = []
+
+    def fake_post(url, json):
+        calls.append(json)
+        return _FakeResponse({
+            "data": {
+                "repository": {
+                    "pr1": {
+                        "title": "Fix bug",
+                        "body": None,
+                        "baseRefOid": "base1",
+                        "headRefOid": "head1",
+                        "baseRepository": {"url": "https://github.com/elastic/elasticsearch"},
+                    },
+                    "pr2": None,  # e.g. PR not found
+                    "pr3": {
+                        "title": "Orphaned",
+                        "body": "",
+                        "baseRefOid": "base3",
+                        "headRefOid": "head3",
+                        "baseRepository": None,  # e.g. source repo deleted
+                    },
+                }
+            }
+        })
+
+    monkeypatch.setattr(sample_stage, "_github_session", lambda token: _FakeSession(fake_post))
+
+    metadata = sample_stage.fetch_pr_metadata_batch(
+        [
+            ("elastic", "elasticsearch", 1),
+            ("elastic", "elasticsearch", 2),
+            ("elastic", "elasticsearch", 3),
+        ],
+        "token",
+    )
+
+    assert len(calls) == 1
+    assert calls[0]["variables"] == {"owner": "elastic", "name": "elasticsearch"}
+    assert list(metadata) == [("elastic", "elasticsearch", 1)]
+    pr = metadata[("elastic", "elasticsearch", 1)]
+    assert pr["base"]["sha"] == "base1"
+    assert pr["head"]["sha"] == "head1"
+    assert pr["base"]["repo"]["clone_url"] == "https://github.com/elastic/elasticsearch.git"
+    assert "Fix bug" in sample_stage.create_task_instructions(pr)
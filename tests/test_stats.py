@@ -0,0 +1,182 @@
+"""Tests for statistics and reporting."""
+
+import json
+import statistics
+from pathlib import Path
+
+import pytest
+
+from long_context_bench.models import Edit, EditLite, Judge, JudgeLite, Sample, SampleStats, Scores
+from long_context_bench.stats import (
+    _iter_named_files,
+    compute_aggregate_summary,
+    generate_index_manifest,
+    load_results_from_dir,
+)
+
+
+def _sample(pr_number: int) -> Sample:
+    return Sample(
+        dataset_version="v0",
+        repo_url="https://github.com/elastic/elasticsearch",
+        pr_number=pr_number,
+        base_commit="abc",
+        head_commit="def",
+        task_instructions="Do the thing",
+        stats=SampleStats(
+            files_changed=1,
+            lines_added=1,
+            lines_deleted=0,
+            total_diff_hunks=1,
+            context_size_bytes=100,
+            truncated=False,
+        ),
+    )
+
+
+def _edit(pr_number: int, status: str, elapsed_ms: int) -> Edit:
+    return Edit(
+        repo_url="https://github.com/elastic/elasticsearch",
+        pr_number=pr_number,
+        base_commit="abc",
+        runner="auggie",
+        model="sonnet",
+        timeout_s=1800,
+        status=status,
+        elapsed_ms=elapsed_ms,
+        patch_unified="",
+        logs_path="logs.jsonl",
+        edit_run_id="run1",
+    )
+
+
+def _judge(pr_number: int, values: tuple[float, float, float, float, float]) -> Judge:
+    scores = Scores(
+        correctness=values[0],
+        completeness=values[1],
+        code_reuse=values[2],
+        best_practices=values[3],
+        unsolicited_docs=values[4],
+    )
+    return Judge(
+        repo_url="https://github.com/elastic/elasticsearch",
+        pr_number=pr_number,
+        base_commit="abc",
+        head_commit="def",
+        scores=scores,
+        aggregate=sum(values) / 5.0,
+    )
+
+
+def test_compute_aggregate_summary_matches_statistics():
+    """Test that vectorized means/stdev match the statistics module."""
+    score_rows = [
+        (0.5, 0.2, -0.1, 0.0, 1.0),
+        (-0.5, -0.3, 0.4, 0.1, 0.0),
+        (0.9, 0.8, 0.7, 0.6, 0.5),
+    ]
+    samples = [_sample(i) for i in range(4)]
+    edits = [
+        _edit(0, "success", 1000),
+        _edit(1, "error", 3000),
+        _edit(2, "success", 2000),
+    ]
+    judges = [_judge(i, row) for i, row in enumerate(score_rows)]
+
+    summary = compute_aggregate_summary("run", samples, edits, judges)
+
+    aggregates = [j.aggregate for j in judges]
+    assert summary.mean_correctness == pytest.approx(statistics.mean(r[0] for r in score_rows))
+    assert summary.mean_unsolicited_docs == pytest.approx(statistics.mean(r[4] for r in score_rows))
+    assert summary.mean_aggregate == pytest.approx(statistics.mean(aggregates))
+    assert summary.std_aggregate == pytest.approx(statistics.stdev(aggregates))
+    assert summary.win_rate == pytest.approx(2 / 3)
+    assert summary.mean_elapsed_ms == pytest.approx(2000.0)
+    assert summary.successful_samples == 2
+    assert summary.failed_samples == 1
+    assert summary.skipped_samples == 1
+    assert summary.runner == "auggie"
+
+
+def test_compute_aggregate_summary_empty():
+    """Test that an empty run produces zeroed metrics."""
+    summary = compute_aggregate_summary("run", [], [], [])
+
+    assert summary.mean_aggregate == 0.0
+    assert summary.std_aggregate == 0.0
+    assert summary.win_rate == 0.0
+    assert summary.tasks_per_hour == 0.0
+
+
+def test_iter_named_files_matches_exact_name_recursively(tmp_path):
+    """Only files with the exact name are found, at any depth."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "judge.json").write_text("{}")
+    (tmp_path / "a" / "b" / "judge.json").write_text("{}")
+    (tmp_path / "a" / "b" / "judge.json.tmp").write_text("{}")
+    (tmp_path / "judge_run_manifest.json").write_text("{}")
+
+    found = sorted(_iter_named_files(tmp_path, "judge.json"))
+
+    assert found == [str(tmp_path / "a" / "b" / "judge.json"), str(tmp_path / "a" / "judge.json")]
+
+
+def test_load_results_from_dir_reads_all_artifacts(tmp_path):
+    """Samples, edits and judges are loaded from their nested directories."""
+    for pr_number in range(3):
+        sample_dir = tmp_path / "samples" / "v0" / f"pr{pr_number}"
+        sample_dir.mkdir(parents=True)
+        (sample_dir / "sample.json").write_text(_sample(pr_number).model_dump_json())
+        edit_dir = tmp_path / "edits" / "auggie" / "sonnet" / "run1" / f"pr{pr_number}"
+        edit_dir.mkdir(parents=True)
+        (edit_dir / "edit.json").write_text(_edit(pr_number, "success", 1000).model_dump_json())
+
+    samples, edits, judges = load_results_from_dir(tmp_path)
+
+    assert sorted(s.pr_number for s in samples) == [0, 1, 2]
+    assert sorted(e.pr_number for e in edits) == [0, 1, 2]
+    assert judges == []
+
+
+def test_load_results_from_dir_lite_skips_heavy_fields(tmp_path):
+    """Lite loading keeps the summary fields and drops patches."""
+    edit = _edit(0, "success", 1000).model_copy(update={"patch_unified": "diff --git a/x b/x"})
+    judge = _judge(0, (1.0, 0.5, 0.0, 0.5, 1.0))
+    edit_dir = tmp_path / "edits" / "auggie" / "sonnet" / "run1" / "pr0"
+    edit_dir.mkdir(parents=True)
+    (edit_dir / "edit.json").write_text(edit.model_dump_json())
+    judge_dir = tmp_path / "judges" / "llm" / "run1" / "pr0"
+    judge_dir.mkdir(parents=True)
+    (judge_dir / "judge.json").write_text(judge.model_dump_json())
+
+    _, edits, judges = load_results_from_dir(tmp_path, lite=True)
+
+    assert isinstance(edits[0], EditLite)
+    assert not hasattr(edits[0], "patch_unified")
+    assert isinstance(judges[0], JudgeLite)
+    assert judges[0].aggregate == judge.aggregate
+    assert compute_aggregate_summary("run", [], edits, judges) == compute_aggregate_summary(
+        "run", [], [edit], [judge]
+    )
+
+
+def test_generate_index_manifest_lists_runs(tmp_path):
+    """Each summaries/<run>/summary.json appears as a run in index.json."""
+    run_dir = tmp_path / "summaries" / "run1"
+    run_dir.mkdir(parents=True)
+    (run_dir / "summary.json").write_text(json.dumps({
+        "run_id": "run1",
+        "runner": "auggie",
+        "model": "sonnet",
+        "total_samples": 3,
+    }))
+    edit_dir = tmp_path / "edits" / "auggie" / "sonnet" / "run1" / "pr1"
+    edit_dir.mkdir(parents=True)
+    (edit_dir / "edit.json").write_text("{}")
+
+    generate_index_manifest(tmp_path)
+
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert [run["run_id"] for run in index["runs"]] == ["run1"]
+    assert index["runs"][0]["summary_path"] == str(Path("summaries") / "run1" / "summary.json")
+    assert index["runs"][0]["pr_ids"] == ["pr1"]